@@ -3,10 +3,10 @@ Renault/Dacia kod tespit modülü
 """
 
 from .pipeline import VisionPipeline, DetectionResult
-from .lexicon import RenaultDaciaLexicon, CodeInfo
+from .lexicon import RenaultDaciaLexicon, CodeInfo, CodeOccurrence
 from .preprocess import ImagePreprocessor
 from .detector import ROIDetector, BoundingBox
-from .ocr import OCRManager, OCRResult, TesseractOCR, PaddleOCR
+from .ocr import OCRManager, OCRResult, CharData, TesseractOCR, TesseractAPIOCR, PaddleOCR
 
 __version__ = "1.0.0"
 __author__ = "Renault/Dacia Vision Team"
@@ -16,12 +16,15 @@ __all__ = [
     'DetectionResult', 
     'RenaultDaciaLexicon',
     'CodeInfo',
+    'CodeOccurrence',
     'ImagePreprocessor',
     'ROIDetector',
     'BoundingBox',
     'OCRManager',
     'OCRResult',
+    'CharData',
     'TesseractOCR',
+    'TesseractAPIOCR',
     'PaddleOCR'
 ]
 
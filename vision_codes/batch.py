@@ -0,0 +1,139 @@
+"""
+Toplu işleme modülü - dizin, glob ve dosya listesi üzerinden çok süreçli tarama
+"""
+import glob
+import multiprocessing
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import cv2
+
+from .pipeline import VisionPipeline, DetectionResult
+
+
+# Toplu modda taranan görüntü uzantıları
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff', '.webp')
+
+
+@dataclass
+class BatchItem:
+    """Tek bir görüntünün toplu işleme sonucu"""
+    path: str
+    results: List[DetectionResult] = field(default_factory=list)
+    error: Optional[str] = None
+    elapsed: float = 0.0  # saniye
+
+
+def _is_image(path: str) -> bool:
+    return path.lower().endswith(IMAGE_EXTENSIONS)
+
+
+def collect_image_paths(inputs: Iterable[str], file_list: Optional[str] = None,
+                        recursive: bool = False) -> List[str]:
+    """Dizin, glob ve dosya listesinden görüntü yollarını topla
+
+    Sıra korunur ve aynı dosya birden fazla kez eklenmez.
+    """
+    sources = list(inputs)
+    if file_list:
+        with open(file_list, 'r', encoding='utf-8') as f:
+            sources.extend(line.strip() for line in f if line.strip() and not line.startswith('#'))
+
+    paths = []
+    seen = set()
+
+    def add(path: str):
+        if path not in seen:
+            seen.add(path)
+            paths.append(path)
+
+    for source in sources:
+        if os.path.isdir(source):
+            pattern = '**/*' if recursive else '*'
+            for path in sorted(glob.glob(os.path.join(source, pattern), recursive=recursive)):
+                if os.path.isfile(path) and _is_image(path):
+                    add(path)
+        elif glob.has_magic(source):
+            for path in sorted(glob.glob(source, recursive=True)):
+                if os.path.isfile(path) and _is_image(path):
+                    add(path)
+        else:
+            # Açıkça verilen dosyalar uzantıdan bağımsız olarak eklenir
+            add(source)
+
+    return paths
+
+
+def build_pipeline(pipeline_kwargs: Optional[Dict[str, Any]] = None,
+                   pipeline_params: Optional[Dict[str, Any]] = None) -> VisionPipeline:
+    """Pipeline'ı oluştur ve parametrelerini ayarla"""
+    pipeline = VisionPipeline(**(pipeline_kwargs or {}))
+    for name, value in (pipeline_params or {}).items():
+        setattr(pipeline, name, value)
+    return pipeline
+
+
+# Worker süreç başına tek pipeline (Pool initializer ile kurulur)
+_worker_pipeline: Optional[VisionPipeline] = None
+
+
+def _init_worker(pipeline_kwargs: Dict[str, Any], pipeline_params: Dict[str, Any]):
+    """Worker süreci başlat - pipeline bir kez oluşturulur"""
+    global _worker_pipeline
+
+    # Süreçler zaten çekirdeklere dağıtıldığı için iç iş parçacıklarını sınırla
+    os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+    cv2.setNumThreads(1)
+
+    _worker_pipeline = build_pipeline(pipeline_kwargs, pipeline_params)
+
+
+def _process_path(path: str) -> BatchItem:
+    """Tek bir görüntüyü worker pipeline'ı ile işle"""
+    return _run_pipeline(_worker_pipeline, path)
+
+
+def _run_pipeline(pipeline: VisionPipeline, path: str) -> BatchItem:
+    """Görüntüyü yükle ve pipeline'dan geçir"""
+    start = time.perf_counter()
+
+    image = cv2.imread(path)
+    if image is None:
+        return BatchItem(path=path, error='Görüntü yüklenemedi',
+                         elapsed=time.perf_counter() - start)
+
+    try:
+        results = pipeline.process_image(image)
+    except Exception as e:
+        return BatchItem(path=path, error=str(e), elapsed=time.perf_counter() - start)
+
+    return BatchItem(path=path, results=results, elapsed=time.perf_counter() - start)
+
+
+def process_batch(paths: List[str], pipeline_kwargs: Optional[Dict[str, Any]] = None,
+                  pipeline_params: Optional[Dict[str, Any]] = None,
+                  workers: Optional[int] = None, chunksize: int = 1) -> Iterator[BatchItem]:
+    """Görüntüleri süreç havuzunda işle
+
+    Sonuçlar tamamlandıkça (giriş sırasından bağımsız) üretilir.
+    workers=1 ise havuz kurulmadan aynı süreçte çalışır.
+    """
+    pipeline_kwargs = pipeline_kwargs or {}
+    pipeline_params = pipeline_params or {}
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(paths) or 1))
+
+    if workers == 1:
+        pipeline = build_pipeline(pipeline_kwargs, pipeline_params)
+        for path in paths:
+            yield _run_pipeline(pipeline, path)
+        return
+
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(pipeline_kwargs, pipeline_params)) as pool:
+        for item in pool.imap_unordered(_process_path, paths, chunksize=chunksize):
+            yield item
@@ -0,0 +1,148 @@
+"""
+Mikro-toplu işleme modülü - eşzamanlı istekleri kısa süre biriktirip tek seferde işler
+"""
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+
+class MicroBatcher:
+    """İş parçacıklı istek kuyruğu
+
+    En fazla max_batch_size istek birikene ya da ilk istekten itibaren
+    max_wait_ms geçene kadar bekler, ardından toplanan istekleri
+    process_batch ile birlikte işler ve her çağıranın Future'ını çözer.
+    process_batch giriş listesiyle aynı uzunlukta ve sırada sonuç döndürmelidir.
+    """
+
+    def __init__(self, process_batch: Callable[[List[Any]], List[Any]],
+                 max_batch_size: int = 8, max_wait_ms: float = 10.0,
+                 max_queue_size: int = 0, name: str = 'micro-batcher'):
+        self.process_batch = process_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000.0
+        self.name = name
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._stats_lock = threading.Lock()
+
+        # Metrikler
+        self.batches = 0
+        self.items = 0
+        self.last_batch_size = 0
+        self.batch_sizes: Counter = Counter()
+        self.total_wait = 0.0
+        self.total_process_time = 0.0
+
+    def start(self) -> 'MicroBatcher':
+        """Arka plan iş parçacığını başlat"""
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        """Kuyruktaki işler bittikten sonra iş parçacığını durdur"""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._queue.put(None)  # bekleyen get() çağrısını uyandır
+        self._thread.join(timeout)
+        self._thread = None
+
+    def submit(self, item: Any) -> Future:
+        """İsteği kuyruğa ekle"""
+        if self._thread is None:
+            raise RuntimeError('MicroBatcher başlatılmadı')
+
+        future: Future = Future()
+        self._queue.put((item, future, time.monotonic()))
+        return future
+
+    def stats(self) -> Dict[str, Any]:
+        """Kuyruk derinliği ve toplu işleme metrikleri"""
+        with self._stats_lock:
+            return {
+                'queue_depth': self._queue.qsize(),
+                'batches': self.batches,
+                'items': self.items,
+                'last_batch_size': self.last_batch_size,
+                'avg_batch_size': self.items / self.batches if self.batches else 0.0,
+                'batch_size_histogram': dict(sorted(self.batch_sizes.items())),
+                'avg_wait_ms': 1000 * self.total_wait / self.items if self.items else 0.0,
+                'avg_batch_ms': 1000 * self.total_process_time / self.batches if self.batches else 0.0,
+                'max_batch_size': self.max_batch_size,
+                'max_wait_ms': self.max_wait * 1000,
+            }
+
+    def _collect(self) -> List[tuple]:
+        """İlk isteği bekle, ardından süre veya boyut sınırına kadar topla
+
+        Durdurma işareti toplama sırasında tüketilmiş olabileceğinden durdurulurken
+        kuyruk boşsa beklenmez.
+        """
+        if self._stopping.is_set():
+            try:
+                first = self._queue.get_nowait()
+            except queue.Empty:
+                return []
+        else:
+            first = self._queue.get()
+        if first is None:
+            return []
+
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                entry = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if entry is None:
+                break
+            batch.append(entry)
+
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if not batch:
+                if self._stopping.is_set() and self._queue.empty():
+                    return
+                continue
+
+            # İptal edilmiş istekleri atla
+            batch = [entry for entry in batch if entry[1].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            started = time.monotonic()
+            try:
+                results = self.process_batch([item for item, _, _ in batch])
+                if len(results) != len(batch):
+                    raise RuntimeError('process_batch sonuç sayısı giriş sayısıyla uyuşmuyor')
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+            else:
+                for (_, future, _), result in zip(batch, results):
+                    future.set_result(result)
+            finished = time.monotonic()
+
+            with self._stats_lock:
+                self.batches += 1
+                self.items += len(batch)
+                self.last_batch_size = len(batch)
+                self.batch_sizes[len(batch)] += 1
+                self.total_wait += sum(started - enqueued for _, _, enqueued in batch)
+                self.total_process_time += finished - started
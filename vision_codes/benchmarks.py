@@ -0,0 +1,168 @@
+"""
+Performans ölçümleri - ön işleme aşamalarının eski ve yeni uygulamalarını karşılaştırır
+
+Kullanım:
+    python -m vision_codes.benchmarks
+    python -m vision_codes.benchmarks threshold --sizes 720p 4K --repeat 10
+"""
+import argparse
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .preprocess import ImagePreprocessor
+
+
+# Ölçülen görüntü boyutları (yükseklik, genişlik)
+SIZES: Dict[str, Tuple[int, int]] = {
+    '720p': (720, 1280),
+    '4K': (2160, 3840),
+}
+
+
+def make_document_image(shape: Tuple[int, int], seed: int = 0, noise: int = 25) -> np.ndarray:
+    """Eğimli aydınlatmalı, gürültülü (0-noise) metin satırlarından oluşan gri test görüntüsü"""
+    height, width = shape
+    rng = np.random.default_rng(seed)
+
+    # Soldan sağa kararan zemin
+    image = np.tile(np.linspace(210, 150, width, dtype=np.float32), (height, 1)).astype(np.uint8)
+
+    scale = height / 720
+    line_height = max(int(40 * scale), 12)
+    for y in range(line_height, height, line_height * 2):
+        cv2.putText(image, 'VF1RJA00012345678 RJA UU1', (int(20 * scale), y),
+                    cv2.FONT_HERSHEY_SIMPLEX, 1.2 * scale, 40, max(int(2 * scale), 1))
+
+    if not noise:
+        return image
+    return cv2.add(image, rng.integers(0, noise, image.shape, dtype=np.uint8))
+
+
+def time_function(func: Callable[[], object], repeat: int = 5) -> float:
+    """Fonksiyonun ortanca çalışma süresi (ms); ilk çağrı ısınma içindir"""
+    func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return float(np.median(timings))
+
+
+def benchmark_threshold(sizes: Optional[Dict[str, Tuple[int, int]]] = None,
+                        window_sizes: Tuple[int, ...] = (15, 31, 61),
+                        repeat: int = 5) -> List[Dict[str, object]]:
+    """Gauss pencereli Sauvola ile kutu pencereli Sauvola'yı karşılaştır"""
+    preprocessor = ImagePreprocessor()
+    rows = []
+    for name, shape in (sizes or SIZES).items():
+        image = make_document_image(shape)
+        out = np.empty(shape, dtype=np.uint8)
+        for window_size in window_sizes:
+            baseline = time_function(
+                lambda: preprocessor._sauvola_threshold(image, window_size=window_size), repeat)
+            candidate = time_function(
+                lambda: preprocessor._sauvola_threshold_box(image, out, window_size=window_size), repeat)
+            rows.append({
+                'benchmark': 'threshold',
+                'size': name,
+                'variant': f'window={window_size}',
+                'baseline_ms': baseline,
+                'candidate_ms': candidate,
+                'speedup': baseline / candidate if candidate else float('inf'),
+            })
+    return rows
+
+
+def benchmark_deskew(sizes: Optional[Dict[str, Tuple[int, int]]] = None,
+                     angle: float = 4.0, repeat: int = 5) -> List[Dict[str, object]]:
+    """Tam çözünürlükte Hough eğim tahmini ile küçültülmüş izdüşüm profilini karşılaştır"""
+    preprocessor = ImagePreprocessor()
+    rows = []
+    for name, shape in (sizes or SIZES).items():
+        height, width = shape
+        matrix = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1.0)
+        image = cv2.warpAffine(make_document_image(shape), matrix, (width, height),
+                               borderMode=cv2.BORDER_REPLICATE)
+        baseline = time_function(lambda: preprocessor.estimate_skew(image, 'hough'), repeat)
+        for max_size in (256, 512):
+            candidate = time_function(
+                lambda: preprocessor.estimate_skew(image, 'projection', max_size=max_size), repeat)
+            rows.append({
+                'benchmark': 'deskew',
+                'size': name,
+                'variant': f'max_size={max_size}',
+                'baseline_ms': baseline,
+                'candidate_ms': candidate,
+                'speedup': baseline / candidate if candidate else float('inf'),
+            })
+    return rows
+
+
+def benchmark_adaptive(sizes: Optional[Dict[str, Tuple[int, int]]] = None,
+                       repeat: int = 5) -> List[Dict[str, object]]:
+    """Tam ön işleme zinciri ile uyarlanır ön işlemeyi temiz ve gürültülü görüntülerde karşılaştır"""
+    preprocessor = ImagePreprocessor()
+    rows = []
+    for name, shape in (sizes or SIZES).items():
+        for variant, noise in (('clean', 0), ('noisy', 25)):
+            image = make_document_image(shape, noise=noise)
+            out = np.empty(shape, dtype=np.uint8)
+            baseline = time_function(lambda: preprocessor.preprocess_for_ocr(image), repeat)
+            candidate = time_function(lambda: preprocessor.preprocess_for_ocr_adaptive(image, out), repeat)
+            rows.append({
+                'benchmark': 'adaptive',
+                'size': name,
+                'variant': variant,
+                'baseline_ms': baseline,
+                'candidate_ms': candidate,
+                'speedup': baseline / candidate if candidate else float('inf'),
+            })
+    return rows
+
+
+# Ad -> ölçüm fonksiyonu
+BENCHMARKS: Dict[str, Callable[..., List[Dict[str, object]]]] = {
+    'threshold': benchmark_threshold,
+    'deskew': benchmark_deskew,
+    'adaptive': benchmark_adaptive,
+}
+
+
+def format_rows(rows: List[Dict[str, object]]) -> str:
+    """Sonuçları tablo olarak biçimlendir"""
+    lines = [f"{'ölçüm':<12}{'boyut':<8}{'değişken':<16}{'eski (ms)':>12}{'yeni (ms)':>12}{'hızlanma':>10}"]
+    for row in rows:
+        lines.append(f"{row['benchmark']:<12}{row['size']:<8}{row['variant']:<16}"
+                     f"{row['baseline_ms']:>12.2f}{row['candidate_ms']:>12.2f}{row['speedup']:>9.1f}x")
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ana fonksiyon"""
+    parser = argparse.ArgumentParser(description='Ön işleme performans ölçümleri')
+    parser.add_argument('benchmarks', nargs='*',
+                        help=f"Çalıştırılacak ölçümler: {', '.join(BENCHMARKS)} (varsayılan: tümü)")
+    parser.add_argument('--sizes', nargs='+', choices=list(SIZES), default=list(SIZES),
+                        help='Görüntü boyutları')
+    parser.add_argument('--repeat', type=int, default=5, help='Tekrar sayısı')
+    args = parser.parse_args(argv)
+    for name in args.benchmarks:
+        if name not in BENCHMARKS:
+            parser.error(f"Bilinmeyen ölçüm: {name}")
+
+    sizes = {name: SIZES[name] for name in args.sizes}
+    rows = []
+    for name in args.benchmarks or list(BENCHMARKS):
+        rows.extend(BENCHMARKS[name](sizes=sizes, repeat=args.repeat))
+
+    print(format_rows(rows))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Sonuç önbelleği modülü - görüntü içeriği hash'i ile LRU/TTL önbellek
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class ResultCache:
+    """Bellek içi LRU + TTL önbellek, isteğe bağlı disk katmanı
+
+    Anahtarlar çözülmüş görüntü baytlarının ve pipeline ayarlarının hash'idir;
+    değerler JSON'a çevrilebilir olmalıdır.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 600.0,
+                 disk_dir: Optional[str] = None, disk_ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.disk_dir = disk_dir
+        self.disk_ttl = ttl if disk_ttl is None else disk_ttl
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # İstatistikler
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    @classmethod
+    def from_env(cls, prefix: str = 'OCR_CACHE') -> 'ResultCache':
+        """Ortam değişkenlerinden önbellek oluştur
+
+        {prefix}_SIZE: bellek katmanı kapasitesi (0 önbelleği kapatır)
+        {prefix}_TTL: saniye cinsinden yaşam süresi
+        {prefix}_DIR: disk katmanı dizini (opsiyonel)
+        """
+        return cls(
+            max_entries=int(os.environ.get(f'{prefix}_SIZE', 1024)),
+            ttl=float(os.environ.get(f'{prefix}_TTL', 600)),
+            disk_dir=os.environ.get(f'{prefix}_DIR') or None,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 or bool(self.disk_dir)
+
+    @staticmethod
+    def make_key(image_bytes: bytes, settings: Optional[Dict[str, Any]] = None) -> str:
+        """Görüntü baytları ve ayarlardan önbellek anahtarı üret"""
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(image_bytes)
+        digest.update(json.dumps(settings or {}, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Önbellekten değer al (yoksa veya süresi dolmuşsa None)"""
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+        value = self._disk_get(key)
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._memory_put(key, value, now)
+
+        return value
+
+    def put(self, key: str, value: Any):
+        """Değeri önbelleğe yaz"""
+        with self._lock:
+            self._memory_put(key, value, time.monotonic())
+        self._disk_put(key, value)
+
+    def clear(self):
+        """Bellek katmanını temizle"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Önbellek istatistikleri"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+            }
+
+    def _memory_put(self, key: str, value: Any, now: float):
+        if self.max_entries <= 0:
+            return
+
+        self._entries[key] = (now + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        # Kapasite aşılırsa en uzun süredir kullanılmayanı at
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key[:2], f"{key}.json")
+
+    def _disk_get(self, key: str) -> Optional[Any]:
+        if not self.disk_dir:
+            return None
+
+        path = self._disk_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - record.get('created', 0) > self.disk_ttl:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+        return record.get('value')
+
+    def _disk_put(self, key: str, value: Any):
+        if not self.disk_dir:
+            return
+
+        path = self._disk_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Yarım yazılmış dosya okunmasın diye geçici dosyaya yazıp taşı
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'created': time.time(), 'value': value}, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Önbellek disk yazma hatası: {e}")
@@ -0,0 +1,76 @@
+"""
+Kare değişim tespiti modülü - durağan sahnelerde pipeline'ı atlamak için ucuz ön kontrol
+"""
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+class FrameChangeGate:
+    """Küçültülmüş gri kare farkıyla değişim kontrolü
+
+    Kare, son işlenen anahtar kareyle karşılaştırılır (bir önceki kareyle
+    değil); böylece yavaş biriken değişimler de sonunda eşiği aşar.
+    Skor 0-1 aralığında ortalama mutlak piksel farkıdır.
+    """
+
+    def __init__(self, threshold: float = 0.02, size: Tuple[int, int] = (64, 36),
+                 blur: bool = True):
+        self.threshold = threshold
+        self.size = size
+        self.blur = blur
+
+        self._keyframe: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+        # İstatistikler
+        self.checks = 0
+        self.skipped = 0
+        self.last_score = 0.0
+
+    def signature(self, image: np.ndarray) -> np.ndarray:
+        """Karşılaştırma için küçük gri kare üret"""
+        if image.ndim == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        small = cv2.resize(image, self.size, interpolation=cv2.INTER_AREA)
+        if self.blur:
+            # Sensör gürültüsünü bastır
+            small = cv2.GaussianBlur(small, (3, 3), 0)
+        return small
+
+    def score(self, signature: np.ndarray) -> float:
+        """Anahtar kareye göre değişim skoru (anahtar kare yoksa 1.0)"""
+        if self._keyframe is None or self._keyframe.shape != signature.shape:
+            return 1.0
+        return float(cv2.absdiff(signature, self._keyframe).mean()) / 255.0
+
+    def changed(self, image: np.ndarray) -> bool:
+        """Kare anlamlı ölçüde değiştiyse True döndür ve anahtar kareyi güncelle"""
+        signature = self.signature(image)
+
+        with self._lock:
+            self.checks += 1
+            self.last_score = self.score(signature)
+            if self.last_score < self.threshold:
+                self.skipped += 1
+                return False
+            self._keyframe = signature
+            return True
+
+    def reset(self):
+        """Anahtar kareyi unut (sonraki kare her zaman işlenir)"""
+        with self._lock:
+            self._keyframe = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Değişim kontrolü istatistikleri"""
+        with self._lock:
+            return {
+                'checks': self.checks,
+                'skipped': self.skipped,
+                'processed': self.checks - self.skipped,
+                'last_score': self.last_score,
+                'threshold': self.threshold,
+            }
@@ -6,23 +6,83 @@ import cv2
 import numpy as np
 from pathlib import Path
 import json
-from typing import List
+import sys
+import time
+from typing import List, Optional
 
 from .pipeline import VisionPipeline, DetectionResult
+from .batch import collect_image_paths, process_batch
+from .stream import FrameReader, process_stream, stream_detection_to_dict
 
 
-def main():
-    """Ana fonksiyon"""
-    parser = argparse.ArgumentParser(description='Renault/Dacia kod tespit aracı')
-    parser.add_argument('input', help='Giriş görüntü dosyası')
-    parser.add_argument('-o', '--output', help='Çıkış dosyası (opsiyonel)')
-    parser.add_argument('--ocr', choices=['tesseract', 'paddle'], default='tesseract',
+def add_pipeline_arguments(parser: argparse.ArgumentParser):
+    """Pipeline ile ilgili ortak argümanları ekle"""
+    parser.add_argument('--ocr', choices=['tesseract', 'tesseract_api', 'paddle'], default='tesseract',
                        help='OCR motoru seçimi')
     parser.add_argument('--tesseract-path', help='Tesseract yolu (Windows için)')
     parser.add_argument('--confidence', type=float, default=0.7,
                        help='Minimum güven skoru (0.0-1.0)')
     parser.add_argument('--fuzzy-threshold', type=float, default=0.8,
                        help='Fuzzy eşleşme eşiği (0.0-1.0)')
+    parser.add_argument('--roi-workers', type=int, default=0,
+                       help='ROI\'leri eşzamanlı işleyen iş parçacığı sayısı (0: sıralı)')
+    parser.add_argument('--ocr-batch', action='store_true',
+                       help='Tüm ROI\'leri tek toplu OCR çağrısıyla tanı')
+    parser.add_argument('--lexicon', help='Sözlük dosyası (.vclx, .csv veya .json)')
+    parser.add_argument('--fuzzy-index', choices=['matrix', 'bktree'], default='matrix',
+                       help='Bulanık eşleşme indeksi (bktree: on binlerce kodluk sözlükler için)')
+    parser.add_argument('--max-results', type=int, default=None,
+                       help='Bu kadar doğrulanmış VIN bulununca kalan ROI\'leri atla (erken çıkış)')
+    parser.add_argument('--stop-confidence', type=float, default=None,
+                       help='Erken çıkışta sayılacak en düşük güven (varsayılan: --confidence)')
+    parser.add_argument('--preprocess', choices=['full', 'fast', 'adaptive', 'variants'], default='full',
+                       help='ROI ön işleme modu (fast: gri tonlamada birleşik, tampon bellekli, '
+                            'adaptive: yalnızca gereken aşamalar, variants: birden çok varyant)')
+    parser.add_argument('--deskew', choices=['roi', 'fast', 'frame'], default='roi',
+                       help='Eğim düzeltme (roi: ROI başına Hough, fast: ROI başına izdüşüm, '
+                            'frame: karede bir kez)')
+    parser.add_argument('--ocr-profiles', action='store_true',
+                       help='ROI geometrisine göre OCR profili seç (varsayılan: her ROI --psm 6)')
+
+
+def pipeline_options(args: argparse.Namespace):
+    """Argümanlardan pipeline kurucu argümanlarını ve parametrelerini çıkar"""
+    kwargs = {
+        'ocr_type': args.ocr,
+        'tesseract_path': args.tesseract_path,
+        'roi_workers': args.roi_workers,
+        'ocr_batch': args.ocr_batch,
+        'lexicon_path': args.lexicon,
+        'fuzzy_index': args.fuzzy_index,
+        'ocr_profiles': args.ocr_profiles,
+        'preprocess_mode': args.preprocess,
+        'deskew_mode': args.deskew,
+    }
+    params = {
+        'min_confidence': args.confidence,
+        'fuzzy_threshold': args.fuzzy_threshold,
+        'max_results': args.max_results,
+        'stop_on_confidence': args.stop_confidence,
+    }
+    return kwargs, params
+
+
+def main(argv: Optional[List[str]] = None):
+    """Ana fonksiyon"""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == 'batch':
+        return batch_main(argv[1:])
+    if argv and argv[0] == 'stream':
+        return stream_main(argv[1:])
+
+    parser = argparse.ArgumentParser(
+        description='Renault/Dacia kod tespit aracı',
+        epilog='Toplu işleme için: python -m vision_codes.cli batch --help, '
+               'video/akış için: python -m vision_codes.cli stream --help'
+    )
+    parser.add_argument('input', help='Giriş görüntü dosyası')
+    parser.add_argument('-o', '--output', help='Çıkış dosyası (opsiyonel)')
+    add_pipeline_arguments(parser)
     parser.add_argument('--visualize', action='store_true',
                        help='Sonuçları görselleştir')
     parser.add_argument('--json', action='store_true',
@@ -30,17 +90,15 @@ def main():
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Detaylı çıktı')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Pipeline'ı oluştur
-    pipeline = VisionPipeline(
-        ocr_type=args.ocr,
-        tesseract_path=args.tesseract_path
-    )
+    kwargs, params = pipeline_options(args)
+    pipeline = VisionPipeline(**kwargs)
     
     # Parametreleri ayarla
-    pipeline.min_confidence = args.confidence
-    pipeline.fuzzy_threshold = args.fuzzy_threshold
+    for name, value in params.items():
+        setattr(pipeline, name, value)
     
     # Görüntüyü yükle
     image = cv2.imread(args.input)
@@ -79,6 +137,136 @@ def main():
     return 0
 
 
+def batch_main(argv: List[str]) -> int:
+    """Toplu işleme: her görüntü için bir JSON satırı (JSONL) üretir"""
+    parser = argparse.ArgumentParser(
+        prog='python -m vision_codes.cli batch',
+        description='Dizin, glob veya dosya listesindeki görüntüleri paralel işle'
+    )
+    parser.add_argument('inputs', nargs='*', help='Görüntü dosyaları, dizinler veya glob desenleri')
+    parser.add_argument('--file-list', help='Her satırında bir yol bulunan dosya')
+    parser.add_argument('-r', '--recursive', action='store_true',
+                       help='Dizinleri alt dizinleriyle birlikte tara')
+    parser.add_argument('-o', '--output', help='JSONL çıkış dosyası (varsayılan: stdout)')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                       help='Worker süreç sayısı (varsayılan: çekirdek sayısı)')
+    parser.add_argument('--chunksize', type=int, default=4,
+                       help='Worker başına tek seferde gönderilen görüntü sayısı')
+    add_pipeline_arguments(parser)
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='İlerleme bilgisini stderr\'e yaz')
+
+    args = parser.parse_args(argv)
+
+    paths = collect_image_paths(args.inputs, args.file_list, args.recursive)
+    if not paths:
+        print("Hata: İşlenecek görüntü bulunamadı", file=sys.stderr)
+        return 1
+
+    kwargs, params = pipeline_options(args)
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+
+    start = time.perf_counter()
+    failed = 0
+    try:
+        for done, item in enumerate(process_batch(paths, kwargs, params,
+                                                  workers=args.workers,
+                                                  chunksize=args.chunksize), 1):
+            if item.error:
+                failed += 1
+            record = {
+                'path': item.path,
+                'results': [result_to_dict(r) for r in item.results],
+                'error': item.error,
+                'elapsed_ms': round(item.elapsed * 1000, 1)
+            }
+            out.write(json.dumps(record, ensure_ascii=False) + '\n')
+            out.flush()
+
+            if args.verbose:
+                print(f"[{done}/{len(paths)}] {item.path}", file=sys.stderr)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if args.verbose:
+        elapsed = time.perf_counter() - start
+        print(f"{len(paths)} görüntü {elapsed:.1f} sn'de işlendi "
+              f"({len(paths) / elapsed:.1f} görüntü/sn, {failed} hata)", file=sys.stderr)
+
+    return 0 if failed == 0 else 2
+
+
+def stream_main(argv: List[str]) -> int:
+    """Video/akış işleme: araç başına bir JSON satırı (JSONL) üretir"""
+    parser = argparse.ArgumentParser(
+        prog='python -m vision_codes.cli stream',
+        description='Kamera, RTSP veya video dosyasından sürekli kod tanıma'
+    )
+    parser.add_argument('source', help='Video dosyası, akış adresi (rtsp://...) veya kamera indeksi')
+    parser.add_argument('-o', '--output', help='JSONL çıkış dosyası (varsayılan: stdout)')
+    parser.add_argument('--frame-skip', type=int, default=0,
+                       help='Dosyalarda her işlenen kareden sonra atlanacak kare sayısı')
+    parser.add_argument('--min-votes', type=int, default=3,
+                       help='Tespitin yayınlanması için gereken kare oyu')
+    parser.add_argument('--max-gap', type=int, default=15,
+                       help='Aracın gittiğini varsaymak için sonuçsuz kare sayısı')
+    parser.add_argument('--locked-skip', type=int, default=5,
+                       help='Tespit yayınlandıktan sonra her N karede bir OCR çalıştır')
+    parser.add_argument('--max-frames', type=int, default=None,
+                       help='En fazla işlenecek kare indeksi')
+    parser.add_argument('--change-threshold', type=float, default=0.02,
+                       help='Son işlenen kareye göre değişim eşiği (0-1); altındaysa '
+                            'önceki sonuçlar kullanılır (negatif: kapalı)')
+    add_pipeline_arguments(parser)
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='Özet bilgiyi stderr\'e yaz')
+
+    args = parser.parse_args(argv)
+
+    kwargs, params = pipeline_options(args)
+    if args.change_threshold >= 0:
+        kwargs['change_threshold'] = args.change_threshold
+    pipeline = VisionPipeline(**kwargs)
+    for name, value in params.items():
+        setattr(pipeline, name, value)
+
+    try:
+        reader = FrameReader(args.source, frame_skip=args.frame_skip)
+    except IOError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    start = time.perf_counter()
+    detections = 0
+    try:
+        for detection in process_stream(pipeline, args.source, min_votes=args.min_votes,
+                                        max_gap=args.max_gap, locked_skip=args.locked_skip,
+                                        max_frames=args.max_frames, reader=reader):
+            detections += 1
+            out.write(json.dumps(stream_detection_to_dict(detection), ensure_ascii=False) + '\n')
+            out.flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reader.close()
+        pipeline.close()
+        if out is not sys.stdout:
+            out.close()
+
+    if args.verbose:
+        elapsed = time.perf_counter() - start
+        print(f"{reader.frames_read} kare {elapsed:.1f} sn'de okundu "
+              f"({reader.frames_dropped} atlandı), {detections} tespit", file=sys.stderr)
+        if pipeline.change_gate is not None:
+            stats = pipeline.change_gate.stats()
+            print(f"Değişim kontrolü: {stats['checks']} karenin {stats['skipped']} tanesinde "
+                  f"pipeline atlandı", file=sys.stderr)
+
+    return 0
+
+
 def print_results(results: List[DetectionResult]):
     """Sonuçları yazdır"""
     if not results:
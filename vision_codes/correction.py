@@ -0,0 +1,247 @@
+"""
+VIN düzeltme modülü - OCR karışıklıkları üzerinde kontrol hanesi güdümlü ışın araması
+"""
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .vin import VIN_CHAR_VALUES, VIN_WEIGHTS, validate_vin_check_digit
+
+
+# OCR'da birbirine karışan karakterler: gözlenen -> (aday, ağırlık)
+CONFUSIONS: Dict[str, List[Tuple[str, float]]] = {
+    'O': [('0', 1.0), ('D', 0.3)],
+    'Q': [('0', 1.0), ('D', 0.2)],
+    'I': [('1', 1.0), ('L', 0.2), ('T', 0.1)],
+    'D': [('0', 0.6)],
+    '0': [('D', 0.5), ('8', 0.1)],
+    '1': [('7', 0.3), ('L', 0.2), ('T', 0.2)],
+    'L': [('1', 0.5)],
+    'S': [('5', 1.0)],
+    '5': [('S', 1.0), ('6', 0.1)],
+    'B': [('8', 1.0)],
+    '8': [('B', 1.0), ('6', 0.2), ('3', 0.1)],
+    'G': [('6', 1.0), ('C', 0.3)],
+    '6': [('G', 1.0), ('8', 0.2), ('5', 0.1)],
+    'Z': [('2', 1.0), ('7', 0.2)],
+    '2': [('Z', 1.0)],
+    'A': [('4', 0.5)],
+    '4': [('A', 0.5)],
+    'T': [('7', 0.5), ('1', 0.2)],
+    '7': [('T', 0.5), ('1', 0.3), ('Z', 0.1)],
+    'U': [('V', 0.5)],
+    'V': [('U', 0.5), ('Y', 0.2)],
+    'Y': [('V', 0.3)],
+    'H': [('N', 0.3), ('M', 0.2)],
+    'N': [('H', 0.3), ('M', 0.3)],
+    'M': [('N', 0.3), ('H', 0.2)],
+    'E': [('F', 0.3)],
+    'F': [('E', 0.3)],
+    'C': [('G', 0.3)],
+    'K': [('X', 0.3)],
+    'X': [('K', 0.3)],
+}
+
+# Kontrol hanesi ve model yılı kuralları zorunlu olan bölgeler (WMI ilk karakteri:
+# Kuzey Amerika). Avrupa VIN'lerinde 9. ve 10. konum serbesttir.
+CHECK_DIGIT_REGIONS = '12345'
+
+# Konum kuralları
+_CHECK_DIGIT_CHARS = set('0123456789X')  # 9. konum
+_MODEL_YEAR_EXCLUDED = set('UZ0')  # 10. konum
+
+# Metinde VIN uzunluğundaki sözcükler (I, O, Q dahil; düzeltilecekler)
+_VIN_TOKEN = re.compile(r'(?<![A-Z0-9])[A-Z0-9]{17,19}(?![A-Z0-9])')
+
+# OCR motorunun kendi alternatiflerinin karışıklık tablosuna göre ağırlığı
+OCR_ALTERNATIVE_WEIGHT = 2.0
+
+# Sıfır olasılık yerine kullanılan güven sınırları
+_MIN_CONFIDENCE = 0.01
+_MAX_CONFIDENCE = 0.99
+
+
+@dataclass
+class VinCorrection:
+    """Düzeltilmiş VIN"""
+    vin: str
+    log_likelihood: float
+    changes: List[Tuple[int, str, str]] = field(default_factory=list)  # (konum, eski, yeni)
+    start: int = 0  # metindeki konum
+
+    @property
+    def probability(self) -> float:
+        return math.exp(self.log_likelihood)
+
+
+def uses_check_digit(vin: str) -> bool:
+    """VIN'in bölgesi kontrol hanesini zorunlu tutuyor mu"""
+    return bool(vin) and vin[0] in CHECK_DIGIT_REGIONS
+
+
+def allowed_at(position: int, char: str, strict: bool = True) -> bool:
+    """Karakter VIN'in bu konumunda kullanılabilir mi
+
+    strict=False ise yalnızca I, O, Q yasağı uygulanır.
+    """
+    if char not in VIN_CHAR_VALUES:
+        return False
+    if not strict:
+        return True
+    if position == 8:
+        return char in _CHECK_DIGIT_CHARS
+    if position == 9:
+        return char not in _MODEL_YEAR_EXCLUDED
+    return True
+
+
+def char_options(position: int, observed: str, confidence: float, strict: bool = True,
+                 ocr_alternatives: Optional[Sequence[Tuple[str, float]]] = None) -> List[Tuple[str, float]]:
+    """Konumdaki olası karakterler ve log olasılıkları
+
+    Gözlenen karakter OCR güveniyle, karışan adaylar kalan olasılığı
+    ağırlıklarıyla paylaşarak seçilir. OCR motorunun verdiği alternatifler
+    (karakter, güven) karışıklık tablosuna eklenir. Konum kurallarına
+    uymayanlar atılır.
+    """
+    confidence = min(max(confidence, _MIN_CONFIDENCE), _MAX_CONFIDENCE)
+    weights = dict(CONFUSIONS.get(observed, []))
+    for char, probability in ocr_alternatives or ():
+        char = char.upper()
+        if char != observed and probability > 0:
+            weights[char] = weights.get(char, 0.0) + OCR_ALTERNATIVE_WEIGHT * probability
+    total_weight = sum(weights.values())
+
+    options = []
+    if allowed_at(position, observed, strict):
+        options.append((observed, math.log(confidence)))
+    for char, weight in weights.items():
+        if allowed_at(position, char, strict):
+            options.append((char, math.log((1 - confidence) * weight / total_weight)))
+    return options
+
+
+def _check_value(char: str) -> int:
+    return 10 if char == 'X' else VIN_CHAR_VALUES[char]
+
+
+def vin_corrections(text: str, confidences: Optional[Sequence[float]] = None,
+                    beam_width: int = 64, max_changes: int = 3,
+                    require_check_digit: bool = True, top_k: int = 3,
+                    alternatives: Optional[Sequence[Sequence[Tuple[str, float]]]] = None,
+                    lock_confidence: Optional[float] = None) -> List[VinCorrection]:
+    """17 karakterlik OCR metni için en olası geçerli VIN'leri bul
+
+    Işın durumu (ağırlıklı toplam mod 11, seçilen kontrol hanesi, değişiklik
+    sayısı) olarak birleştirilir; aynı durumdaki düşük skorlu yollar atılır ve
+    her konumda en iyi beam_width durum tutulur. require_check_digit=False ise
+    (kontrol hanesi kullanmayan Avrupa VIN'leri) güveni ne olursa olsun
+    yalnızca VIN'de geçersiz karakterler (I, O, Q ve diğerleri) değiştirilir.
+
+    alternatives her karakter için OCR alternatifleridir. lock_confidence
+    verilirse güveni bu eşikte ya da üstünde olan geçerli karakterler
+    değiştirilmez; arama yalnızca belirsiz konumlarda dallanır.
+    """
+    text = text.upper()
+    if len(text) != 17:
+        return []
+    if confidences is None:
+        confidences = [0.8] * 17
+
+    # durum -> (log olasılık, karakterler, değişiklikler)
+    beam: Dict[Tuple[int, int, int], Tuple[float, str, tuple]] = {(0, -1, 0): (0.0, '', ())}
+    for position, observed in enumerate(text):
+        confidence = confidences[position]
+        if ((not require_check_digit or (lock_confidence is not None and confidence >= lock_confidence))
+                and allowed_at(position, observed, require_check_digit)):
+            # Kontrol hanesi yoksa seçimi doğrulayacak bir şey olmadığından geçerli karakterler korunur
+            options = [(observed, math.log(min(max(confidence, _MIN_CONFIDENCE), _MAX_CONFIDENCE)))]
+        else:
+            options = char_options(position, observed, confidence, require_check_digit,
+                                   alternatives[position] if alternatives is not None else None)
+        next_beam: Dict[Tuple[int, int, int], Tuple[float, str, tuple]] = {}
+
+        for (total, check, changed), (score, chars, changes) in beam.items():
+            for char, log_p in options:
+                is_change = char != observed
+                if changed + is_change > max_changes:
+                    continue
+
+                if position == 8:
+                    state = (total, _check_value(char) if require_check_digit else -1, changed + is_change)
+                elif require_check_digit:
+                    state = ((total + VIN_CHAR_VALUES[char] * VIN_WEIGHTS[position]) % 11, check,
+                             changed + is_change)
+                else:
+                    state = (0, -1, changed + is_change)
+
+                candidate = score + log_p
+                if state not in next_beam or candidate > next_beam[state][0]:
+                    next_beam[state] = (
+                        candidate, chars + char,
+                        changes + ((position, observed, char),) if is_change else changes
+                    )
+
+        if not next_beam:
+            return []
+        beam = dict(sorted(next_beam.items(), key=lambda item: -item[1][0])[:beam_width])
+
+    results = []
+    for (total, check, _), (score, chars, changes) in beam.items():
+        if require_check_digit and total != check:
+            continue
+        results.append(VinCorrection(chars, score, list(changes)))
+
+    results.sort(key=lambda c: -c.log_likelihood)
+    return results[:top_k]
+
+
+def correct_vin(text: str, confidences: Optional[Sequence[float]] = None,
+                **kwargs) -> Optional[VinCorrection]:
+    """En olası düzeltilmiş VIN (bulunamazsa None)"""
+    corrections = vin_corrections(text, confidences, top_k=1, **kwargs)
+    return corrections[0] if corrections else None
+
+
+def correct_vin_in_text(text: str, confidences: Optional[Sequence[float]] = None,
+                        min_probability: float = 1e-4,
+                        alternatives: Optional[Sequence[Sequence[Tuple[str, float]]]] = None,
+                        **kwargs) -> Optional[VinCorrection]:
+    """Metindeki 17-19 karakterlik sözcüklerin 17'lik pencerelerinden en olası düzeltmeyi bul
+
+    confidences ve alternatives verilirse metnin her karakteri için OCR güveni
+    ve alternatifleridir. Kontrol hanesi zaten doğru olan pencere değişiklik
+    yapılmadan döndürülür. Kontrol hanesi yalnızca zorunlu olduğu bölgelerde
+    (uses_check_digit) aranır.
+    """
+    upper = text.upper()
+    best: Optional[VinCorrection] = None
+
+    for match in _VIN_TOKEN.finditer(upper):
+        for start in range(match.start(), match.end() - 16):
+            window = upper[start:start + 17]
+            window_confidences = confidences[start:start + 17] if confidences is not None else None
+            window_alternatives = alternatives[start:start + 17] if alternatives is not None else None
+
+            if validate_vin_check_digit(window):
+                log_likelihood = sum(math.log(min(max(c, _MIN_CONFIDENCE), _MAX_CONFIDENCE))
+                                     for c in (window_confidences if window_confidences is not None
+                                               else [0.8] * 17))
+                return VinCorrection(window, log_likelihood, [], start)
+
+            if uses_check_digit(window):
+                correction = correct_vin(window, window_confidences,
+                                         alternatives=window_alternatives, **kwargs)
+            else:
+                # Yalnızca zorunlu (I, O, Q) değişiklikler yapılır, sayı sınırı yok
+                correction = correct_vin(window, window_confidences, require_check_digit=False,
+                                         alternatives=window_alternatives,
+                                         **{**kwargs, 'max_changes': 17})
+            if correction is None or correction.probability < min_probability:
+                continue
+            correction.start = start
+            if best is None or correction.log_likelihood > best.log_likelihood:
+                best = correction
+
+    return best
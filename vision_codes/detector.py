@@ -16,6 +16,7 @@ class BoundingBox:
     height: int
     confidence: float = 1.0
     label: str = ""
+    skew: Optional[float] = None  # üst karede hesaplanmış eğim (radyan)
 
 
 class ROIDetector:
@@ -132,6 +133,46 @@ class ROIDetector:
         # En büyük ROI'yi döndür
         return max(rois, key=lambda x: x.width * x.height)
     
+    def text_likelihood(self, roi_image: np.ndarray) -> float:
+        """ROI'nin metin içerme olasılığı için ucuz skor (0-1)
+        
+        Küçültülmüş ikili görüntüde satır başına siyah/beyaz geçiş yoğunluğu,
+        mürekkep oranı ve en/boy oranından hesaplanır; boş, düz, gürültülü
+        veya dikey bölgeler düşük skor alır.
+        """
+        if roi_image.size == 0:
+            return 0.0
+        if len(roi_image.shape) == 3:
+            gray = cv2.cvtColor(roi_image, cv2.COLOR_BGR2GRAY)
+        else:
+            gray = roi_image
+        
+        # Karakter yüksekliğini sabitle
+        h, w = gray.shape[:2]
+        if h > 32:
+            gray = cv2.resize(gray, (max(1, w * 32 // h), 32), interpolation=cv2.INTER_AREA)
+        if gray.shape[1] < 2 or int(gray.max()) - int(gray.min()) < 32:
+            return 0.0
+        
+        _, binary = cv2.threshold(gray, 0, 1, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        ink = 1.0 - float(binary.mean())
+        if ink > 0.5:
+            # Açık renkli metin, koyu zemin
+            ink = 1.0 - ink
+        
+        # Metin satırlarında genişlik başına geçiş oranı ~0.05-0.3'tür; daha
+        # yüksek oranlar gürültü ya da dokudur
+        transitions = np.count_nonzero(np.diff(binary, axis=1), axis=1).mean() / binary.shape[1]
+        transition_score = min(transitions / 0.05, 1.0)
+        if transitions > 0.3:
+            transition_score *= max(0.0, 1.0 - (transitions - 0.3) / 0.2)
+        ink_score = min(ink / 0.05, 1.0)
+        
+        # Kod ve VIN satırları yataydır
+        shape_score = min(w / h / 2.0, 1.0)
+        
+        return transition_score * ink_score * shape_score
+    
     def crop_roi(self, image: np.ndarray, bbox: BoundingBox) -> np.ndarray:
         """ROI'yi kırp"""
         x, y, w, h = bbox.x, bbox.y, bbox.width, bbox.height
@@ -0,0 +1,63 @@
+"""
+HTTP görüntü alma modülü - ham ikili, multipart ve JSON/base64 gövdeler
+"""
+import base64
+import binascii
+from typing import Optional
+
+import cv2
+import numpy as np
+
+
+# Doğrudan görüntü baytı olarak okunan içerik türleri
+RAW_MIMETYPES = ('application/octet-stream',)
+
+
+def read_request_image(request, field: str = 'image') -> Optional[bytes]:
+    """İstekten sıkıştırılmış görüntü baytlarını al
+
+    Desteklenen gövdeler:
+      - image/jpeg, image/png, ... : gövde doğrudan görüntüdür
+      - multipart/form-data        : `field` adlı dosya alanı
+      - application/json           : `field` anahtarında base64 (geriye uyumluluk),
+                                     isteğe bağlı 'data:image/...;base64,' önekiyle
+    Görüntü yoksa None döner, base64 geçersizse ValueError fırlatır.
+    """
+    mimetype = request.mimetype or ''
+
+    if mimetype.startswith('image/') or mimetype in RAW_MIMETYPES:
+        # Gövde akıştan bir kez okunur, Flask tarafında ayrıca saklanmaz
+        data = request.get_data(cache=False)
+        return data or None
+
+    if mimetype == 'multipart/form-data':
+        upload = request.files.get(field)
+        if upload is None:
+            return None
+        data = upload.read()
+        return data or None
+
+    payload = request.get_json(silent=True) or {}
+    image_base64 = payload.get(field)
+    if not image_base64:
+        return None
+    return _decode_base64(image_base64)
+
+
+def _decode_base64(image_base64) -> bytes:
+    """base64 görüntüyü (isteğe bağlı data URL önekiyle) doğrulayarak çöz"""
+    if not isinstance(image_base64, str):
+        raise ValueError('Invalid base64 image')
+    if image_base64.startswith('data:'):
+        _, _, image_base64 = image_base64.partition(',')
+    try:
+        return base64.b64decode(image_base64, validate=True)
+    except (binascii.Error, ValueError):
+        raise ValueError('Invalid base64 image') from None
+
+
+def decode_image(image_bytes: bytes, flags: int = cv2.IMREAD_COLOR) -> Optional[np.ndarray]:
+    """Sıkıştırılmış görüntü baytlarını kopyalamadan çöz"""
+    if not image_bytes:
+        return None
+    return cv2.imdecode(np.frombuffer(image_bytes, np.uint8), flags)
@@ -1,10 +1,25 @@
 """
 Renault/Dacia kod sözlüğü ve fuzzy eşleştirme modülü
 """
-import difflib
-from typing import Dict, List, Tuple, Optional
+from collections import ChainMap
+from itertools import product
+from typing import Dict, Iterator, List, Tuple, Optional
 from dataclasses import dataclass
 
+from .matching import CodeMatcher, BKTreeIndex, AhoCorasick
+from .vin import VinCandidate, iter_vin_candidates
+
+
+# Fuzzy arama indeks türleri
+FUZZY_INDEXES = {
+    'matrix': CodeMatcher,  # tüm kodlar tek vektörel geçişte
+    'bktree': BKTreeIndex,  # uzunluk kovalı BK-ağaçları, büyük sözlükler için
+}
+
+
+# WMI'de bulunamayan (VIN'de yasak) ve OCR'ın rakam yerine okuduğu harfler
+WMI_DIGIT_LOOKALIKES = {'I': '1', 'O': '0'}
+
 
 @dataclass
 class CodeInfo:
@@ -16,10 +31,55 @@ class CodeInfo:
     confidence: float = 1.0
 
 
+@dataclass
+class CodeOccurrence:
+    """Metin içinde bulunan sözlük kodu ve konumu"""
+    code: str
+    category: str  # 'WMI' veya 'Model'
+    value: str  # üretici (WMI) veya model adı
+    start: int
+    end: int
+
+
 class RenaultDaciaLexicon:
     """Renault/Dacia kod sözlüğü ve eşleştirme sınıfı"""
     
-    def __init__(self):
+    def __init__(self, fuzzy_index: str = 'matrix', path: Optional[str] = None):
+        """
+        fuzzy_index: 'matrix' (varsayılan) veya on binlerce kodluk sözlükler
+            için 'bktree'; ikisi de aynı sonuçları döndürür.
+        path: Derlenmiş (.vclx) veya CSV/JSON sözlük dosyası. Verilirse kodlar
+            yerleşik tablolar yerine bellek eşlemeli dosyadan okunur.
+        """
+        if fuzzy_index not in FUZZY_INDEXES:
+            raise ValueError(f"Bilinmeyen fuzzy indeks: {fuzzy_index}")
+        self.fuzzy_index = fuzzy_index
+        self.path = path
+        
+        if path:
+            from .lexicon_store import open_lexicon, WMI_TABLE, MODEL_TABLE
+            
+            self.store = open_lexicon(path)
+            self.wmi_codes = self.store.table(WMI_TABLE)
+            self.model_codes = self.store.table(MODEL_TABLE)
+        else:
+            self.store = None
+            self._load_builtin_codes()
+        
+        # Tüm geçerli kodlar (aynı kod iki tabloda varsa model önceliklidir)
+        self.all_codes = ChainMap(self.model_codes, self.wmi_codes)
+        
+        # Fuzzy eşleştirme için derlenmiş indeks; dosyadan yüklenen büyük
+        # sözlüklerde açılışı yavaşlatmamak için ilk fuzzy aramada (ya da
+        # build_indexes ile) derlenir. Worker başına ayrı kopyadır.
+        self.matcher = None if self.store is not None else FUZZY_INDEXES[fuzzy_index](self.all_codes)
+        
+        # Metin içi kod arama otomatı (ilk kullanımda kurulur)
+        self.automaton: Optional[AhoCorasick] = None
+
+    
+    def _load_builtin_codes(self):
+        """Yerleşik Renault/Dacia kod tabloları"""
         self.wmi_codes = {
             'VF1': 'Renault (Fransa)',
             'UU1': 'Dacia (Fransa)',
@@ -40,15 +100,6 @@ class RenaultDaciaLexicon:
             'RDA': 'Master Panelvan',
             'DJF': 'Sandero Stepway',
         }
-        
-        # Tüm geçerli kodlar
-        self.all_codes = {**self.wmi_codes, **self.model_codes}
-        
-        # Karışık karakter düzeltmeleri
-        self.char_replacements = {
-            'O': '0', 'I': '1', 'S': '5', 'B': '8', 
-            'G': '6', 'Z': '2', 'Q': '0', 'D': '0'
-        }
     
     def normalize_text(self, text: str) -> str:
         """Metni normalize et"""
@@ -58,14 +109,9 @@ class RenaultDaciaLexicon:
         # Büyük harfe çevir ve gereksiz karakterleri kaldır
         normalized = text.upper().strip()
         
-        # Sadece harf ve rakam bırak
-        normalized = ''.join(c for c in normalized if c.isalnum())
-        
-        # Karışık karakterleri düzelt
-        for old_char, new_char in self.char_replacements.items():
-            normalized = normalized.replace(old_char, new_char)
-            
-        return normalized
+        # Sadece harf ve rakam bırak; OCR karışıklıkları körlemesine değiştirilmez
+        # (DJF, JLO gibi kodlar bozulurdu), VIN'ler correction modülünde düzeltilir
+        return ''.join(c for c in normalized if c.isalnum())
     
     def find_exact_match(self, text: str) -> Optional[CodeInfo]:
         """Tam eşleşme ara"""
@@ -89,6 +135,31 @@ class RenaultDaciaLexicon:
                 confidence=1.0
             )
         
+        return self._find_wmi_lookalike(normalized)
+    
+    def _find_wmi_lookalike(self, normalized: str) -> Optional[CodeInfo]:
+        """I/O harflerini 1/0 ile değiştirerek WMI ara ('VFI' -> 'VF1')
+        
+        WMI'lerde I ve O bulunmadığından bu harfler yanlış okumadır; her konum
+        için iki seçenek denenir ve bilinen bir WMI veren ilk biçim seçilir.
+        Her değişiklik güveni biraz düşürür.
+        """
+        if len(normalized) != 3 or not any(c in WMI_DIGIT_LOOKALIKES for c in normalized):
+            return None
+        
+        options = [(c, WMI_DIGIT_LOOKALIKES[c]) if c in WMI_DIGIT_LOOKALIKES else (c,) for c in normalized]
+        for chars in product(*options):
+            code = ''.join(chars)
+            if code in self.wmi_codes:
+                changes = sum(a != b for a, b in zip(code, normalized))
+                return CodeInfo(
+                    code=code,
+                    manufacturer=self.wmi_codes[code],
+                    model="",
+                    category="WMI",
+                    confidence=0.95 ** changes
+                )
+        
         return None
     
     def find_fuzzy_match(self, text: str, threshold: float = 0.8) -> List[CodeInfo]:
@@ -99,27 +170,68 @@ class RenaultDaciaLexicon:
         
         matches = []
         
-        for code, info in self.all_codes.items():
-            # Levenshtein distance ile benzerlik hesapla
-            similarity = difflib.SequenceMatcher(None, normalized, code).ratio()
+        # Tüm kodlara karşı tek geçişte LCS benzerliği (sonuçlar skora göre sıralı)
+        for code, similarity in self._get_matcher().match(normalized, threshold):
+            category = "WMI" if code in self.wmi_codes else "Model"
+            manufacturer = self.wmi_codes.get(code, "Renault/Dacia")
+            model = self.model_codes.get(code, "")
             
-            if similarity >= threshold:
-                category = "WMI" if code in self.wmi_codes else "Model"
-                manufacturer = self.wmi_codes.get(code, "Renault/Dacia")
-                model = self.model_codes.get(code, "")
-                
-                matches.append(CodeInfo(
-                    code=code,
-                    manufacturer=manufacturer,
-                    model=model,
-                    category=category,
-                    confidence=similarity
-                ))
-        
-        # Güven skoruna göre sırala
-        matches.sort(key=lambda x: x.confidence, reverse=True)
+            matches.append(CodeInfo(
+                code=code,
+                manufacturer=manufacturer,
+                model=model,
+                category=category,
+                confidence=similarity
+            ))
+        
         return matches
     
+    def _get_matcher(self) -> CodeMatcher:
+        """Derlenmiş eşleştiriciyi al (yerleşik tablolar değiştiyse yeniden derle)"""
+        if self.matcher is None or (self.store is None and len(self.matcher) != len(self.all_codes)):
+            self.rebuild_index()
+        return self.matcher
+    
+    def rebuild_index(self):
+        """all_codes değiştikten sonra eşleştiriciyi yeniden derle"""
+        self.matcher = FUZZY_INDEXES[self.fuzzy_index](self.all_codes)
+    
+    def find_code_occurrences(self, text: str, category: Optional[str] = None) -> List[CodeOccurrence]:
+        """Metindeki tüm WMI/model kodlarını konumlarıyla tek geçişte bul
+        
+        Sonuçlar başlangıç konumuna göre sıralıdır; category ('WMI' veya
+        'Model') verilirse yalnızca o türdekiler döner.
+        """
+        occurrences = []
+        for start, code in self._get_automaton().find_all(text.upper()):
+            end = start + len(code)
+            if category in (None, 'WMI') and code in self.wmi_codes:
+                occurrences.append(CodeOccurrence(code, 'WMI', self.wmi_codes[code], start, end))
+            if category in (None, 'Model') and code in self.model_codes:
+                occurrences.append(CodeOccurrence(code, 'Model', self.model_codes[code], start, end))
+        return occurrences
+    
+    def build_indexes(self):
+        """Fuzzy eşleştiriciyi ve arama otomatını şimdi kur
+        
+        Dosyadan yüklenen sözlüklerde ikisi de ilk kullanımda kurulur ve bellek
+        eşlemeli tablolardan farklı olarak her süreçte ayrı yığın belleği
+        kaplar. Çok süreçli sunucularda ilk isteğin bu maliyeti ödememesi için
+        worker ısındırılırken çağrılır.
+        """
+        self._get_matcher()
+        self._get_automaton()
+    
+    def _get_automaton(self) -> AhoCorasick:
+        """Kod arama otomatını al (yerleşik tablolar değiştiyse yeniden kur)"""
+        if self.automaton is None or (self.store is None and len(self.automaton) != len(self.all_codes)):
+            self.automaton = AhoCorasick(self.all_codes)
+        return self.automaton
+    
+    def index_stats(self) -> Dict:
+        """Fuzzy arama sayaçları (arama, mesafe hesabı, budama oranı)"""
+        return self._get_matcher().stats()
+    
     def find_best_match(self, text: str, threshold: float = 0.8) -> Optional[CodeInfo]:
         """En iyi eşleşmeyi bul"""
         # Önce tam eşleşme ara
@@ -135,22 +247,12 @@ class RenaultDaciaLexicon:
         return None
     
     def extract_vin_candidates(self, text: str) -> List[str]:
-        """VIN adaylarını çıkar"""
-        import re
-        
-        # VIN pattern'leri
-        patterns = [
-            r'VF1[A-Z0-9]{10,16}',  # Renault VIN
-            r'UU1[A-Z0-9]{10,16}',  # Dacia VIN
-            r'[A-HJ-NPR-Z0-9]{8,17}',  # Genel VIN
-        ]
-        
-        candidates = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text.upper())
-            candidates.extend(matches)
-        
-        return list(set(candidates))  # Duplikatları kaldır
+        """VIN adaylarını çıkar (en olası aday önce)"""
+        return [candidate.vin for candidate in self.iter_vin_candidates(text)]
+    
+    def iter_vin_candidates(self, text: str) -> Iterator[VinCandidate]:
+        """VIN adaylarını kontrol hanesi ve bilinen WMI'ye göre sıralı, tembel olarak üret"""
+        return iter_vin_candidates(text, self.wmi_codes)
     
     def validate_vin(self, vin: str) -> bool:
         """VIN doğruluğunu kontrol et"""
@@ -0,0 +1,240 @@
+"""
+Sözlük deposu - CSV/JSON kod tablolarını bellek eşlemeli ikili dosyaya derler
+
+Dosya düzeni (küçük uçlu):
+    başlık:   magic 'VCLX', sürüm (u32), tablo sayısı (u32)
+    dizin:    her tablo için ad (16 bayt), kayıt sayısı (u32), anahtar genişliği (u32),
+              anahtar, ofset ve değer bölümlerinin konumları (u64) ve değer boyutu (u64)
+    tablolar: sıralı, sabit genişlikli ASCII anahtarlar; (kayıt sayısı + 1) adet u64
+              ofset; UTF-8 değer baytları
+
+Dosya np.memmap ile açılır; aramalar np.searchsorted ile yapılır ve sayfalar
+fork edilmiş worker süreçleri arasında paylaşılır.
+
+Kullanım:
+    python -m vision_codes.lexicon_store codes.csv lexicon.vclx
+"""
+import argparse
+import csv
+import json
+import os
+import struct
+import sys
+import tempfile
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+
+MAGIC = b'VCLX'
+VERSION = 1
+HEADER = struct.Struct('<4sII')
+TABLE_ENTRY = struct.Struct('<16sIIQQQQ')
+
+# Sözlükteki tablolar (RenaultDaciaLexicon alanları)
+WMI_TABLE = 'wmi'
+MODEL_TABLE = 'model'
+
+# Giriş dosyalarındaki kategori adları -> tablo
+CATEGORY_TABLES = {
+    'wmi': WMI_TABLE,
+    'model': MODEL_TABLE,
+}
+
+
+def _align(size: int, alignment: int = 8) -> int:
+    return (size + alignment - 1) // alignment * alignment
+
+
+def load_entries(path: str) -> Dict[str, Dict[str, str]]:
+    """CSV veya JSON kaynağından {tablo: {kod: değer}} oku
+
+    CSV sütunları: code, category (WMI/Model), value
+    JSON: {"wmi_codes": {...}, "model_codes": {...}} veya
+          [{"code": ..., "category": ..., "value": ...}, ...]
+    """
+    tables: Dict[str, Dict[str, str]] = {WMI_TABLE: {}, MODEL_TABLE: {}}
+
+    def add(code: str, category: str, value: str):
+        table = CATEGORY_TABLES.get(category.strip().lower())
+        if table is None:
+            raise ValueError(f"Bilinmeyen kategori: {category}")
+        tables[table][code.strip().upper()] = value.strip()
+
+    if path.lower().endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            for code, value in data.get('wmi_codes', {}).items():
+                add(code, 'wmi', value)
+            for code, value in data.get('model_codes', {}).items():
+                add(code, 'model', value)
+        else:
+            for row in data:
+                add(row['code'], row['category'], row.get('value', ''))
+    else:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                add(row['code'], row['category'], row.get('value') or '')
+
+    return tables
+
+
+def compile_lexicon(tables: Dict[str, Dict[str, str]], output_path: str):
+    """Tabloları ikili sözlük dosyasına yaz"""
+    names = sorted(tables)
+    blobs = []
+    for name in names:
+        codes = sorted(tables[name])
+        for code in codes:
+            if not code.isascii():
+                raise ValueError(f"Kod ASCII olmalı: {code}")
+        width = max((len(code) for code in codes), default=1)
+        keys = np.array([code.encode('ascii') for code in codes], dtype=f'S{width}').tobytes()
+
+        values = [tables[name][code].encode('utf-8') for code in codes]
+        offsets = np.zeros(len(values) + 1, dtype='<u8')
+        offsets[1:] = np.cumsum([len(value) for value in values])
+        blobs.append((name, len(codes), width, keys, offsets.tobytes(), b''.join(values)))
+
+    position = _align(HEADER.size + TABLE_ENTRY.size * len(names))
+    directory = []
+    layout = []
+    for name, count, width, keys, offsets, values in blobs:
+        keys_at = position
+        offsets_at = _align(keys_at + len(keys))
+        values_at = offsets_at + len(offsets)
+        position = _align(values_at + len(values))
+        directory.append(TABLE_ENTRY.pack(name.encode('ascii'), count, width,
+                                          keys_at, offsets_at, values_at, len(values)))
+        layout.append(((keys_at, keys), (offsets_at, offsets), (values_at, values)))
+
+    # Aynı dosyayı derleyen süreçler birbirinin yarım dosyasını görmesin diye
+    # benzersiz geçici dosyaya yazıp taşı
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(output_path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(names)))
+            for entry in directory:
+                f.write(entry)
+            for sections in layout:
+                for offset, data in sections:
+                    f.write(b'\0' * (offset - f.tell()))
+                    f.write(data)
+            f.write(b'\0' * (position - f.tell()))
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class CodeTable(Mapping):
+    """Bellek eşlemeli, salt okunur kod -> değer tablosu"""
+
+    def __init__(self, buffer: np.ndarray, count: int, width: int,
+                 keys_at: int, offsets_at: int, values_at: int):
+        self._buffer = buffer
+        self._values_at = values_at
+        self.keys_array = buffer[keys_at:keys_at + count * width].view(f'S{width}')
+        self.offsets = buffer[offsets_at:offsets_at + (count + 1) * 8].view('<u8')
+
+    def _index(self, key) -> int:
+        if not isinstance(key, str) or not key.isascii():
+            return -1
+        encoded = key.encode('ascii')
+        index = int(np.searchsorted(self.keys_array, encoded))
+        if index < len(self.keys_array) and self.keys_array[index] == encoded:
+            return index
+        return -1
+
+    def __getitem__(self, key: str) -> str:
+        index = self._index(key)
+        if index < 0:
+            raise KeyError(key)
+        start = self._values_at + int(self.offsets[index])
+        end = self._values_at + int(self.offsets[index + 1])
+        return bytes(self._buffer[start:end]).decode('utf-8')
+
+    def __contains__(self, key) -> bool:
+        return self._index(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.keys_array:
+            yield key.decode('ascii')
+
+    def __len__(self) -> int:
+        return len(self.keys_array)
+
+
+class LexiconStore:
+    """Derlenmiş sözlük dosyası"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._buffer = np.memmap(path, dtype=np.uint8, mode='r')
+
+        magic, version, table_count = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Geçersiz sözlük dosyası: {path}")
+        if version != VERSION:
+            raise ValueError(f"Desteklenmeyen sözlük sürümü: {version}")
+
+        self.tables: Dict[str, CodeTable] = {}
+        for i in range(table_count):
+            name, count, width, keys_at, offsets_at, values_at, _ = TABLE_ENTRY.unpack_from(
+                self._buffer, HEADER.size + i * TABLE_ENTRY.size
+            )
+            self.tables[name.rstrip(b'\0').decode('ascii')] = CodeTable(
+                self._buffer, count, width, keys_at, offsets_at, values_at
+            )
+
+    def table(self, name: str) -> CodeTable:
+        """Adı verilen tabloyu al"""
+        if name not in self.tables:
+            raise KeyError(f"Sözlükte '{name}' tablosu yok")
+        return self.tables[name]
+
+
+def ensure_compiled(path: str) -> str:
+    """CSV/JSON kaynağı yanındaki .vclx dosyasına derle (eskiyse) ve derlenmiş yolu döndür
+
+    .vclx verilirse olduğu gibi döner. Çok süreçli sunucularda worker'lar
+    çatallanmadan önce ana süreçte bir kez çağrılmalıdır (bkz. serve.main).
+    """
+    if not path.lower().endswith(('.csv', '.json')):
+        return path
+    compiled = os.path.splitext(path)[0] + '.vclx'
+    if not os.path.exists(compiled) or os.path.getmtime(compiled) < os.path.getmtime(path):
+        compile_lexicon(load_entries(path), compiled)
+    return compiled
+
+
+def open_lexicon(path: str) -> LexiconStore:
+    """Derlenmiş (.vclx) dosyayı aç; CSV/JSON verilirse yanına derleyip aç
+
+    Kaynak dosya derlenmiş dosyadan yeniyse yeniden derlenir.
+    """
+    return LexiconStore(ensure_compiled(path))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ana fonksiyon"""
+    parser = argparse.ArgumentParser(description='CSV/JSON kod tablolarını ikili sözlüğe derle')
+    parser.add_argument('inputs', nargs='+', help='CSV veya JSON kaynak dosyaları')
+    parser.add_argument('output', help='Çıkış (.vclx) dosyası')
+    args = parser.parse_args(argv)
+
+    tables: Dict[str, Dict[str, str]] = {WMI_TABLE: {}, MODEL_TABLE: {}}
+    for path in args.inputs:
+        for name, entries in load_entries(path).items():
+            tables[name].update(entries)
+
+    compile_lexicon(tables, args.output)
+    print(f"{sum(len(t) for t in tables.values())} kod derlendi: {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
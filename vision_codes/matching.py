@@ -0,0 +1,374 @@
+"""
+Eşleştirme motoru - sözlük kodlarına karşı vektörel benzerlik hesabı
+"""
+import math
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import Levenshtein
+    LEVENSHTEIN_AVAILABLE = True
+except ImportError:
+    LEVENSHTEIN_AVAILABLE = False
+
+
+# Bit-paralel hesapta bir kodun en fazla uzunluğu (uint64 maske)
+MAX_CODE_LENGTH = 63
+
+# 8 bitlik değerlerin bit sayıları (np.bitwise_count olmayan NumPy sürümleri için)
+_POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    """İşaretsiz tamsayı dizisindeki her elemanın 1 bit sayısı"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(values).astype(np.int64)
+    as_bytes = values.view(np.uint8).reshape(values.shape + (values.itemsize,))
+    return _POPCOUNT_TABLE[as_bytes].sum(axis=-1, dtype=np.int64)
+
+
+def similarity_ratio(a: str, b: str) -> float:
+    """İki metin arasındaki benzerlik: 2 * LCS / (len(a) + len(b))
+
+    difflib.SequenceMatcher.ratio() ile aynı ölçek (0-1). SequenceMatcher'ın
+    açgözlü blok eşleştirmesi de ortak bir alt dizi bulduğundan bu skor hiçbir
+    zaman ondan düşük olmaz; mevcut eşikler aynı anlamda kullanılabilir.
+    """
+    if not a and not b:
+        return 1.0
+    if LEVENSHTEIN_AVAILABLE:
+        return Levenshtein.ratio(a, b)
+
+    # LCS uzunluğu dinamik programlamayla
+    previous = [0] * (len(b) + 1)
+    for ca in a:
+        current = [0]
+        for j, cb in enumerate(b):
+            current.append(previous[j] + 1 if ca == cb else max(previous[j + 1], current[j]))
+        previous = current
+    return 2.0 * previous[-1] / (len(a) + len(b))
+
+
+def indel_distance(a: str, b: str) -> int:
+    """Ekleme/silme mesafesi: len(a) + len(b) - 2 * LCS
+
+    similarity_ratio ile ilişkisi: oran = 1 - mesafe / (len(a) + len(b)).
+    """
+    if LEVENSHTEIN_AVAILABLE:
+        # Değiştirme = silme + ekleme
+        return Levenshtein.distance(a, b, weights=(1, 1, 2))
+
+    total = len(a) + len(b)
+    return total - round(similarity_ratio(a, b) * total) if total else 0
+
+
+def length_bounds(length: int, threshold: float) -> Tuple[int, int]:
+    """Eşiği geçebilecek kod uzunluğu aralığı
+
+    LCS <= min(la, lb) olduğundan oran >= t için
+    la * t / (2 - t) <= lb <= la * (2 - t) / t olmalıdır.
+    """
+    if threshold <= 0:
+        return 0, MAX_CODE_LENGTH
+    low = math.ceil(length * threshold / (2 - threshold) - 1e-9)
+    high = math.floor(length * (2 - threshold) / threshold + 1e-9)
+    return max(low, 0), min(high, MAX_CODE_LENGTH)
+
+
+def distance_budget(length_a: int, length_b: int, threshold: float) -> int:
+    """Oran >= threshold için izin verilen en büyük ekleme/silme mesafesi"""
+    return int((1 - threshold) * (length_a + length_b) + 1e-9)
+
+
+class CodeMatcher:
+    """Kodları bir kez derleyip tüm sözlüğe karşı tek geçişte benzerlik hesaplar
+
+    Her kod için karakter başına konum bit maskeleri (alfabe x kod sayısı
+    tamsayı matrisi) tutulur. Sorgu metninin her karakteri için bit-paralel
+    LCS (Hyyrö) adımı tüm kodlara aynı anda NumPy ile uygulanır; maliyet
+    sorgu uzunluğu x kod sayısı / vektör genişliğidir.
+    """
+
+    def __init__(self, codes: Iterable[str]):
+        self.codes: List[str] = list(dict.fromkeys(codes))
+
+        too_long = [code for code in self.codes if len(code) > MAX_CODE_LENGTH]
+        if too_long:
+            raise ValueError(f"Kod en fazla {MAX_CODE_LENGTH} karakter olabilir: {too_long[0]}")
+
+        self.lengths = np.array([len(code) for code in self.codes], dtype=np.int64)
+        width = int(self.lengths.max()) if self.codes else 0
+
+        # Kodları (kod sayısı x genişlik) karakter kodu matrisine çevir (0: dolgu)
+        chars = np.zeros((len(self.codes), max(width, 1)), dtype=np.uint32)
+        if width:
+            padded = np.array(self.codes, dtype=f'<U{width}')
+            chars[:, :width] = padded.view(np.uint32).reshape(len(self.codes), width)
+
+        alphabet = np.unique(chars[chars > 0])
+        self._alphabet: Dict[str, int] = {chr(c): i for i, c in enumerate(alphabet)}
+
+        # En uzun kodu taşıyan en küçük tamsayı türü (taşan elde bitleri atılabilir)
+        self.dtype = next(dtype for dtype in (np.uint8, np.uint16, np.uint32, np.uint64)
+                          if np.iinfo(dtype).bits >= width)
+
+        # Her konumda, kodun karakter satırına konum bitini yaz
+        # (yerinde |= ile fancy indeksleme çok yavaş olduğundan açık topla/dağıt)
+        self.masks = np.zeros((len(alphabet), len(self.codes)), dtype=self.dtype)
+        flat = self.masks.reshape(-1)
+        columns = np.arange(len(self.codes))
+        for position in range(width):
+            present = chars[:, position] > 0
+            index = np.searchsorted(alphabet, chars[present, position]) * len(self.codes) + columns[present]
+            flat[index] = flat[index] | self.dtype(1 << position)
+        self._length_masks = ((np.uint64(1) << self.lengths.astype(np.uint64))
+                              - np.uint64(1)).astype(self.dtype)
+
+        # İstatistikler
+        self.lookups = 0
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def stats(self) -> Dict[str, Any]:
+        """Arama istatistikleri (her arama tüm kodları tarar)"""
+        return {
+            'index': 'matrix',
+            'codes': len(self.codes),
+            'lookups': self.lookups,
+            'comparisons': self.lookups * len(self.codes),
+        }
+
+    def lcs_lengths(self, text: str) -> np.ndarray:
+        """Metnin tüm kodlarla en uzun ortak alt dizi uzunlukları"""
+        v = np.full(len(self.codes), np.iinfo(self.dtype).max, dtype=self.dtype)
+        with np.errstate(over='ignore'):
+            for char in text:
+                row = self._alphabet.get(char)
+                if row is None:
+                    continue
+                u = v & self.masks[row]
+                v = (v + u) | (v - u)
+
+        # Kod uzunluğu içindeki sıfır bitler LCS uzunluğunu verir
+        return self.lengths - _popcount(v & self._length_masks)
+
+    def ratios(self, text: str) -> np.ndarray:
+        """Metnin tüm kodlara benzerlik oranları (self.codes sırasıyla)"""
+        return 2.0 * self.lcs_lengths(text) / (len(text) + self.lengths)
+
+    def match(self, text: str, threshold: float) -> List[Tuple[str, float]]:
+        """Eşiği geçen (kod, benzerlik) çiftleri, benzerliğe göre azalan sırada"""
+        if not text or not self.codes:
+            return []
+
+        self.lookups += 1
+        ratios = self.ratios(text)
+        matches = [(self.codes[index], float(ratios[index]))
+                   for index in np.flatnonzero(ratios >= threshold)]
+        # Kararlı sıralama: eşit skorlarda sözlük sırası korunur
+        matches.sort(key=lambda item: item[1], reverse=True)
+        return matches
+
+
+class BKTree:
+    """Ekleme/silme mesafesi üzerinde BK-ağacı
+
+    Düğümler [kod, {mesafe: alt düğüm}] listeleridir. Üçgen eşitsizliği
+    sayesinde arama yalnızca |d - yarıçap| aralığındaki dalları gezer.
+    """
+
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    def add(self, code: str):
+        """Kodu ağaca ekle"""
+        if self.root is None:
+            self.root = [code, {}]
+            self.size = 1
+            return
+
+        node = self.root
+        while True:
+            distance = indel_distance(code, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [code, {}]
+                self.size += 1
+                return
+            node = child
+
+    def search(self, text: str, radius: int) -> Tuple[List[Tuple[str, int]], int]:
+        """Yarıçap içindeki (kod, mesafe) çiftleri ve hesaplanan mesafe sayısı"""
+        if self.root is None:
+            return [], 0
+
+        found = []
+        computed = 0
+        stack = [self.root]
+        while stack:
+            code, children = stack.pop()
+            distance = indel_distance(text, code)
+            computed += 1
+            if distance <= radius:
+                found.append((code, distance))
+            for child_distance, child in children.items():
+                if distance - radius <= child_distance <= distance + radius:
+                    stack.append(child)
+
+        return found, computed
+
+
+class BKTreeIndex:
+    """Kod uzunluğuna göre kovalanmış BK-ağaçlarıyla alt-doğrusal fuzzy arama
+
+    Eşik, sorgu uzunluğu için olası kod uzunluklarını (length_bounds) ve her
+    uzunluk kovası için mesafe bütçesini (distance_budget) belirler; yalnızca
+    bu kovalardaki ağaçlar aranır. Sonuçlar CodeMatcher ile aynıdır.
+    """
+
+    def __init__(self, codes: Iterable[str]):
+        self.codes: List[str] = list(dict.fromkeys(codes))
+        too_long = [code for code in self.codes if len(code) > MAX_CODE_LENGTH]
+        if too_long:
+            raise ValueError(f"Kod en fazla {MAX_CODE_LENGTH} karakter olabilir: {too_long[0]}")
+
+        self._order = {code: index for index, code in enumerate(self.codes)}
+        self.buckets: Dict[int, BKTree] = {}
+        for code in self.codes:
+            self.buckets.setdefault(len(code), BKTree()).add(code)
+
+        # İstatistikler
+        self.lookups = 0
+        self.comparisons = 0
+        self.candidates = 0
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def match(self, text: str, threshold: float) -> List[Tuple[str, float]]:
+        """Eşiği geçen (kod, benzerlik) çiftleri, benzerliğe göre azalan sırada"""
+        if not text or not self.codes:
+            return []
+
+        self.lookups += 1
+        low, high = length_bounds(len(text), threshold)
+
+        matches = []
+        for length in range(low, high + 1):
+            tree = self.buckets.get(length)
+            if tree is None:
+                continue
+
+            total = len(text) + length
+            found, computed = tree.search(text, distance_budget(len(text), length, threshold))
+            self.comparisons += computed
+            for code, distance in found:
+                ratio = (total - distance) / total
+                if ratio >= threshold:
+                    matches.append((code, ratio))
+
+        self.candidates += len(matches)
+        # CodeMatcher ile aynı sıra: skor azalan, eşitlikte sözlük sırası
+        matches.sort(key=lambda item: (-item[1], self._order[item[0]]))
+        return matches
+
+    def stats(self) -> Dict[str, Any]:
+        """Arama ve budama istatistikleri"""
+        scanned = self.lookups * len(self.codes)
+        return {
+            'index': 'bktree',
+            'codes': len(self.codes),
+            'buckets': len(self.buckets),
+            'lookups': self.lookups,
+            'comparisons': self.comparisons,
+            'candidates': self.candidates,
+            'pruned_ratio': 1 - self.comparisons / scanned if scanned else 0.0,
+        }
+
+
+class AhoCorasick:
+    """Çoklu desen arama otomatı (Aho–Corasick)
+
+    Desenler bir kez trie'ye eklenir ve başarısızlık bağlantıları kurulur;
+    metin tek geçişte taranır ve tüm (örtüşenler dahil) eşleşmeler konumlarıyla
+    bulunur. Maliyet metin uzunluğu + eşleşme sayısıyla doğrusaldır, desen
+    sayısından bağımsızdır.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        # Düğüm i: geçişler, başarısızlık bağlantısı, bu düğümde biten desen
+        # ve bir sonraki çıktı düğümü (sözlük sonek bağlantısı)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._pattern: List[Optional[str]] = [None]
+        self._output: List[int] = [-1]
+        self.size = 0
+
+        for pattern in patterns:
+            self._add(pattern)
+        self._build_links()
+
+    def _add(self, pattern: str):
+        if not pattern:
+            return
+
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._pattern.append(None)
+                self._output.append(-1)
+            node = next_node
+
+        if self._pattern[node] is None:
+            self._pattern[node] = pattern
+            self.size += 1
+
+    def _build_links(self):
+        # Genişlik öncelikli: bir düğümün bağlantısı üst düğümlerinkinden türetilir
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[child] = target if target != child else 0
+
+                target = self._fail[child]
+                self._output[child] = target if self._pattern[target] is not None else self._output[target]
+                queue.append(child)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """(başlangıç konumu, desen) çiftlerini bitiş konumuna göre sırayla üret"""
+        goto = self._goto
+        fail = self._fail
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+
+            match = node if self._pattern[node] is not None else self._output[node]
+            while match > 0:
+                pattern = self._pattern[match]
+                yield position - len(pattern) + 1, pattern
+                match = self._output[match]
+
+    def find_all(self, text: str) -> List[Tuple[int, str]]:
+        """Tüm eşleşmeler, başlangıç konumuna göre sıralı"""
+        return sorted(self.iter_matches(text), key=lambda item: (item[0], -len(item[1])))
@@ -3,10 +3,55 @@ OCR arayüzü modülü - Tesseract ve PaddleOCR desteği
 """
 import cv2
 import numpy as np
+import bisect
+import re
+import threading
+from collections import OrderedDict
+from html.parser import HTMLParser
 from typing import List, Dict, Optional, Tuple
 import pytesseract
 from dataclasses import dataclass
 
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    tesserocr = None
+    TESSEROCR_AVAILABLE = False
+
+
+# Karakter başına tutulan en fazla alternatif sayısı
+MAX_ALTERNATIVES = 3
+
+# pytesseract hOCR çıktısına karakter kutularını ve LSTM alternatiflerini ekleyen ayarlar
+CHAR_HOCR_CONFIG = '-c hocr_char_boxes=1 -c lstm_choice_mode=2'
+
+
+@dataclass
+class CharData:
+    """Karakter düzeyinde OCR verisi
+    
+    Diziler OCRResult.text ile hizalıdır: i. satır metnin i. karakteridir.
+    Kelime arası boşlukların güveni 1.0, kutusu sıfırdır. Boş alternatif
+    ('') alternatif olmadığını gösterir.
+    """
+    boxes: np.ndarray  # (n, 4) int32: x, y, w, h
+    confidences: np.ndarray  # (n,) float32, 0-1
+    alternatives: np.ndarray  # (n, k) '<U1'
+    alternative_confidences: np.ndarray  # (n, k) float32, 0-1
+    
+    def __len__(self) -> int:
+        return len(self.confidences)
+    
+    def alternatives_at(self, index: int) -> List[Tuple[str, float]]:
+        """Karakterin alternatifleri (karakter, güven), güvene göre azalan"""
+        return [(str(char), float(conf)) for char, conf in
+                zip(self.alternatives[index], self.alternative_confidences[index]) if char]
+    
+    def uncertain_positions(self, threshold: float = 0.8) -> np.ndarray:
+        """Güveni eşiğin altındaki karakterlerin konumları"""
+        return np.flatnonzero(self.confidences < threshold)
+
 
 @dataclass
 class OCRResult:
@@ -15,6 +60,183 @@ class OCRResult:
     confidence: float
     bbox: Tuple[int, int, int, int]  # x, y, w, h
     word_confidences: List[float] = None
+    chars: Optional[CharData] = None  # yalnızca chars=True ile istenirse
+
+
+# Karakter: (karakter, güven 0-100, kutu, [(alternatif, güven 0-100), ...])
+Symbol = Tuple[str, float, Tuple[int, int, int, int], List[Tuple[str, float]]]
+
+# Kelime: (metin, güven 0-100, kutu, karakterler)
+Word = Tuple[str, float, Tuple[int, int, int, int], List[Symbol]]
+
+
+def _split_word(text: str, confidence: float, bbox: Tuple[int, int, int, int]) -> List[Symbol]:
+    """Karakter verisi olmayan kelimeyi eşit genişlikli karakterlere böl"""
+    x, y, w, h = bbox
+    edges = np.linspace(x, x + w, len(text) + 1).astype(int)
+    return [(char, confidence, (int(edges[i]), y, int(edges[i + 1] - edges[i]), h), [])
+            for i, char in enumerate(text)]
+
+
+def _char_data_from_words(words: List[Word], top_k: int = MAX_ALTERNATIVES) -> CharData:
+    """Kelimelerin karakter verisini ' ' ile birleştirilmiş metne hizalı dizilere yaz"""
+    count = sum(len(text) for text, _, _, _ in words) + max(len(words) - 1, 0)
+    boxes = np.zeros((count, 4), dtype=np.int32)
+    confidences = np.ones(count, dtype=np.float32)
+    alternatives = np.full((count, top_k), '', dtype='<U1')
+    alternative_confidences = np.zeros((count, top_k), dtype=np.float32)
+    
+    i = 0
+    for word_index, (text, word_conf, bbox, symbols) in enumerate(words):
+        if word_index:
+            i += 1  # kelime arası boşluk
+        if len(symbols) != len(text):
+            # Karakterler metinle eşleşmiyorsa kelime güveni kullanılır
+            symbols = _split_word(text, word_conf, bbox)
+        
+        for char, conf, box, choices in symbols:
+            boxes[i] = box
+            confidences[i] = conf / 100.0
+            choices = sorted((choice for choice in choices if choice[0] and choice[0] != char),
+                             key=lambda choice: -choice[1])[:top_k]
+            for j, (alternative, alternative_conf) in enumerate(choices):
+                alternatives[i, j] = alternative
+                alternative_confidences[i, j] = alternative_conf / 100.0
+            i += 1
+    
+    return CharData(boxes, confidences, alternatives, alternative_confidences)
+
+
+def _result_from_words(words: List[Word]) -> OCRResult:
+    """Karakter verili kelimelerden sonuç oluştur"""
+    words = [(text.strip(), conf, bbox, symbols) for text, conf, bbox, symbols in words
+             if text.strip() and conf > 0]
+    data = {
+        'text': [text for text, _, _, _ in words],
+        'conf': [conf for _, conf, _, _ in words],
+        'left': [bbox[0] for _, _, bbox, _ in words],
+        'top': [bbox[1] for _, _, bbox, _ in words],
+        'width': [bbox[2] for _, _, bbox, _ in words],
+        'height': [bbox[3] for _, _, bbox, _ in words],
+    }
+    result = _result_from_data(data)
+    result.chars = _char_data_from_words(words)
+    return result
+
+
+_HOCR_BBOX = re.compile(r'(?:bbox|x_bboxes)\s+(-?\d+)\s+(-?\d+)\s+(-?\d+)\s+(-?\d+)')
+_HOCR_CONF = re.compile(r'(?:x_wconf|x_conf|x_confs)\s+(-?[\d.]+)')
+
+
+def _hocr_bbox(title: str) -> Optional[Tuple[int, int, int, int]]:
+    match = _HOCR_BBOX.search(title)
+    if not match:
+        return None
+    x1, y1, x2, y2 = map(int, match.groups())
+    return (x1, y1, x2 - x1, y2 - y1)
+
+
+def _hocr_conf(title: str) -> float:
+    match = _HOCR_CONF.search(title)
+    return float(match.group(1)) if match else 0.0
+
+
+class _HocrParser(HTMLParser):
+    """Tesseract hOCR çıktısından kelimeleri, karakter kutularını ve alternatifleri oku
+    
+    hocr_char_boxes=1 her karakteri 'ocrx_cinfo' (x_bboxes, x_conf), lstm_choice_mode=2
+    her zaman adımının alternatiflerini 'ocr_glyph' (x_confs) öğeleri olarak yazar.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.words: List[Word] = []
+        self._stack: List[Optional[str]] = []
+        self._word = None  # [metin, güven, kutu, karakterler, alternatif grupları]
+        self._glyph: Optional[List] = None
+    
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get('class') or '').split()
+        title = attrs.get('title') or ''
+        role = None
+        
+        if 'ocrx_word' in classes:
+            self._word = ['', _hocr_conf(title), _hocr_bbox(title) or (0, 0, 0, 0), [], []]
+            role = 'word'
+        elif self._word is not None and 'ocr_glyph' in classes:
+            if self._stack_role('choices') is None:
+                self._word[4].append([])
+            self._glyph = ['', _hocr_conf(title)]
+            role = 'glyph'
+        elif self._word is not None and 'ocrx_cinfo' in classes and 'x_bboxes' in title:
+            self._word[3].append(['', _hocr_conf(title), _hocr_bbox(title)])
+            role = 'symbol'
+        elif self._word is not None and ('ocrx_cinfo' in classes or 'ocr_symbol' in classes):
+            # Bir karakterin alternatif grubu
+            self._word[4].append([])
+            role = 'choices'
+        
+        self._stack.append(role)
+    
+    def _stack_role(self, role: str) -> Optional[int]:
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index] == role:
+                return index
+        return None
+    
+    def handle_endtag(self, tag):
+        if not self._stack:
+            return
+        role = self._stack.pop()
+        if role == 'glyph' and self._glyph is not None:
+            if self._glyph[0]:
+                self._word[4][-1].append((self._glyph[0], self._glyph[1]))
+            self._glyph = None
+        elif role == 'word':
+            self._finish_word()
+    
+    def handle_data(self, data):
+        if self._word is None:
+            return
+        if self._glyph is not None:
+            self._glyph[0] += data.strip()
+        elif self._stack and self._stack[-1] == 'symbol':
+            self._word[3][-1][0] += data.strip()
+        elif self._stack_role('symbol') is None and self._stack_role('choices') is None:
+            self._word[0] += data
+    
+    def _finish_word(self):
+        text, conf, bbox, symbols, groups = self._word
+        self._word = None
+        
+        symbols = [symbol for symbol in symbols if symbol[0]]
+        if symbols:
+            text = ''.join(char for char, _, _ in symbols)
+        groups = [group for group in groups if group]
+        
+        # Alternatif gruplarını sırayla, en olası seçimi karakterle aynı olanla eşle
+        result: List[Symbol] = []
+        group_index = 0
+        for char, char_conf, char_bbox in symbols:
+            choices = []
+            for index in range(group_index, len(groups)):
+                best = max(groups[index], key=lambda choice: choice[1])
+                if best[0] == char:
+                    choices = groups[index]
+                    group_index = index + 1
+                    break
+            result.append((char, char_conf, char_bbox, choices))
+        
+        self.words.append((text.strip(), conf, bbox, result))
+
+
+def parse_hocr_words(hocr: str) -> List[Word]:
+    """hOCR metnini karakter verili kelimelere ayrıştır"""
+    parser = _HocrParser()
+    parser.feed(hocr)
+    parser.close()
+    return parser.words
 
 
 class TesseractOCR:
@@ -33,119 +255,465 @@ class TesseractOCR:
             print(f"Tesseract OCR hatası: {e}")
             return ""
     
-    def extract_text_with_confidence(self, image: np.ndarray, config: str = '--psm 6') -> OCRResult:
-        """Güven skoru ile metin çıkar"""
+    def _image_to_data(self, image: np.ndarray, config: str = '--psm 6') -> Dict[str, list]:
+        """Kelime düzeyinde OCR verisi (pytesseract Output.DICT biçiminde)"""
+        return pytesseract.image_to_data(image, config=config, output_type=pytesseract.Output.DICT)
+    
+    def _image_to_words(self, image: np.ndarray, config: str = '--psm 6') -> List[Word]:
+        """Karakter kutuları, güvenleri ve alternatifleriyle kelimeler (hOCR üzerinden)"""
+        hocr = pytesseract.image_to_pdf_or_hocr(image, extension='hocr',
+                                                config=f'{config} {CHAR_HOCR_CONFIG}')
+        return parse_hocr_words(hocr.decode('utf-8'))
+    
+    def extract_text_with_confidence(self, image: np.ndarray, config: str = '--psm 6',
+                                     chars: bool = False) -> OCRResult:
+        """Güven skoru ile metin çıkar
+        
+        chars=True ise sonuç karakter düzeyinde güven ve alternatifleri de içerir.
+        """
         try:
-            # Metin ve güven skorları
-            data = pytesseract.image_to_data(image, config=config, output_type=pytesseract.Output.DICT)
+            if chars:
+                return _result_from_words(self._image_to_words(image, config))
             
-            # Geçerli kelimeleri filtrele
-            words = []
-            confidences = []
-            bboxes = []
-            
-            for i in range(len(data['text'])):
-                text = data['text'][i].strip()
-                conf = int(data['conf'][i])
-                
-                if text and conf > 0:
-                    words.append(text)
-                    confidences.append(conf / 100.0)  # 0-1 aralığına çevir
-                    
-                    # Bounding box
-                    x, y, w, h = data['left'][i], data['top'][i], data['width'][i], data['height'][i]
-                    bboxes.append((x, y, w, h))
-            
-            # Tüm metni birleştir
-            full_text = ' '.join(words)
-            
-            # Ortalama güven skoru
-            avg_confidence = np.mean(confidences) if confidences else 0.0
-            
-            # Genel bounding box
-            if bboxes:
-                x_min = min(bbox[0] for bbox in bboxes)
-                y_min = min(bbox[1] for bbox in bboxes)
-                x_max = max(bbox[0] + bbox[2] for bbox in bboxes)
-                y_max = max(bbox[1] + bbox[3] for bbox in bboxes)
-                general_bbox = (x_min, y_min, x_max - x_min, y_max - y_min)
-            else:
-                general_bbox = (0, 0, 0, 0)
-            
-            return OCRResult(
-                text=full_text,
-                confidence=avg_confidence,
-                bbox=general_bbox,
-                word_confidences=confidences
-            )
+            # Metin ve güven skorları
+            data = self._image_to_data(image, config)
+            return _result_from_data(data)
             
         except Exception as e:
             print(f"Tesseract OCR hatası: {e}")
             return OCRResult("", 0.0, (0, 0, 0, 0))
     
+    def extract_text_with_confidence_batch(self, images: List[np.ndarray],
+                                           config: str = '--psm 6') -> List[OCRResult]:
+        """Birden fazla görüntüyü mozaik halinde tek OCR çağrısıyla işle
+        
+        Sonuçlar giriş sırasıyla döner, bounding box'lar her görüntünün kendi
+        koordinatlarına göredir.
+        """
+        results = [OCRResult("", 0.0, (0, 0, 0, 0)) for _ in images]
+        
+        for mosaic, placements in pack_mosaics(images):
+            try:
+                data = self._image_to_data(mosaic, config)
+            except Exception as e:
+                print(f"Tesseract OCR hatası: {e}")
+                continue
+            
+            for index, item_data in split_mosaic_data(data, placements, images):
+                results[index] = _result_from_data(item_data)
+        
+        return results
+    
     def extract_text_regions(self, image: np.ndarray) -> List[OCRResult]:
         """Metin bölgelerini çıkar"""
         try:
             # Metin bölgelerini tespit et
-            data = pytesseract.image_to_data(image, config='--psm 6', output_type=pytesseract.Output.DICT)
-            
-            results = []
-            current_text = ""
-            current_confidences = []
-            current_bbox = None
-            
-            for i in range(len(data['text'])):
-                text = data['text'][i].strip()
-                conf = int(data['conf'][i])
-                
-                if text and conf > 0:
-                    x, y, w, h = data['left'][i], data['top'][i], data['width'][i], data['height'][i]
-                    
-                    if current_bbox is None:
-                        current_bbox = (x, y, w, h)
-                        current_text = text
-                        current_confidences = [conf / 100.0]
-                    else:
-                        # Aynı satırda mı kontrol et
-                        if abs(y - current_bbox[1]) < 10:  # 10 piksel tolerans
-                            current_text += " " + text
-                            current_confidences.append(conf / 100.0)
-                            # Bounding box'ı genişlet
-                            current_bbox = (
-                                min(current_bbox[0], x),
-                                min(current_bbox[1], y),
-                                max(current_bbox[0] + current_bbox[2], x + w) - min(current_bbox[0], x),
-                                max(current_bbox[1] + current_bbox[3], y + h) - min(current_bbox[1], y)
-                            )
-                        else:
-                            # Yeni satır, önceki sonucu kaydet
-                            if current_text:
-                                results.append(OCRResult(
-                                    text=current_text,
-                                    confidence=np.mean(current_confidences),
-                                    bbox=current_bbox,
-                                    word_confidences=current_confidences
-                                ))
-                            
-                            # Yeni satır başlat
-                            current_text = text
-                            current_confidences = [conf / 100.0]
-                            current_bbox = (x, y, w, h)
+            data = self._image_to_data(image, '--psm 6')
+            return _regions_from_data(data)
             
-            # Son sonucu kaydet
-            if current_text:
-                results.append(OCRResult(
-                    text=current_text,
-                    confidence=np.mean(current_confidences),
-                    bbox=current_bbox,
-                    word_confidences=current_confidences
-                ))
+        except Exception as e:
+            print(f"Tesseract OCR hatası: {e}")
+            return []
+
+
+def _result_from_data(data: Dict[str, list]) -> OCRResult:
+    """Kelime düzeyindeki OCR verisinden tek bir sonuç oluştur"""
+    # Geçerli kelimeleri filtrele
+    words = []
+    confidences = []
+    bboxes = []
+    
+    for i in range(len(data['text'])):
+        text = data['text'][i].strip()
+        conf = float(data['conf'][i])
+        
+        if text and conf > 0:
+            words.append(text)
+            confidences.append(conf / 100.0)  # 0-1 aralığına çevir
             
-            return results
+            # Bounding box
+            x, y, w, h = data['left'][i], data['top'][i], data['width'][i], data['height'][i]
+            bboxes.append((x, y, w, h))
+    
+    # Tüm metni birleştir
+    full_text = ' '.join(words)
+    
+    # Ortalama güven skoru
+    avg_confidence = np.mean(confidences) if confidences else 0.0
+    
+    # Genel bounding box
+    if bboxes:
+        x_min = min(bbox[0] for bbox in bboxes)
+        y_min = min(bbox[1] for bbox in bboxes)
+        x_max = max(bbox[0] + bbox[2] for bbox in bboxes)
+        y_max = max(bbox[1] + bbox[3] for bbox in bboxes)
+        general_bbox = (x_min, y_min, x_max - x_min, y_max - y_min)
+    else:
+        general_bbox = (0, 0, 0, 0)
+    
+    return OCRResult(
+        text=full_text,
+        confidence=avg_confidence,
+        bbox=general_bbox,
+        word_confidences=confidences
+    )
+
+
+def _regions_from_data(data: Dict[str, list]) -> List[OCRResult]:
+    """Kelime düzeyindeki OCR verisini satırlara grupla"""
+    results = []
+    current_text = ""
+    current_confidences = []
+    current_bbox = None
+    
+    for i in range(len(data['text'])):
+        text = data['text'][i].strip()
+        conf = float(data['conf'][i])
+        
+        if text and conf > 0:
+            x, y, w, h = data['left'][i], data['top'][i], data['width'][i], data['height'][i]
             
+            if current_bbox is None:
+                current_bbox = (x, y, w, h)
+                current_text = text
+                current_confidences = [conf / 100.0]
+            else:
+                # Aynı satırda mı kontrol et
+                if abs(y - current_bbox[1]) < 10:  # 10 piksel tolerans
+                    current_text += " " + text
+                    current_confidences.append(conf / 100.0)
+                    # Bounding box'ı genişlet
+                    current_bbox = (
+                        min(current_bbox[0], x),
+                        min(current_bbox[1], y),
+                        max(current_bbox[0] + current_bbox[2], x + w) - min(current_bbox[0], x),
+                        max(current_bbox[1] + current_bbox[3], y + h) - min(current_bbox[1], y)
+                    )
+                else:
+                    # Yeni satır, önceki sonucu kaydet
+                    if current_text:
+                        results.append(OCRResult(
+                            text=current_text,
+                            confidence=np.mean(current_confidences),
+                            bbox=current_bbox,
+                            word_confidences=current_confidences
+                        ))
+                    
+                    # Yeni satır başlat
+                    current_text = text
+                    current_confidences = [conf / 100.0]
+                    current_bbox = (x, y, w, h)
+    
+    # Son sonucu kaydet
+    if current_text:
+        results.append(OCRResult(
+            text=current_text,
+            confidence=np.mean(current_confidences),
+            bbox=current_bbox,
+            word_confidences=current_confidences
+        ))
+    
+    return results
+
+
+# Mozaik yerleşimi: (görüntü indeksi, mozaikteki y ofseti)
+Placement = Tuple[int, int]
+
+# Mozaikte görüntüler arasında bırakılan beyaz boşluk (piksel)
+MOSAIC_PADDING = 20
+
+
+def pack_mosaics(images: List[np.ndarray], padding: int = MOSAIC_PADDING,
+                 max_height: int = 4000) -> List[Tuple[np.ndarray, List[Placement]]]:
+    """Küçük görüntüleri dikey olarak beyaz boşluklu mozaiklere yerleştir
+    
+    Yüksekliği max_height'ı aşan görüntüler kendi mozaiklerine konur.
+    """
+    if not images:
+        return []
+    
+    color = any(len(image.shape) == 3 for image in images)
+    
+    # Görüntüleri mozaik gruplarına böl
+    groups: List[List[int]] = []
+    current: List[int] = []
+    current_height = padding
+    for index, image in enumerate(images):
+        if image.size == 0:
+            continue
+        height = image.shape[0] + padding
+        if current and current_height + height > max_height:
+            groups.append(current)
+            current = []
+            current_height = padding
+        current.append(index)
+        current_height += height
+    if current:
+        groups.append(current)
+    
+    mosaics = []
+    for group in groups:
+        width = max(images[i].shape[1] for i in group) + 2 * padding
+        height = sum(images[i].shape[0] + padding for i in group) + padding
+        shape = (height, width, 3) if color else (height, width)
+        mosaic = np.full(shape, 255, dtype=np.uint8)
+        
+        placements = []
+        y = padding
+        for index in group:
+            image = images[index]
+            if color and len(image.shape) == 2:
+                image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+            h, w = image.shape[:2]
+            mosaic[y:y + h, padding:padding + w] = image
+            placements.append((index, y))
+            y += h + padding
+        
+        mosaics.append((mosaic, placements))
+    
+    return mosaics
+
+
+def split_mosaic_data(data: Dict[str, list], placements: List[Placement],
+                      images: List[np.ndarray], padding: int = MOSAIC_PADDING) -> List[Tuple[int, Dict[str, list]]]:
+    """Mozaik OCR verisini kaynak görüntülere dağıt ve koordinatları düzelt
+    
+    Her kelime, dikey merkezinin düştüğü görüntüye atanır; boşluklara düşen
+    kelimeler atılır.
+    """
+    keys = ('text', 'conf', 'left', 'top', 'width', 'height')
+    offsets = [y for _, y in placements]
+    per_image = [{key: [] for key in keys} for _ in placements]
+    
+    for i in range(len(data['text'])):
+        center_y = data['top'][i] + data['height'][i] / 2
+        slot = bisect.bisect_right(offsets, center_y) - 1
+        if slot < 0:
+            continue
+        
+        index, y_offset = placements[slot]
+        h, w = images[index].shape[:2]
+        if center_y >= y_offset + h:
+            continue
+        
+        # Koordinatları kaynak görüntüye göre ayarla ve sınırla
+        left = max(0, data['left'][i] - padding)
+        top = max(0, data['top'][i] - y_offset)
+        item = per_image[slot]
+        item['text'].append(data['text'][i])
+        item['conf'].append(data['conf'][i])
+        item['left'].append(left)
+        item['top'].append(top)
+        item['width'].append(min(data['width'][i], w - left))
+        item['height'].append(min(data['height'][i], h - top))
+    
+    return [(placements[slot][0], per_image[slot]) for slot in range(len(placements))]
+
+
+def parse_tesseract_config(config: str) -> Tuple[Optional[int], Optional[int], Dict[str, str]]:
+    """Tesseract komut satırı ayarlarını (psm, oem, -c değişkenleri) ayrıştır"""
+    psm = None
+    oem = None
+    variables = {}
+    
+    tokens = config.split()
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token == '--psm' and i + 1 < len(tokens):
+            psm = int(tokens[i + 1])
+            i += 1
+        elif token == '--oem' and i + 1 < len(tokens):
+            oem = int(tokens[i + 1])
+            i += 1
+        elif token == '-c' and i + 1 < len(tokens) and '=' in tokens[i + 1]:
+            key, value = tokens[i + 1].split('=', 1)
+            variables[key] = value
+            i += 1
+        i += 1
+    
+    return psm, oem, variables
+
+
+# Görüntünün tek satır/kelime olduğunu varsayan sayfa bölütleme modları;
+# dikey mozaikteki birden çok satır bu modlarla birleşik ya da bozuk okunur
+SINGLE_LINE_PSMS = (7, 8, 13)
+
+
+def is_single_line_config(config: str) -> bool:
+    """Tesseract ayarı tek satırlık bir psm kullanıyor mu (mozaikle okunamaz)"""
+    return parse_tesseract_config(config)[0] in SINGLE_LINE_PSMS
+
+
+class TesseractAPIOCR(TesseractOCR):
+    """Kalıcı Tesseract motoru (tesserocr / C API)
+    
+    Motor her iş parçacığı ve ayar kombinasyonu için bir kez yüklenir ve
+    close() çağrılana kadar sıcak tutulur; iş parçacığı başına en fazla
+    max_apis motor tutulur, en az kullanılan kapatılır. Görüntü geçici
+    dosyaya yazılmadan, NumPy bellek içeriği doğrudan motora verilir.
+    """
+    
+    # SetImageBytes bytes'a çevirmeden bellek arabelleği kabul ediyor mu
+    _buffer_input = True
+    
+    def __init__(self, tessdata_path: Optional[str] = None, lang: str = 'eng', max_apis: int = 4):
+        if not TESSEROCR_AVAILABLE:
+            raise ImportError("tesserocr yüklü değil")
+        
+        self.tessdata_path = tessdata_path
+        self.lang = lang
+        self.max_apis = max(1, max_apis)
+        # PyTessBaseAPI iş parçacığı güvenli değil, her iş parçacığı kendi motorunu kullanır
+        self._local = threading.local()
+        # Tüm iş parçacıklarındaki açık motorlar (close için), close'ta nesil artar
+        self._open_apis: Dict[int, object] = {}
+        self._apis_lock = threading.Lock()
+        self._generation = 0
+    
+    def _get_api(self, config: str):
+        """Bu iş parçacığı ve ayar için sıcak motoru al"""
+        apis = getattr(self._local, 'apis', None)
+        if apis is None or self._local.generation != self._generation:
+            apis = OrderedDict()
+            self._local.apis = apis
+            self._local.generation = self._generation
+        
+        api = apis.get(config)
+        if api is not None:
+            apis.move_to_end(config)
+            return api
+        
+        psm, oem, variables = parse_tesseract_config(config)
+        kwargs = {'lang': self.lang, 'variables': variables}
+        if self.tessdata_path:
+            kwargs['path'] = self.tessdata_path
+        if psm is not None:
+            kwargs['psm'] = psm
+        if oem is not None:
+            kwargs['oem'] = oem
+        api = tesserocr.PyTessBaseAPI(**kwargs)
+        apis[config] = api
+        with self._apis_lock:
+            self._open_apis[id(api)] = api
+        
+        while len(apis) > self.max_apis:
+            _, oldest = apis.popitem(last=False)
+            self._end_api(oldest)
+        
+        return api
+    
+    def _end_api(self, api):
+        """Motoru kapat (close ile zaten kapatıldıysa bir şey yapma)"""
+        with self._apis_lock:
+            if self._open_apis.pop(id(api), None) is None:
+                return
+        api.End()
+    
+    def close(self):
+        """Tüm iş parçacıklarının motorlarını kapat
+        
+        Motorları kullanan iş parçacıkları bittikten sonra çağrılmalıdır;
+        sonraki okumalarda motorlar yeniden yüklenir.
+        """
+        with self._apis_lock:
+            apis = list(self._open_apis.values())
+            self._open_apis.clear()
+            self._generation += 1
+        for api in apis:
+            api.End()
+    
+    def _set_image(self, api, image: np.ndarray):
+        """NumPy görüntüsünü kodlamadan motora ver"""
+        if image.dtype != np.uint8:
+            image = cv2.convertScaleAbs(image)
+        if len(image.shape) == 3:
+            if image.shape[2] == 4:
+                image = cv2.cvtColor(image, cv2.COLOR_BGRA2RGB)
+            else:
+                image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        image = np.ascontiguousarray(image)
+        
+        height, width = image.shape[:2]
+        bytes_per_pixel = 1 if len(image.shape) == 2 else image.shape[2]
+        # Tesseract görüntüyü kendi Pix'ine kopyalar; tobytes() ile ikinci bir kopya yapılmaz
+        if self._buffer_input:
+            try:
+                api.SetImageBytes(image.data, width, height, bytes_per_pixel, image.strides[0])
+                return
+            except TypeError:
+                # Yalnızca bytes kabul eden tesserocr sürümleri
+                TesseractAPIOCR._buffer_input = False
+        api.SetImageBytes(image.tobytes(), width, height, bytes_per_pixel, image.strides[0])
+    
+    def extract_text(self, image: np.ndarray, config: str = '--psm 6') -> str:
+        """Metin çıkar"""
+        try:
+            api = self._get_api(config)
+            self._set_image(api, image)
+            return api.GetUTF8Text().strip()
         except Exception as e:
             print(f"Tesseract OCR hatası: {e}")
-            return []
+            return ""
+    
+    def _image_to_data(self, image: np.ndarray, config: str = '--psm 6') -> Dict[str, list]:
+        """Kelime düzeyinde OCR verisi (pytesseract Output.DICT biçiminde)"""
+        api = self._get_api(config)
+        self._set_image(api, image)
+        api.Recognize()
+        
+        data = {'text': [], 'conf': [], 'left': [], 'top': [], 'width': [], 'height': []}
+        level = tesserocr.RIL.WORD
+        iterator = api.GetIterator()
+        if iterator is None:
+            return data
+        
+        for word in tesserocr.iterate_level(iterator, level):
+            text = word.GetUTF8Text(level)
+            bbox = word.BoundingBox(level)
+            if not text or bbox is None:
+                continue
+            x1, y1, x2, y2 = bbox
+            data['text'].append(text)
+            data['conf'].append(word.Confidence(level))
+            data['left'].append(x1)
+            data['top'].append(y1)
+            data['width'].append(x2 - x1)
+            data['height'].append(y2 - y1)
+        
+        return data
+    
+    def _image_to_words(self, image: np.ndarray, config: str = '--psm 6') -> List[Word]:
+        """Karakter kutuları, güvenleri ve alternatifleriyle kelimeler (sembol yineleyicisi)"""
+        api = self._get_api(config)
+        self._set_image(api, image)
+        api.Recognize()
+        
+        words: List[Word] = []
+        iterator = api.GetIterator()
+        if iterator is None:
+            return words
+        
+        level = tesserocr.RIL.SYMBOL
+        for symbol in tesserocr.iterate_level(iterator, level):
+            if symbol.IsAtBeginningOf(tesserocr.RIL.WORD) or not words:
+                bbox = symbol.BoundingBox(tesserocr.RIL.WORD)
+                if bbox is None:
+                    continue
+                x1, y1, x2, y2 = bbox
+                words.append(['', symbol.Confidence(tesserocr.RIL.WORD), (x1, y1, x2 - x1, y2 - y1), []])
+            
+            text = symbol.GetUTF8Text(level)
+            bbox = symbol.BoundingBox(level)
+            if not text or bbox is None:
+                continue
+            x1, y1, x2, y2 = bbox
+            choices = [(choice.GetUTF8Text(), choice.Confidence())
+                       for choice in symbol.GetChoiceIterator()]
+            words[-1][0] += text
+            words[-1][3].append((text, symbol.Confidence(level), (x1, y1, x2 - x1, y2 - y1), choices))
+        
+        return [tuple(word) for word in words]
 
 
 class PaddleOCR:
@@ -153,6 +721,8 @@ class PaddleOCR:
     
     def __init__(self):
         self.available = False
+        # PaddleOCR tahmin motoru iş parçacığı güvenli değil
+        self._lock = threading.Lock()
         try:
             from paddleocr import PaddleOCR
             self.ocr = PaddleOCR(use_angle_cls=True, lang='en')
@@ -166,7 +736,8 @@ class PaddleOCR:
             return ""
         
         try:
-            result = self.ocr.ocr(image, cls=True)
+            with self._lock:
+                result = self.ocr.ocr(image, cls=True)
             if result and result[0]:
                 texts = [line[1][0] for line in result[0]]
                 return ' '.join(texts)
@@ -175,13 +746,19 @@ class PaddleOCR:
             print(f"PaddleOCR hatası: {e}")
             return ""
     
-    def extract_text_with_confidence(self, image: np.ndarray) -> OCRResult:
-        """Güven skoru ile metin çıkar"""
+    def extract_text_with_confidence(self, image: np.ndarray, chars: bool = False) -> OCRResult:
+        """Güven skoru ile metin çıkar
+        
+        PaddleOCR tanıyıcısı karakter olasılıklarını dışarı vermez; chars=True ise
+        satır güveni ve satır kutusunun eşit bölünmesiyle yaklaşık karakter
+        verisi üretilir.
+        """
         if not self.available:
             return OCRResult("", 0.0, (0, 0, 0, 0))
         
         try:
-            result = self.ocr.ocr(image, cls=True)
+            with self._lock:
+                result = self.ocr.ocr(image, cls=True)
             if result and result[0]:
                 texts = []
                 confidences = []
@@ -217,7 +794,10 @@ class PaddleOCR:
                     text=full_text,
                     confidence=avg_confidence,
                     bbox=general_bbox,
-                    word_confidences=confidences
+                    word_confidences=confidences,
+                    chars=_char_data_from_words([
+                        (text, conf * 100, bbox, []) for text, conf, bbox in zip(texts, confidences, bboxes)
+                    ]) if chars else None
                 )
             
             return OCRResult("", 0.0, (0, 0, 0, 0))
@@ -225,6 +805,45 @@ class PaddleOCR:
         except Exception as e:
             print(f"PaddleOCR hatası: {e}")
             return OCRResult("", 0.0, (0, 0, 0, 0))
+    
+    def extract_text_with_confidence_batch(self, images: List[np.ndarray]) -> List[OCRResult]:
+        """Birden fazla görüntüyü mozaik halinde tek model çağrısıyla işle
+        
+        Tek tespit geçişi yapılır ve tanıyıcı tüm satırları toplu (batch) işler.
+        """
+        results = [OCRResult("", 0.0, (0, 0, 0, 0)) for _ in images]
+        if not self.available:
+            return results
+        
+        for mosaic, placements in pack_mosaics(images):
+            try:
+                with self._lock:
+                    result = self.ocr.ocr(mosaic, cls=True)
+            except Exception as e:
+                print(f"PaddleOCR hatası: {e}")
+                continue
+            
+            data = self._lines_to_data(result[0] if result and result[0] else [])
+            for index, item_data in split_mosaic_data(data, placements, images):
+                results[index] = _result_from_data(item_data)
+        
+        return results
+    
+    @staticmethod
+    def _lines_to_data(lines) -> Dict[str, list]:
+        """PaddleOCR satırlarını kelime verisi biçimine çevir"""
+        data = {'text': [], 'conf': [], 'left': [], 'top': [], 'width': [], 'height': []}
+        for bbox, (text, conf) in lines:
+            x_coords = [point[0] for point in bbox]
+            y_coords = [point[1] for point in bbox]
+            x, y = min(x_coords), min(y_coords)
+            data['text'].append(text)
+            data['conf'].append(conf * 100)
+            data['left'].append(int(x))
+            data['top'].append(int(y))
+            data['width'].append(int(max(x_coords) - x))
+            data['height'].append(int(max(y_coords) - y))
+        return data
 
 
 class OCRManager:
@@ -235,6 +854,12 @@ class OCRManager:
         
         if self.ocr_type == 'tesseract':
             self.ocr = TesseractOCR(tesseract_path)
+        elif self.ocr_type == 'tesseract_api':
+            if TESSEROCR_AVAILABLE:
+                self.ocr = TesseractAPIOCR()
+            else:
+                print("tesserocr yüklü değil. pytesseract kullanılacak.")
+                self.ocr = TesseractOCR(tesseract_path)
         elif self.ocr_type == 'paddle':
             self.ocr = PaddleOCR()
         else:
@@ -242,21 +867,35 @@ class OCRManager:
     
     def extract_text(self, image: np.ndarray, config: str = '--psm 6') -> str:
         """Metin çıkar"""
-        if self.ocr_type == 'tesseract':
+        if isinstance(self.ocr, TesseractOCR):
             return self.ocr.extract_text(image, config)
         else:
             return self.ocr.extract_text(image)
     
-    def extract_text_with_confidence(self, image: np.ndarray, config: str = '--psm 6') -> OCRResult:
-        """Güven skoru ile metin çıkar"""
-        if self.ocr_type == 'tesseract':
-            return self.ocr.extract_text_with_confidence(image, config)
+    def extract_text_with_confidence(self, image: np.ndarray, config: str = '--psm 6',
+                                     chars: bool = False) -> OCRResult:
+        """Güven skoru ile metin çıkar (chars=True: karakter düzeyinde veri de döner)"""
+        if isinstance(self.ocr, TesseractOCR):
+            return self.ocr.extract_text_with_confidence(image, config, chars=chars)
+        else:
+            return self.ocr.extract_text_with_confidence(image, chars=chars)
+    
+    def extract_text_with_confidence_batch(self, images: List[np.ndarray],
+                                           config: str = '--psm 6') -> List[OCRResult]:
+        """Birden fazla görüntüden güven skoru ile metin çıkar"""
+        if isinstance(self.ocr, TesseractOCR):
+            return self.ocr.extract_text_with_confidence_batch(images, config)
         else:
-            return self.ocr.extract_text_with_confidence(image)
+            return self.ocr.extract_text_with_confidence_batch(images)
+    
+    def close(self):
+        """Kalıcı OCR motorlarını kapat"""
+        if isinstance(self.ocr, TesseractAPIOCR):
+            self.ocr.close()
     
     def extract_text_regions(self, image: np.ndarray) -> List[OCRResult]:
         """Metin bölgelerini çıkar"""
-        if self.ocr_type == 'tesseract':
+        if isinstance(self.ocr, TesseractOCR):
             return self.ocr.extract_text_regions(image)
         else:
             # PaddleOCR için basit implementasyon
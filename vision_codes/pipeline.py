@@ -3,13 +3,39 @@ Ana pipeline modülü - detect -> crop -> recognize
 """
 import cv2
 import numpy as np
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from .lexicon import RenaultDaciaLexicon, CodeInfo
-from .preprocess import ImagePreprocessor
+from .preprocess import ImagePreprocessor, PREPROCESS_VARIANTS
 from .detector import ROIDetector, BoundingBox
-from .ocr import OCRManager, OCRResult
+from .ocr import OCRManager, OCRResult, CharData, is_single_line_config
+from .vin import validate_vin_check_digit
+from .change import FrameChangeGate
+from .correction import correct_vin_in_text
+from .profiles import OCRProfile, select_profile
+
+
+# Profiller kapalıyken kullanılan Tesseract ayarı
+DEFAULT_OCR_CONFIG = '--psm 6'
+
+# Ön işleme modları -> ImagePreprocessor yöntemi
+PREPROCESS_MODES = {
+    'full': 'preprocess_for_ocr',  # renkli, aşama aşama
+    'fast': 'preprocess_for_ocr_fast',  # gri tonlamada birleşik, tampon bellekli
+    'adaptive': 'preprocess_for_ocr_adaptive',  # yalnızca gereken aşamalar, düşük güvende 'full'
+    'variants': 'preprocess_variants',  # birden çok varyant eşzamanlı okunur, en iyisi tutulur
+}
+
+# Eğim düzeltme modları
+DESKEW_MODES = (
+    'roi',  # her ROI tam çözünürlükte Hough çizgileriyle
+    'fast',  # her ROI küçültülmüş kopyada izdüşüm profiliyle
+    'frame',  # karede bir kez izdüşüm profiliyle, tüm ROI'lere aktarılır
+)
 
 
 @dataclass
@@ -27,8 +53,36 @@ class DetectionResult:
 class VisionPipeline:
     """Ana görsel işleme pipeline'ı"""
     
-    def __init__(self, ocr_type: str = 'tesseract', tesseract_path: Optional[str] = None):
-        self.lexicon = RenaultDaciaLexicon()
+    def __init__(self, ocr_type: str = 'tesseract', tesseract_path: Optional[str] = None,
+                 roi_workers: int = 0, ocr_batch: bool = False,
+                 change_threshold: Optional[float] = None,
+                 lexicon_path: Optional[str] = None, fuzzy_index: str = 'matrix',
+                 ocr_profiles: bool = False,
+                 preprocess_mode: str = 'full', deskew_mode: str = 'roi'):
+        """
+        roi_workers: ROI'leri eşzamanlı işleyen iş parçacığı sayısı.
+            0 veya 1 sıralı çalışır, None çekirdek sayısı kadar iş parçacığı kullanır.
+        ocr_batch: Tüm ROI'leri tek bir toplu OCR çağrısıyla (mozaik) tanı.
+        change_threshold: Verilirse kare, son işlenen kareden bu eşik (0-1) kadar
+            farklı değilse pipeline çalıştırılmaz ve son sonuçlar döndürülür.
+            Aynı kameradan gelen ardışık kareler içindir.
+        lexicon_path: Derlenmiş (.vclx) veya CSV/JSON sözlük dosyası (varsayılan: yerleşik kodlar).
+        fuzzy_index: Bulanık eşleşme indeksi ('matrix' veya büyük sözlükler için 'bktree').
+        ocr_profiles: ROI geometrisine göre OCR profili (vin_line, code_block, full_page)
+            seç; False (varsayılan) ise tüm ROI'ler '--psm 6' ile okunur.
+        preprocess_mode: ROI ön işleme modu ('full', 'fast', 'adaptive' veya 'variants',
+            bkz. PREPROCESS_MODES).
+        deskew_mode: Eğim düzeltme modu (bkz. DESKEW_MODES). 'frame' kamera
+            eğiminin tüm karede aynı olduğunu varsayar.
+        """
+        if preprocess_mode not in PREPROCESS_MODES:
+            raise ValueError(f"Bilinmeyen ön işleme modu: {preprocess_mode}")
+        if deskew_mode not in DESKEW_MODES:
+            raise ValueError(f"Bilinmeyen eğim düzeltme modu: {deskew_mode}")
+        self.preprocess_mode = preprocess_mode
+        self.deskew_mode = deskew_mode
+        
+        self.lexicon = RenaultDaciaLexicon(fuzzy_index=fuzzy_index, path=lexicon_path)
         self.preprocessor = ImagePreprocessor()
         self.detector = ROIDetector()
         self.ocr = OCRManager(ocr_type, tesseract_path)
@@ -36,52 +90,405 @@ class VisionPipeline:
         # Pipeline parametreleri
         self.min_confidence = 0.7
         self.fuzzy_threshold = 0.8
+        
+        # Erken çıkış: ROI'ler metin olasılığı sırasıyla işlenir ve max_results
+        # doğrulanmış VIN bulununca kalanlar atlanır (toplu OCR modunda uygulanmaz)
+        self.max_results: Optional[int] = None
+        self.stop_on_confidence: Optional[float] = None  # None ise min_confidence
+        
+        # Kontrol hanesi güdümlü VIN düzeltme
+        self.vin_correction = True
+        self.max_vin_corrections = 2
+        
+        # Karakter düzeyinde OCR güveni: düzeltme yalnızca belirsiz karakterlerde dallanır
+        self.char_confidences = False
+        self.vin_lock_confidence = 0.95
+        
+        # 'adaptive' ön işlemede OCR güveni bunun altındaysa ROI tam zincirle yeniden okunur
+        self.adaptive_retry_confidence = 0.6
+        
+        # 'variants' ön işlemede okunan varyantlar (öncelik sırasıyla, bkz. PREPROCESS_VARIANTS)
+        self.variants: Tuple[str, ...] = PREPROCESS_VARIANTS
+        
+        # Toplu OCR
+        self.ocr_batch = ocr_batch
+        
+        # OCR profilleri
+        self.ocr_profiles = ocr_profiles
+        
+        # Paralel ROI işleme
+        self.roi_workers = (os.cpu_count() or 1) if roi_workers is None else roi_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._variant_executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._thread_local = threading.local()
+        
+        # Kare değişim kontrolü
+        self.change_gate = FrameChangeGate(change_threshold) if change_threshold is not None else None
+        self._last_results: Optional[List[DetectionResult]] = None
+        self.last_reused = False  # son process_image sonucu önceki kareden mi (OCR çalışmadı)
     
     def process_image(self, image: np.ndarray) -> List[DetectionResult]:
         """Görüntüyü işle ve kodları tespit et"""
+        self.last_reused = False
+        if self.change_gate is not None:
+            if not self.change_gate.changed(image) and self._last_results is not None:
+                # Sahne değişmedi, son sonuçları yeniden kullan
+                self.last_reused = True
+                return list(self._last_results)
+            
+            self._last_results = self._process_image(image)
+            return list(self._last_results)
+        
+        return self._process_image(image)
+    
+    def _process_image(self, image: np.ndarray) -> List[DetectionResult]:
+        # 1-2. ROI'leri tespit et ve kırp
+        crops = self._crop_rois(image)
+        profiles = self._select_profiles(crops, (image.shape[1], image.shape[0]))
+        
+        # 3. Her ROI için işlem yap (sonuç sırası ROI sırasıyla aynı kalır)
         results = []
+        for roi_results in self._map_rois(crops, profiles):
+            results.extend(roi_results)
+        
+        # 4. Sonuçları filtrele ve sırala
+        results = self._filter_and_rank_results(results)
+        
+        return results
+    
+    def process_images(self, images: List[np.ndarray]) -> List[List[DetectionResult]]:
+        """Birden fazla görüntüyü işle - tüm ROI'ler tek toplu OCR çağrısıyla tanınır
+        
+        Sonuçlar giriş sırasıyla, görüntü başına bir liste olarak döner.
+        """
+        crops = []
+        profiles = []
+        owners = []
+        for index, image in enumerate(images):
+            image_crops = self._crop_rois(image)
+            crops.extend(image_crops)
+            profiles.extend(self._select_profiles(image_crops, (image.shape[1], image.shape[0])))
+            owners.extend([index] * len(image_crops))
         
-        # 1. ROI'leri tespit et
+        per_image: List[List[DetectionResult]] = [[] for _ in images]
+        if crops:
+            for owner, roi_results in zip(owners, self._map_rois_batched(crops, profiles)):
+                per_image[owner].extend(roi_results)
+        
+        return [self._filter_and_rank_results(results) for results in per_image]
+    
+    def _crop_rois(self, image: np.ndarray) -> List[Tuple[np.ndarray, BoundingBox]]:
+        """ROI'leri tespit et ve kırp"""
         rois = self.detector.detect_by_contours(image)
         
         if not rois:
             # ROI bulunamazsa tüm görüntüyü kullan
             rois = [BoundingBox(0, 0, image.shape[1], image.shape[0])]
         
-        # 2. Her ROI için işlem yap
+        skew = self._frame_skew(image)
+        if skew is not None:
+            rois = [replace(roi, skew=skew) for roi in rois]
+        
+        crops = []
         for roi in rois:
-            # ROI'yi kırp
             cropped = self.detector.crop_roi(image, roi)
             
             if cropped.size == 0:
                 continue
             
-            # ROI'yi işle
-            roi_results = self._process_roi(cropped, roi)
-            results.extend(roi_results)
+            crops.append((cropped, roi))
         
-        # 3. Sonuçları filtrele ve sırala
-        results = self._filter_and_rank_results(results)
+        return crops
+    
+    def _frame_skew(self, image: np.ndarray) -> Optional[float]:
+        """'frame' modunda karenin eğimi (ROI'ler bunu yeniden hesaplamaz), diğer modlarda None"""
+        if self.deskew_mode != 'frame':
+            return None
+        return self._get_preprocessor().estimate_skew(image, 'projection', max_size=512)
+    
+    def _select_profiles(self, crops: List[Tuple[np.ndarray, BoundingBox]],
+                         image_size: Optional[Tuple[int, int]] = None) -> List[Optional[OCRProfile]]:
+        """ROI'lerin OCR profillerini boyutlarına göre seç (profiller kapalıysa None)"""
+        if not self.ocr_profiles:
+            return [None] * len(crops)
+        return [select_profile(cropped.shape[1], cropped.shape[0], image_size) for cropped, _ in crops]
+    
+    @staticmethod
+    def _ocr_config(profile: Optional[OCRProfile]) -> str:
+        """Profilin Tesseract ayarı"""
+        return profile.config() if profile is not None else DEFAULT_OCR_CONFIG
+    
+    def _map_rois(self, crops: List[Tuple[np.ndarray, BoundingBox]],
+                  profiles: Optional[List[Optional[OCRProfile]]] = None) -> List[List[DetectionResult]]:
+        """ROI'leri sıralı ya da iş parçacığı havuzunda işle"""
+        if profiles is None:
+            profiles = self._select_profiles(crops)
         
-        return results
+        if self.ocr_batch:
+            return self._map_rois_batched(crops, profiles)
+        
+        if self.max_results:
+            return self._map_rois_early_exit(crops, profiles)
+        
+        if self.roi_workers <= 1 or len(crops) <= 1:
+            return [self._process_roi(cropped, roi, profile)
+                    for (cropped, roi), profile in zip(crops, profiles)]
+        
+        # OCR ayrı bir süreçte çalıştığı için iş parçacıkları GIL'e takılmaz;
+        # map() giriş sırasını koruduğundan çıktı deterministik kalır
+        executor = self._get_executor()
+        return list(executor.map(lambda item: self._process_roi(*item[0], item[1]), zip(crops, profiles)))
+    
+    def _map_rois_early_exit(self, crops: List[Tuple[np.ndarray, BoundingBox]],
+                             profiles: List[Optional[OCRProfile]]) -> List[List[DetectionResult]]:
+        """ROI'leri metin olasılığı sırasıyla işle, yeterli doğrulanmış sonuçta dur
+        
+        Atlanan ROI'lerin sonuç listesi boş kalır. Paralel modda işler öncelik
+        sırasıyla kuyruğa verilir; durulduğunda henüz başlamamış olanlar iptal
+        edilir.
+        """
+        scores = [self.detector.text_likelihood(cropped) for cropped, _ in crops]
+        order = sorted(range(len(crops)), key=lambda i: -scores[i])
+        roi_results: List[List[DetectionResult]] = [[] for _ in crops]
+        found = set()
+        
+        if self.roi_workers <= 1 or len(crops) <= 1:
+            for index in order:
+                roi_results[index] = self._process_roi(*crops[index], profiles[index])
+                if self._early_exit_reached(roi_results[index], found):
+                    break
+            return roi_results
+        
+        executor = self._get_executor()
+        futures = {executor.submit(self._process_roi, *crops[index], profiles[index]): index
+                   for index in order}
+        try:
+            for future in as_completed(futures):
+                index = futures[future]
+                roi_results[index] = future.result()
+                if self._early_exit_reached(roi_results[index], found):
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+        
+        return roi_results
+    
+    def _early_exit_reached(self, results: List[DetectionResult], found: set) -> bool:
+        """Doğrulanmış VIN'leri found kümesine ekle; yeterli sayıya ulaşıldı mı"""
+        threshold = self.stop_on_confidence if self.stop_on_confidence is not None else self.min_confidence
+        for result in results:
+            if result.confidence >= threshold and self._is_validated(result):
+                found.add(result.code)
+        return len(found) >= self.max_results
+    
+    def _is_validated(self, result: DetectionResult) -> bool:
+        """Sonuç kontrol hanesi ya da bilinen WMI ile doğrulanmış bir VIN mi"""
+        return result.category == 'VIN' and len(result.code) == 17 and (
+            validate_vin_check_digit(result.code) or result.code[:3] in self.lexicon.wmi_codes
+        )
+    
+    def _map_rois_batched(self, crops: List[Tuple[np.ndarray, BoundingBox]],
+                          profiles: Optional[List[Optional[OCRProfile]]] = None) -> List[List[DetectionResult]]:
+        """ROI'leri ön işle ve profil başına tek toplu OCR çağrısıyla tanı
+        
+        Tek satırlık psm'li profillerin (vin_line) ROI'leri mozaiğe konmaz, tek tek okunur.
+        """
+        if profiles is None:
+            profiles = self._select_profiles(crops)
+        
+        images = [cropped for cropped, _ in crops]
+        skews = [roi.skew for _, roi in crops]
+        if self.roi_workers > 1 and len(images) > 1:
+            preprocessed = list(self._get_executor().map(self._preprocess_roi, images, skews))
+        else:
+            preprocessed = [self._preprocess_roi(image, skew) for image, skew in zip(images, skews)]
+        
+        # Aynı ayarlı ROI'ler aynı mozaiğe konur
+        groups: Dict[str, List[int]] = {}
+        for index, profile in enumerate(profiles):
+            groups.setdefault(self._ocr_config(profile), []).append(index)
+        
+        ocr_results: List[Optional[OCRResult]] = [None] * len(crops)
+        for config, indices in groups.items():
+            batch = self._read_group([preprocessed[i] for i in indices], config)
+            for index, ocr_result in zip(indices, batch):
+                ocr_results[index] = ocr_result
+        
+        # Uyarlanır ön işlemede güveni düşük ROI'ler tam zincirle ikinci bir toplu çağrıda okunur
+        for config, indices in groups.items():
+            retry = [i for i in indices if self._needs_full_retry(ocr_results[i])]
+            if not retry:
+                continue
+            images = [self._preprocess_roi(crops[i][0], skews[i], 'full') for i in retry]
+            for index, ocr_result in zip(retry, self._read_group(images, config)):
+                if ocr_result.confidence > ocr_results[index].confidence:
+                    ocr_results[index] = ocr_result
+        
+        return [self._results_from_ocr(ocr_result, roi)
+                for ocr_result, (_, roi) in zip(ocr_results, crops)]
+    
+    def _read_group(self, images: List[np.ndarray], config: str) -> List[OCRResult]:
+        """Aynı ayarlı ön işlenmiş ROI'leri oku (tek satırlık psm'de mozaiksiz, tek tek)"""
+        if len(images) > 1 and is_single_line_config(config):
+            return [self._extract_text(image, config) for image in images]
+        return self.ocr.extract_text_with_confidence_batch(images, config)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Paylaşılan iş parçacığı havuzunu al (ilk kullanımda oluşturulur)"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.roi_workers, thread_name_prefix='vision-roi'
+                )
+            return self._executor
+    
+    def _get_preprocessor(self) -> ImagePreprocessor:
+        """İş parçacığına özel ön işleyici (CLAHE nesnesi iş parçacığı güvenli değil)"""
+        if threading.current_thread() is threading.main_thread():
+            return self.preprocessor
+        
+        preprocessor = getattr(self._thread_local, 'preprocessor', None)
+        if preprocessor is None:
+            preprocessor = ImagePreprocessor()
+            self._thread_local.preprocessor = preprocessor
+        return preprocessor
+    
+    def _get_variant_executor(self) -> ThreadPoolExecutor:
+        """Varyant OCR havuzunu al (ROI havuzundan ayrıdır; ROI işleri varyantları bekler)
+        
+        Havuz ROI işleri arasında paylaşıldığından eşzamanlı her ROI'nin tüm
+        varyantlarına yetecek kadar iş parçacığıyla açılır.
+        """
+        with self._executor_lock:
+            if self._variant_executor is None:
+                self._variant_executor = ThreadPoolExecutor(
+                    max_workers=max(1, self.roi_workers) * len(self.variants),
+                    thread_name_prefix='vision-variant'
+                )
+            return self._variant_executor
+    
+    def close(self):
+        """İş parçacığı havuzlarını ve ardından kalıcı OCR motorlarını kapat"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            if self._variant_executor is not None:
+                self._variant_executor.shutdown(wait=True)
+                self._variant_executor = None
+        self.ocr.close()
     
-    def _process_roi(self, roi_image: np.ndarray, bbox: BoundingBox) -> List[DetectionResult]:
+    def _process_roi(self, roi_image: np.ndarray, bbox: BoundingBox,
+                     profile: Optional[OCRProfile] = None) -> List[DetectionResult]:
         """ROI'yi işle"""
-        results = []
+        if self.preprocess_mode == 'variants':
+            return self._process_roi_variants(roi_image, bbox, profile)
         
         # 1. Ön işleme
-        preprocessed = self.preprocessor.preprocess_for_ocr(roi_image)
+        preprocessed = self._preprocess_roi(roi_image, bbox.skew)
         
         # 2. OCR ile metin çıkar
-        ocr_result = self.ocr.extract_text_with_confidence(preprocessed, '--psm 6')
+        config = self._ocr_config(profile)
+        ocr_result = self._extract_text(preprocessed, config)
+        
+        # 2b. Uyarlanır ön işleme yetmediyse tam zincirle yeniden dene
+        if self._needs_full_retry(ocr_result):
+            retry = self._extract_text(self._preprocess_roi(roi_image, bbox.skew, 'full'), config)
+            if retry.confidence > ocr_result.confidence:
+                ocr_result = retry
+        
+        # 3. Metni analiz et
+        return self._results_from_ocr(ocr_result, bbox)
+    
+    def _process_roi_variants(self, roi_image: np.ndarray, bbox: BoundingBox,
+                              profile: Optional[OCRProfile] = None) -> List[DetectionResult]:
+        """ROI'yi birden çok ön işleme varyantıyla eşzamanlı oku, en iyi okumayı tut
+        
+        Gri tonlama, eğim düzeltme ve CLAHE bir kez hesaplanır; varyantın kalan
+        aşamaları ve OCR'ı ayrı havuzda çalışır. Sözlükle doğrulanmış sonucu olan
+        varyantlar tercih edilir, aralarından en yüksek güvenli olan tutulur.
+        Kontrol hanesi doğru bir VIN okunduğunda kalan varyantlar beklenmez.
+        """
+        preprocessor = self._get_preprocessor()
+        enhanced = preprocessor.variant_base(roi_image, self._roi_skew(preprocessor, roi_image, bbox.skew))
+        config = self._ocr_config(profile)
+        
+        def read(name: str) -> List[DetectionResult]:
+            preprocessed = preprocessor.apply_variant(name, enhanced)
+            return self._results_from_ocr(self._extract_text(preprocessed, config), bbox)
+        
+        if len(self.variants) == 1:
+            return read(self.variants[0])
+        
+        best: List[DetectionResult] = []
+        futures = [self._get_variant_executor().submit(read, name) for name in self.variants]
+        try:
+            for future in as_completed(futures):
+                results = future.result()
+                if self._variant_score(results) > self._variant_score(best):
+                    best = results
+                if any(result.category == 'VIN' and validate_vin_check_digit(result.code)
+                       for result in results):
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+        
+        return best
+    
+    def _variant_score(self, results: List[DetectionResult]) -> Tuple[bool, float]:
+        """Varyant okumasının sıralama anahtarı: (doğrulanmış sonuç var mı, en yüksek güven)"""
+        if not results:
+            return (False, -1.0)
+        return (any(self._is_validated(result) for result in results),
+                max(result.confidence for result in results))
+    
+    def _extract_text(self, preprocessed: np.ndarray, config: str) -> OCRResult:
+        """Ön işlenmiş ROI'yi OCR ile oku"""
+        if self.char_confidences:
+            return self.ocr.extract_text_with_confidence(preprocessed, config, chars=True)
+        return self.ocr.extract_text_with_confidence(preprocessed, config)
+    
+    def _needs_full_retry(self, ocr_result: OCRResult) -> bool:
+        """Uyarlanır ön işlemeyle okunan ROI tam zincirle yeniden okunmalı mı
+        
+        Yalnızca metin okunmuş ama güveni düşük ROI'ler yeniden okunur; boş
+        ROI'ler (güven 0) tam zincirde de çoğunlukla boş kalır.
+        """
+        return (self.preprocess_mode == 'adaptive' and bool(ocr_result.text.strip())
+                and ocr_result.confidence < self.adaptive_retry_confidence)
+    
+    def _preprocess_roi(self, roi_image: np.ndarray, skew_angle: Optional[float] = None,
+                        mode: Optional[str] = None) -> np.ndarray:
+        """ROI'yi OCR için ön işle (skew_angle: üst karede hesaplanmış eğim, mode: varsayılan preprocess_mode)"""
+        preprocessor = self._get_preprocessor()
+        skew_angle = self._roi_skew(preprocessor, roi_image, skew_angle)
+        mode = mode or self.preprocess_mode
+        if mode == 'variants':
+            # Toplu OCR'da yalnızca ilk varyant okunur
+            enhanced = preprocessor.variant_base(roi_image, skew_angle)
+            return preprocessor.apply_variant(self.variants[0], enhanced)
+        return getattr(preprocessor, PREPROCESS_MODES[mode])(roi_image, skew_angle=skew_angle)
+    
+    def _roi_skew(self, preprocessor: ImagePreprocessor, roi_image: np.ndarray,
+                  skew_angle: Optional[float]) -> Optional[float]:
+        """ROI eğimi: verilmişse o, 'fast' eğim modunda izdüşüm tahmini, değilse None (ön işleyici hesaplar)"""
+        if skew_angle is None and self.deskew_mode == 'fast':
+            return preprocessor.estimate_skew(roi_image, 'projection')
+        return skew_angle
+    
+    def _results_from_ocr(self, ocr_result: OCRResult, bbox: BoundingBox) -> List[DetectionResult]:
+        """OCR sonucunu analiz et ve tespit sonuçlarına dönüştür"""
+        results = []
         
         if not ocr_result.text:
             return results
         
-        # 3. Metni analiz et
-        text_results = self._analyze_text(ocr_result.text)
+        text_results = self._analyze_text(ocr_result.text, ocr_result.chars)
         
-        # 4. Sonuçları dönüştür
+        # Sonuçları dönüştür
         for text_result in text_results:
             # Bounding box'ı orijinal görüntüye göre ayarla
             adjusted_bbox = (
@@ -103,8 +510,8 @@ class VisionPipeline:
         
         return results
     
-    def _analyze_text(self, text: str) -> List[CodeInfo]:
-        """Metni analiz et ve kodları bul"""
+    def _analyze_text(self, text: str, chars: Optional[CharData] = None) -> List[CodeInfo]:
+        """Metni analiz et ve kodları bul (chars: metinle hizalı karakter verisi)"""
         results = []
         
         # 1. Tam eşleşme ara
@@ -113,15 +520,25 @@ class VisionPipeline:
             results.append(exact_match)
             return results
         
-        # 2. VIN adaylarını çıkar
-        vin_candidates = self.lexicon.extract_vin_candidates(text)
-        
-        for vin in vin_candidates:
-            if self.lexicon.validate_vin(vin):
+        # 2. VIN adaylarını en olasıdan başlayarak analiz et
+        found_valid_vin = False
+        for candidate in self.lexicon.iter_vin_candidates(text):
+            if self.lexicon.validate_vin(candidate.vin):
                 # VIN'i analiz et
-                vin_info = self._analyze_vin(vin)
+                vin_info = self._analyze_vin(candidate.vin)
                 if vin_info:
                     results.append(vin_info)
+                    
+                    # Kontrol hanesi doğru VIN bulunduysa kalan adaylar gürültüdür
+                    if candidate.check_digit_valid:
+                        found_valid_vin = True
+                        break
+        
+        # 2b. Geçerli VIN yoksa OCR karışıklıklarını kontrol hanesiyle düzelt
+        if self.vin_correction and not found_valid_vin:
+            corrected = self._correct_vin(text, chars)
+            if corrected:
+                results.append(corrected)
         
         # 3. Fuzzy eşleşme ara
         fuzzy_matches = self.lexicon.find_fuzzy_match(text, self.fuzzy_threshold)
@@ -129,6 +546,25 @@ class VisionPipeline:
         
         return results
     
+    def _correct_vin(self, text: str, chars: Optional[CharData] = None) -> Optional[CodeInfo]:
+        """Metindeki VIN uzunluğundaki sözcüğü kontrol hanesi geçecek şekilde düzelt"""
+        if chars is not None and len(chars) == len(text):
+            correction = correct_vin_in_text(
+                text, chars.confidences.tolist(),
+                alternatives=[chars.alternatives_at(i) for i in range(len(chars))],
+                max_changes=self.max_vin_corrections, lock_confidence=self.vin_lock_confidence
+            )
+        else:
+            correction = correct_vin_in_text(text, max_changes=self.max_vin_corrections)
+        if correction is None or not correction.changes:
+            return None
+        
+        vin_info = self._analyze_vin(correction.vin)
+        if vin_info:
+            # Her düzeltilen karakter güveni biraz düşürür
+            vin_info.confidence *= 0.95 ** len(correction.changes)
+        return vin_info
+    
     def _analyze_vin(self, vin: str) -> Optional[CodeInfo]:
         """VIN'i analiz et"""
         if len(vin) < 3:
@@ -145,16 +581,26 @@ class VisionPipeline:
                 confidence=0.9
             )
         
-        # Model kodu kontrolü
-        for model_code, model_name in self.lexicon.model_codes.items():
-            if model_code in vin:
-                return CodeInfo(
-                    code=vin,
-                    manufacturer="Renault/Dacia",
-                    model=model_name,
-                    category="VIN",
-                    confidence=0.8
-                )
+        # Model kodu kontrolü (VIN içindeki ilk model kodu)
+        models = self.lexicon.find_code_occurrences(vin, 'Model')
+        if models:
+            return CodeInfo(
+                code=vin,
+                manufacturer="Renault/Dacia",
+                model=models[0].value,
+                category="VIN",
+                confidence=0.8
+            )
+        
+        # Diğer markalar: kontrol hanesi doğru olan 17 karakterlik VIN
+        if validate_vin_check_digit(vin):
+            return CodeInfo(
+                code=vin,
+                manufacturer="",
+                model="",
+                category="VIN",
+                confidence=0.8
+            )
         
         return None
     
@@ -187,19 +633,23 @@ class VisionPipeline:
             # Metin bölgesi bulunamazsa tüm görüntüyü kullan
             return self.process_image(image)
         
-        # 2. Her metin bölgesi için işlem yap
+        # 2. Bölgeleri kırp
+        skew = self._frame_skew(image)
+        crops = []
         for x, y, w, h in text_regions:
-            # Bölgeyi kırp
             region = image[y:y+h, x:x+w]
             
             if region.size == 0:
                 continue
             
-            # Bölgeyi işle
-            region_results = self._process_roi(region, BoundingBox(x, y, w, h))
+            crops.append((region, BoundingBox(x, y, w, h, skew=skew)))
+        
+        # 3. Her metin bölgesi için işlem yap
+        profiles = self._select_profiles(crops, (image.shape[1], image.shape[0]))
+        for region_results in self._map_rois(crops, profiles):
             results.extend(region_results)
         
-        # 3. Sonuçları filtrele ve sırala
+        # 4. Sonuçları filtrele ve sırala
         results = self._filter_and_rank_results(results)
         
         return results
@@ -3,54 +3,193 @@ Görüntü ön işleme modülü - deskew, dewarp, threshold, morfoloji
 """
 import cv2
 import numpy as np
-from typing import Tuple, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Optional, Sequence
 from scipy import ndimage
 
 
+# Bundan küçük eğimler (radyan, ~5.7 derece) düzeltilmez
+DESKEW_MIN_ANGLE = 0.1
+
+# Uyarlanır ön işleme eşikleri (bkz. ImageStats.stages)
+ADAPTIVE_MIN_CONTRAST = 64  # gri seviye, bunun altında CLAHE
+ADAPTIVE_MAX_NOISE = 5.0  # gürültü standart sapması, bunun üstünde bilateral filtre
+ADAPTIVE_MIN_SHARPNESS = 500.0  # normalize Laplacian varyansı, bunun altında keskinleştirme
+
+# preprocess_variants'ın ürettiği varyantlar (öncelik sırasıyla)
+PREPROCESS_VARIANTS = (
+    'sauvola',  # bilateral, keskinleştirme, Sauvola (preprocess_for_ocr)
+    'gaussian',  # 11/2 Gauss adaptif eşik
+    'denoised',  # non-local means, unsharp mask, 35/15 Gauss adaptif eşik
+)
+
+# Gürültü tahmini için Laplacian farkı çekirdeği (Immerkaer)
+_NOISE_KERNEL = np.array([[1, -2, 1], [-2, 4, -2], [1, -2, 1]], dtype=np.float32)
+
+# preprocess_for_ocr'daki kapanma çekirdeği
+_CLOSE_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
+
+
+class ScratchBuffers:
+    """Adlandırılmış, büyüyebilen tampon bellekler
+    
+    Her ad için tek bir düz dizi tutulur; istenen şekil bu dizinin başından
+    bitişik bir görünüm olarak verilir. Dizi yalnızca daha büyük bir şekil
+    istendiğinde yeniden ayrılır, böylece farklı ROI boyutları bellek
+    birikimine yol açmaz. İş parçacığı güvenli değildir.
+    """
+    
+    def __init__(self):
+        self._buffers = {}
+        self.allocations = 0
+    
+    def get(self, name: str, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """Şekil ve türe uygun tampon görünümü al (içeriği tanımsızdır)"""
+        dtype = np.dtype(dtype)
+        size = int(np.prod(shape))
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.dtype != dtype or buffer.size < size:
+            buffer = np.empty(max(size, 1), dtype=dtype)
+            self._buffers[name] = buffer
+            self.allocations += 1
+        return buffer[:size].reshape(shape)
+
+
+@dataclass
+class ImageStats:
+    """Uyarlanır ön işleme için ucuz görüntü istatistikleri"""
+    contrast: float  # gri seviyelerin %2-%98 yüzdelik aralığı
+    sharpness: float  # tam kontrasta normalize Laplacian varyansı (bulanıkta küçük)
+    noise: float  # gürültü standart sapması tahmini
+    skew: float  # eğim açısı (radyan, bkz. estimate_skew)
+
+    def stages(self) -> List[str]:
+        """Bu görüntüde çalıştırılacak isteğe bağlı aşamalar (sırasıyla)"""
+        stages = []
+        if abs(self.skew) > DESKEW_MIN_ANGLE:
+            stages.append('deskew')
+        if self.contrast < ADAPTIVE_MIN_CONTRAST:
+            stages.append('contrast')
+        if self.noise > ADAPTIVE_MAX_NOISE:
+            stages.append('denoise')
+        if self.sharpness < ADAPTIVE_MIN_SHARPNESS:
+            stages.append('sharpen')
+        return stages
+
+
+def _histogram_percentile(hist: np.ndarray, fraction: float) -> int:
+    """256 kutulu histogramdan yüzdelik değer"""
+    cumulative = np.cumsum(hist)
+    return int(np.searchsorted(cumulative, fraction * cumulative[-1]))
+
+
 class ImagePreprocessor:
     """Görüntü ön işleme sınıfı"""
     
     def __init__(self):
         self.clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        self._scratch = ScratchBuffers()
+    
+    def deskew_image(self, image: np.ndarray, method: str = 'hough') -> np.ndarray:
+        """Görüntüyü düzelt (eğikliği gider)
+        
+        method: 'hough' tam çözünürlükte Hough çizgileri, 'projection'
+        küçültülmüş kopyada izdüşüm profili (bkz. estimate_skew).
+        """
+        return self.rotate_image(image, self.estimate_skew(image, method))
     
-    def deskew_image(self, image: np.ndarray) -> np.ndarray:
-        """Görüntüyü düzelt (eğikliği gider)"""
+    def estimate_skew(self, image: np.ndarray, method: str = 'projection', max_size: int = 256) -> float:
+        """Metin satırlarının eğim açısı (radyan)
+        
+        Döndürülen açı rotate_image'e verildiğinde satırlar yataylaşır.
+        max_size: izdüşüm profili için küçültülen kopyanın uzun kenarı.
+        """
         if len(image.shape) == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
-            gray = image.copy()
+            gray = image
+        
+        if method == 'hough':
+            return self._estimate_skew_hough(gray)
+        elif method == 'projection':
+            return self._estimate_skew_projection(gray, max_size)
+        raise ValueError(f"Bilinmeyen eğim yöntemi: {method}")
+    
+    def rotate_image(self, image: np.ndarray, angle: float,
+                     dst: Optional[np.ndarray] = None) -> np.ndarray:
+        """Görüntüyü estimate_skew açısı kadar döndür
+        
+        DESKEW_MIN_ANGLE'dan küçük açılarda görüntü olduğu gibi döner.
+        """
+        if abs(angle) <= DESKEW_MIN_ANGLE:
+            return image
         
+        h, w = image.shape[:2]
+        rotation_matrix = cv2.getRotationMatrix2D((w // 2, h // 2), angle * 180 / np.pi, 1.0)
+        return cv2.warpAffine(image, rotation_matrix, (w, h), dst=dst, flags=cv2.INTER_CUBIC)
+    
+    def _estimate_skew_hough(self, gray: np.ndarray) -> float:
+        """Hough çizgilerinin medyan açısı (radyan, çizgi yoksa 0)"""
         # Kenar tespiti
         edges = cv2.Canny(gray, 50, 150, apertureSize=3)
         
         # Hough transform ile çizgileri bul
         lines = cv2.HoughLines(edges, 1, np.pi/180, threshold=100)
         
-        if lines is not None:
-            # Açıları hesapla
-            angles = []
-            for line in lines:
-                rho, theta = line[0]
-                angle = theta - np.pi/2
-                angles.append(angle)
-            
-            # Medyan açıyı al
-            median_angle = np.median(angles)
-            
-            # Açı küçükse düzeltme yap
-            if abs(median_angle) > 0.1:  # 0.1 radyan = ~5.7 derece
-                # Rotasyon matrisi
-                h, w = gray.shape
-                center = (w // 2, h // 2)
-                rotation_matrix = cv2.getRotationMatrix2D(center, -median_angle * 180 / np.pi, 1.0)
-                
-                # Döndür
-                if len(image.shape) == 3:
-                    return cv2.warpAffine(image, rotation_matrix, (w, h), flags=cv2.INTER_CUBIC)
-                else:
-                    return cv2.warpAffine(gray, rotation_matrix, (w, h), flags=cv2.INTER_CUBIC)
-        
-        return image
+        if lines is None:
+            return 0.0
+        
+        # Medyan açıyı al
+        return float(np.median(lines[:, 0, 1] - np.pi/2))
+    
+    def _estimate_skew_projection(self, gray: np.ndarray, max_size: int = 256,
+                                  max_angle: float = 15.0) -> float:
+        """Küçültülmüş görüntüde yatay izdüşüm profiliyle kabadan inceye eğim araması
+        
+        Mürekkep piksellerinin aday açılarla döndürülmüş y koordinatlarının
+        histogramı satırlar yatayken en keskin (kareler toplamı en büyük) olur.
+        Tüm aday açılar tek vektörel geçişte değerlendirilir: önce 1 derece,
+        sonra en iyi açı çevresinde 0.1 derece adımla.
+        """
+        h, w = gray.shape[:2]
+        scale = min(1.0, max_size / max(h, w))
+        if scale < 1.0:
+            gray = cv2.resize(gray, (max(1, int(w * scale)), max(1, int(h * scale))),
+                              interpolation=cv2.INTER_AREA)
+        if int(gray.max()) - int(gray.min()) < 32:
+            return 0.0
+        
+        # Koyu metin mürekkep olarak alınır; açık metinde mürekkep oranı yarıyı aşar
+        _, ink = cv2.threshold(gray, 0, 1, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        if ink.mean() > 0.5:
+            ink = 1 - ink
+        ys, xs = np.nonzero(ink)
+        if len(ys) < 10:
+            return 0.0
+        ys = ys.astype(np.float32) - gray.shape[0] / 2
+        xs = xs.astype(np.float32) - gray.shape[1] / 2
+        
+        def sharpness(angles: np.ndarray) -> np.ndarray:
+            projected = np.outer(np.cos(angles), ys) - np.outer(np.sin(angles), xs)
+            bins = np.rint(projected).astype(np.int64)
+            bins -= bins.min()
+            n_bins = int(bins.max()) + 1
+            bins += np.arange(len(angles))[:, None] * n_bins
+            profile = np.bincount(bins.ravel(), minlength=len(angles) * n_bins)
+            profile = profile.reshape(len(angles), n_bins).astype(np.float64)
+            return (profile ** 2).sum(axis=1)
+        
+        coarse = np.deg2rad(np.arange(-max_angle, max_angle + 0.5, 1.0))
+        scores = sharpness(coarse)
+        best = coarse[int(np.argmax(scores))]
+        
+        fine = best + np.deg2rad(np.arange(-1.0, 1.05, 0.1))
+        fine_scores = sharpness(fine)
+        
+        # Profil düzse (ör. metin yok) eğim güvenilmez
+        if fine_scores.max() <= scores[len(coarse) // 2] * 1.01:
+            return 0.0
+        return float(fine[int(np.argmax(fine_scores))])
     
     def enhance_contrast(self, image: np.ndarray) -> np.ndarray:
         """Kontrastı artır (CLAHE)"""
@@ -79,6 +218,12 @@ class ImagePreprocessor:
         if method == 'sauvola':
             # Sauvola eşikleme
             return self._sauvola_threshold(gray)
+        elif method == 'sauvola_box':
+            # Kutu pencereli Sauvola (pencere boyutundan bağımsız maliyet)
+            return self._sauvola_threshold_box(gray)
+        elif method == 'niblack':
+            # Kutu pencereli Niblack
+            return self._sauvola_threshold_box(gray, k=-0.2, method='niblack')
         elif method == 'mean':
             # Mean adaptif eşikleme
             return cv2.adaptiveThreshold(
@@ -105,6 +250,53 @@ class ImagePreprocessor:
         binary = np.where(image > threshold, 255, 0).astype(np.uint8)
         return binary
     
+    def _sauvola_threshold_box(self, image: np.ndarray, out: Optional[np.ndarray] = None,
+                               window_size: int = 15, k: float = 0.2,
+                               method: str = 'sauvola') -> np.ndarray:
+        """Kutu pencereli Sauvola/Niblack eşikleme
+        
+        Yerel ortalama ve kareler ortalaması cv2.boxFilter/sqrBoxFilter'ın kayan
+        toplamlarıyla hesaplanır; piksel başına maliyet window_size'dan
+        bağımsızdır. Ara diziler tampon belleklerdedir, sonuç (0/255) uint8
+        out dizisine yazılır.
+        
+        sauvola: T = m * (1 + k * (s / 128 - 1)), niblack: T = m + k * s
+        """
+        if len(image.shape) == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY,
+                                 dst=self._scratch.get('gray', image.shape[:2], np.uint8))
+        shape = image.shape
+        if out is None:
+            out = np.empty(shape, dtype=np.uint8)
+        
+        window = (window_size, window_size)
+        mean = self._scratch.get('mean', shape, np.float32)
+        std_dev = self._scratch.get('work', shape, np.float32)
+        values = self._scratch.get('values', shape, np.float32)
+        
+        cv2.boxFilter(image, cv2.CV_32F, window, dst=mean)
+        cv2.sqrBoxFilter(image, cv2.CV_32F, window, dst=std_dev)
+        
+        # s = sqrt(max(E[x^2] - m^2, 0))
+        cv2.multiply(mean, mean, dst=values)
+        cv2.subtract(std_dev, values, dst=std_dev)
+        np.maximum(std_dev, 0, out=std_dev)
+        cv2.sqrt(std_dev, dst=std_dev)
+        
+        threshold = std_dev
+        if method == 'sauvola':
+            np.multiply(threshold, k / 128, out=threshold)
+            np.add(threshold, 1 - k, out=threshold)
+            np.multiply(threshold, mean, out=threshold)
+        elif method == 'niblack':
+            np.multiply(threshold, k, out=threshold)
+            np.add(threshold, mean, out=threshold)
+        else:
+            raise ValueError(f"Bilinmeyen eşikleme yöntemi: {method}")
+        
+        values[...] = image
+        return cv2.compare(values, threshold, cv2.CMP_GT, dst=out)
+    
     def morphological_operations(self, image: np.ndarray, operation: str = 'close') -> np.ndarray:
         """Morfolojik işlemler"""
         if operation == 'close':
@@ -167,10 +359,17 @@ class ImagePreprocessor:
         else:
             return sharpened
     
-    def preprocess_for_ocr(self, image: np.ndarray) -> np.ndarray:
-        """OCR için tam ön işleme pipeline'ı"""
+    def preprocess_for_ocr(self, image: np.ndarray, skew_angle: Optional[float] = None) -> np.ndarray:
+        """OCR için tam ön işleme pipeline'ı
+        
+        skew_angle verilirse (ör. üst karede bir kez hesaplanmış) eğim yeniden
+        hesaplanmaz.
+        """
         # 1. Eğikliği düzelt
-        deskewed = self.deskew_image(image)
+        if skew_angle is None:
+            deskewed = self.deskew_image(image)
+        else:
+            deskewed = self.rotate_image(image, skew_angle)
         
         # 2. Kontrastı artır
         enhanced = self.enhance_contrast(deskewed)
@@ -189,6 +388,216 @@ class ImagePreprocessor:
         
         return morphed
     
+    def preprocess_for_ocr_fast(self, image: np.ndarray, out: Optional[np.ndarray] = None,
+                                threshold_method: str = 'sauvola',
+                                skew_angle: Optional[float] = None) -> np.ndarray:
+        """preprocess_for_ocr ile aynı aşamaların gri tonlamada birleştirilmiş hali
+        
+        Renk bir kez griye çevrilir (LAB gidiş-dönüşleri yok) ve ara sonuçlar
+        şekil başına yeniden kullanılan tampon belleklere dst= ile yazılır;
+        yalnızca çıkış (out verilmezse) yeni ayrılır. Gri girişte çıktı
+        preprocess_for_ocr ile bit düzeyinde aynıdır; renkli girişte CLAHE ve
+        bilateral filtre gri kanalda çalıştığı için çok yakındır.
+        threshold_method='sauvola_box' kutu pencereli (daha hızlı) Sauvola kullanır.
+        skew_angle verilirse eğim yeniden hesaplanmaz.
+        """
+        shape = image.shape[:2]
+        scratch = self._scratch
+        
+        if len(image.shape) == 3:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=scratch.get('gray', shape, np.uint8))
+        else:
+            gray = image
+        
+        # 1. Eğikliği düzelt
+        if skew_angle is None:
+            skew_angle = self._estimate_skew_hough(gray)
+        gray = self.rotate_image(gray, skew_angle, dst=scratch.get('rotated', shape, np.uint8))
+        
+        # 2-4. Kontrast, gürültü, keskinleştirme (a ve b dönüşümlü kullanılır)
+        a = scratch.get('a', shape, np.uint8)
+        b = scratch.get('b', shape, np.uint8)
+        self.clahe.apply(gray, dst=a)
+        cv2.bilateralFilter(a, 9, 75, 75, dst=b)
+        cv2.GaussianBlur(b, (0, 0), 2.0, dst=a)
+        cv2.addWeighted(b, 1.5, a, -0.5, 0, dst=a)
+        
+        # 5. Sauvola eşikleme
+        if threshold_method == 'sauvola_box':
+            self._sauvola_threshold_box(a, b)
+        else:
+            self._sauvola_threshold_into(a, b)
+        
+        # 6. Morfolojik kapanma
+        if out is None:
+            out = np.empty(shape, dtype=np.uint8)
+        return cv2.morphologyEx(b, cv2.MORPH_CLOSE, _CLOSE_KERNEL, dst=out)
+    
+    def image_stats(self, image: np.ndarray, skew_angle: Optional[float] = None) -> ImageStats:
+        """Kontrast, keskinlik, gürültü ve eğim istatistikleri
+        
+        Yüzdelikler ve gürültü medyanı histogramdan okunur; tam sıralama
+        yapılmaz. Gürültü, metin kenarlarından etkilenmemesi için Laplacian
+        farkı yanıtının medyanından tahmin edilir. skew_angle verilirse eğim
+        yeniden hesaplanmaz.
+        """
+        if len(image.shape) == 3:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY,
+                                dst=self._scratch.get('gray', image.shape[:2], np.uint8))
+        else:
+            gray = image
+        
+        hist = cv2.calcHist([gray], [0], None, [256], [0, 256]).ravel()
+        contrast = _histogram_percentile(hist, 0.98) - _histogram_percentile(hist, 0.02)
+        
+        # Laplacian varyansı kontrasttan bağımsız olsun diye 255 aralığına ölçeklenir
+        laplacian = cv2.Laplacian(gray, cv2.CV_16S)
+        variance = float(cv2.meanStdDev(laplacian)[1][0, 0] ** 2)
+        sharpness = variance * (255.0 / contrast) ** 2 if contrast else 0.0
+        
+        # Gauss gürültüsünde yanıt N(0, 6 sigma): sigma = medyan / (6 * 0.6745)
+        response = cv2.convertScaleAbs(cv2.filter2D(gray, cv2.CV_16S, _NOISE_KERNEL))
+        noise_hist = cv2.calcHist([response], [0], None, [256], [0, 256]).ravel()
+        noise = _histogram_percentile(noise_hist, 0.5) / (6 * 0.6745)
+        
+        if skew_angle is None:
+            skew_angle = self._estimate_skew_projection(gray)
+        
+        return ImageStats(float(contrast), sharpness, noise, float(skew_angle))
+    
+    def preprocess_for_ocr_adaptive(self, image: np.ndarray, out: Optional[np.ndarray] = None,
+                                    skew_angle: Optional[float] = None,
+                                    stats: Optional[ImageStats] = None) -> np.ndarray:
+        """Yalnızca istatistiklerin gerektirdiği aşamaları çalıştıran ön işleme
+        
+        Eğim düzeltme, CLAHE, bilateral filtre ve keskinleştirme
+        ImageStats.stages'e göre atlanır; kutu pencereli Sauvola ve kapanma her
+        zaman uygulanır. Temiz, düz ve iyi aydınlatılmış görüntülerde maliyet
+        preprocess_for_ocr'un küçük bir kesridir. Sonuç yetersizse çağıran
+        preprocess_for_ocr ile yeniden deneyebilir.
+        """
+        shape = image.shape[:2]
+        scratch = self._scratch
+        
+        if len(image.shape) == 3:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=scratch.get('gray', shape, np.uint8))
+        else:
+            gray = image
+        if stats is None:
+            stats = self.image_stats(gray, skew_angle)
+        stages = stats.stages()
+        
+        # a ve b dönüşümlü kullanılır; current girişin kendisi de olabilir
+        a = scratch.get('a', shape, np.uint8)
+        b = scratch.get('b', shape, np.uint8)
+        current = gray
+        
+        if 'deskew' in stages:
+            current = self.rotate_image(current, stats.skew, dst=a)
+        if 'contrast' in stages:
+            spare = b if current is a else a
+            current = self.clahe.apply(current, dst=spare)
+        if 'denoise' in stages:
+            spare = b if current is a else a
+            current = cv2.bilateralFilter(current, 9, 75, 75, dst=spare)
+        if 'sharpen' in stages:
+            spare = b if current is a else a
+            cv2.GaussianBlur(current, (0, 0), 2.0, dst=spare)
+            current = cv2.addWeighted(current, 1.5, spare, -0.5, 0, dst=spare)
+        
+        thresholded = self._sauvola_threshold_box(current, b if current is a else a)
+        
+        if out is None:
+            out = np.empty(shape, dtype=np.uint8)
+        return cv2.morphologyEx(thresholded, cv2.MORPH_CLOSE, _CLOSE_KERNEL, dst=out)
+    
+    def preprocess_variants(self, image: np.ndarray,
+                            variants: Sequence[str] = PREPROCESS_VARIANTS,
+                            skew_angle: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """Birden çok ön işleme varyantı (ad -> ikili görüntü)
+        
+        Gri tonlama, eğim düzeltme ve CLAHE bir kez hesaplanıp (variant_base)
+        tüm varyantlarca paylaşılır (bkz. PREPROCESS_VARIANTS). Gri girişte
+        'sauvola' preprocess_for_ocr ile aynıdır.
+        """
+        enhanced = self.variant_base(image, skew_angle)
+        return {name: self.apply_variant(name, enhanced) for name in variants}
+    
+    def variant_base(self, image: np.ndarray, skew_angle: Optional[float] = None) -> np.ndarray:
+        """Varyantların paylaştığı aşamalar: gri tonlama, eğim düzeltme, CLAHE
+        
+        skew_angle verilirse eğim yeniden hesaplanmaz.
+        """
+        if len(image.shape) == 3:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        else:
+            gray = image
+        
+        if skew_angle is None:
+            skew_angle = self._estimate_skew_hough(gray)
+        return self.clahe.apply(self.rotate_image(gray, skew_angle))
+    
+    def apply_variant(self, name: str, enhanced: np.ndarray) -> np.ndarray:
+        """variant_base çıktısından tek bir varyant üret (2x2 kapanmayla biter)
+        
+        CLAHE nesnesini ve tampon bellekleri kullanmadığı için aynı giriş
+        üzerinde farklı iş parçacıklarından çağrılabilir.
+        """
+        if name == 'sauvola':
+            denoised = cv2.bilateralFilter(enhanced, 9, 75, 75)
+            blurred = cv2.GaussianBlur(denoised, (0, 0), 2.0)
+            binary = self._sauvola_threshold(cv2.addWeighted(denoised, 1.5, blurred, -0.5, 0))
+        elif name == 'gaussian':
+            binary = cv2.adaptiveThreshold(
+                enhanced, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+            )
+        elif name == 'denoised':
+            denoised = cv2.fastNlMeansDenoising(enhanced, None, h=7, templateWindowSize=7,
+                                                searchWindowSize=21)
+            blurred = cv2.GaussianBlur(denoised, (0, 0), 1.2)
+            binary = cv2.adaptiveThreshold(
+                cv2.addWeighted(denoised, 1.5, blurred, -0.5, 0), 255,
+                cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 35, 15
+            )
+        else:
+            raise ValueError(f"Bilinmeyen ön işleme varyantı: {name}")
+        
+        return cv2.morphologyEx(binary, cv2.MORPH_CLOSE, _CLOSE_KERNEL)
+    
+    def _sauvola_threshold_into(self, image: np.ndarray, out: np.ndarray,
+                                window_size: int = 15, k: float = 0.2) -> np.ndarray:
+        """_sauvola_threshold'un tampon bellekli hali (aynı işlem sırası, aynı sonuç)"""
+        shape = image.shape[:2]
+        scratch = self._scratch
+        window = (window_size, window_size)
+        
+        values = scratch.get('values', shape, np.float32)
+        mean = scratch.get('mean', shape, np.float32)
+        work = scratch.get('work', shape, np.float32)
+        values[...] = image
+        
+        # Yerel ortalama ve kareler ortalaması
+        cv2.GaussianBlur(values, window, 0, dst=mean)
+        np.multiply(values, values, out=work)
+        cv2.GaussianBlur(work, window, 0, dst=work)
+        
+        # Standart sapma
+        std_dev = work
+        np.subtract(work, np.multiply(mean, mean, out=values), out=std_dev)
+        np.maximum(std_dev, 0, out=std_dev)
+        np.sqrt(std_dev, out=std_dev)
+        
+        # threshold = mean * (1 + k * (std_dev / 128 - 1))
+        threshold = std_dev
+        np.divide(threshold, 128, out=threshold)
+        np.subtract(threshold, 1, out=threshold)
+        np.multiply(threshold, k, out=threshold)
+        np.add(threshold, 1, out=threshold)
+        np.multiply(mean, threshold, out=threshold)
+        
+        values[...] = image
+        return cv2.compare(values, threshold, cv2.CMP_GT, dst=out)
+    
     def detect_text_regions(self, image: np.ndarray) -> List[Tuple[int, int, int, int]]:
         """Metin bölgelerini tespit et"""
         if len(image.shape) == 3:
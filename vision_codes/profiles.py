@@ -0,0 +1,96 @@
+"""
+OCR profilleri - ROI geometrisine göre Tesseract sayfa bölütleme, karakter kümesi ve desen ayarları
+"""
+import hashlib
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+# Tek satırlık şeritlerin karakterleri. I, O, Q VIN'de geçmez ama aynı en/boy
+# oranındaki etiket satırlarında (ör. JLO, FLO model kodları) geçer; VIN'lerdeki
+# O->0 gibi karışıklıkları correction modülü düzeltir.
+LINE_WHITELIST = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+
+# Kod etiketlerinde görülen karakterler
+CODE_WHITELIST = LINE_WHITELIST + '-'
+
+# Tesseract kullanıcı desenleri (\n: harf veya rakam)
+VIN_PATTERNS = ('\\n' * 17,)
+
+# Tek satır sayılacak en küçük en/boy oranı
+LINE_ASPECT_RATIO = 5.0
+
+# Görüntünün bu oranından büyük ROI'ler tam sayfa olarak okunur
+FULL_PAGE_AREA_RATIO = 0.5
+
+_patterns_lock = threading.Lock()
+_patterns_files: Dict[Tuple[str, ...], str] = {}
+
+
+def write_user_patterns(patterns: Tuple[str, ...]) -> str:
+    """Desenleri geçici dizindeki bir dosyaya yaz ve yolunu döndür (içeriğe göre önbelleklenir)"""
+    with _patterns_lock:
+        path = _patterns_files.get(patterns)
+        if path is None:
+            content = '\n'.join(patterns) + '\n'
+            digest = hashlib.sha1(content.encode('utf-8')).hexdigest()[:12]
+            path = os.path.join(tempfile.gettempdir(), f'vision_codes_{digest}.patterns')
+            if not os.path.exists(path):
+                tmp_path = f'{path}.{os.getpid()}.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                os.replace(tmp_path, path)
+            _patterns_files[patterns] = path
+        return path
+
+
+@dataclass(frozen=True)
+class OCRProfile:
+    """Adlandırılmış Tesseract ayarları"""
+    name: str
+    psm: int
+    whitelist: str = ''
+    user_patterns: Tuple[str, ...] = ()
+    dictionaries: bool = True  # sistem ve sıklık sözlükleri
+
+    def config(self) -> str:
+        """Tesseract komut satırı ayarları"""
+        parts = [f'--psm {self.psm}']
+        if self.whitelist:
+            parts.append(f'-c tessedit_char_whitelist={self.whitelist}')
+        if not self.dictionaries:
+            parts.append('-c load_system_dawg=0 -c load_freq_dawg=0')
+        if self.user_patterns:
+            parts.append(f'-c user_patterns_file={write_user_patterns(self.user_patterns)}')
+        return ' '.join(parts)
+
+
+PROFILES: Dict[str, OCRProfile] = {
+    # Tek satırlık VIN şeridi ya da kod satırı
+    'vin_line': OCRProfile('vin_line', psm=7, whitelist=LINE_WHITELIST,
+                           user_patterns=VIN_PATTERNS, dictionaries=False),
+    # Birkaç satırlık kod etiketi
+    'code_block': OCRProfile('code_block', psm=6, whitelist=CODE_WHITELIST, dictionaries=False),
+    # Tüm görüntü veya büyük bölge, otomatik sayfa bölütleme
+    'full_page': OCRProfile('full_page', psm=3),
+}
+
+
+def select_profile(width: int, height: int,
+                   image_size: Optional[Tuple[int, int]] = None) -> OCRProfile:
+    """ROI boyutlarına göre profil seç
+
+    image_size (genişlik, yükseklik) verilirse görüntünün büyük kısmını kaplayan
+    ROI'ler tam sayfa olarak okunur.
+    """
+    if image_size is not None:
+        image_area = image_size[0] * image_size[1]
+        if image_area and width * height >= FULL_PAGE_AREA_RATIO * image_area:
+            return PROFILES['full_page']
+
+    if height > 0 and width / height >= LINE_ASPECT_RATIO:
+        return PROFILES['vin_line']
+
+    return PROFILES['code_block']
@@ -0,0 +1,171 @@
+"""
+Üretim sunum modülü - çok süreçli WSGI sunucu, worker ısındırma ve düzgün kapanma
+
+Kullanım:
+    python -m vision_codes.serve "vision_codes.server:create_app()" --workers 4 --threads 2
+
+Hedef modül isteğe bağlı olarak şu fonksiyonları tanımlayabilir:
+    warm_up():  worker başlarken çağrılır (OCR motoru yükleme, ısındırma)
+    shutdown(): worker kapanırken çağrılır (kaynakları bırakma)
+"""
+import argparse
+import importlib
+import logging
+import os
+import sys
+from typing import Any, Callable, Dict, Optional
+
+import cv2
+import numpy as np
+
+from .lexicon_store import ensure_compiled
+
+logger = logging.getLogger(__name__)
+
+
+# Isındırma görüntüsündeki örnek metin
+WARMUP_TEXT = 'VF1RJA00012345678'
+
+
+def make_warmup_image(text: str = WARMUP_TEXT) -> np.ndarray:
+    """Motorları ısındırmak için küçük sentetik metin görüntüsü üret"""
+    image = np.full((64, 480, 3), 255, dtype=np.uint8)
+    cv2.putText(image, text, (10, 44), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 0), 2)
+    return image
+
+
+def make_warmup_bytes(text: str = WARMUP_TEXT, ext: str = '.png') -> bytes:
+    """Isındırma görüntüsünü sıkıştırılmış bayt olarak üret"""
+    return cv2.imencode(ext, make_warmup_image(text))[1].tobytes()
+
+
+def import_target(target: str):
+    """'modül:değişken' veya 'modül:fabrika()' hedefini yükle, (modül, uygulama) döndür"""
+    module_name, _, attr = target.partition(':')
+    module = importlib.import_module(module_name)
+    attr = attr or 'app'
+    if attr.endswith('()'):
+        app = getattr(module, attr[:-2])()
+    else:
+        app = getattr(module, attr)
+    return module, app
+
+
+def _call_hook(module, name: str):
+    hook: Optional[Callable[[], Any]] = getattr(module, name, None)
+    if callable(hook):
+        hook()
+
+
+def build_options(args: argparse.Namespace) -> Dict[str, Any]:
+    """Argümanlardan gunicorn ayarlarını oluştur"""
+    target = args.target
+    module_name = target.partition(':')[0]
+
+    def post_worker_init(worker):
+        # Worker bağlantı kabul etmeden önce motoru yükle ve ısındır;
+        # böylece /health yalnızca sıcak worker'lardan yanıt verir
+        module = sys.modules.get(module_name) or importlib.import_module(module_name)
+        worker.log.info("Worker %s ısındırılıyor...", worker.pid)
+        _call_hook(module, 'warm_up')
+        worker.log.info("Worker %s hazır", worker.pid)
+
+    def worker_exit(server, worker):
+        module = sys.modules.get(module_name)
+        if module is not None:
+            _call_hook(module, 'shutdown')
+
+    return {
+        'bind': args.bind,
+        'workers': args.workers,
+        'threads': args.threads,
+        'worker_class': 'gthread' if args.threads > 1 else 'sync',
+        'timeout': args.timeout,
+        'graceful_timeout': args.graceful_timeout,
+        'keepalive': args.keepalive,
+        'max_requests': args.max_requests,
+        'max_requests_jitter': args.max_requests // 10 if args.max_requests else 0,
+        'backlog': args.backlog,
+        'preload_app': False,  # her worker motoru kendisi kurar
+        'post_worker_init': post_worker_init,
+        'worker_exit': worker_exit,
+    }
+
+
+def run_gunicorn(target: str, options: Dict[str, Any]):
+    """Uygulamayı gunicorn ile çalıştır"""
+    from gunicorn.app.base import BaseApplication
+
+    class OCRApplication(BaseApplication):
+        def load_config(self):
+            for key, value in options.items():
+                if key in self.cfg.settings and value is not None:
+                    self.cfg.set(key, value)
+
+        def load(self):
+            return import_target(target)[1]
+
+    OCRApplication().run()
+
+
+def run_fallback(target: str, bind: str, threads: int):
+    """gunicorn yoksa tek süreçli, iş parçacıklı sunucu (ısındırma yine yapılır)"""
+    module, app = import_target(target)
+    logger.warning("gunicorn yüklü değil, tek süreçli sunucu kullanılıyor")
+
+    _call_hook(module, 'warm_up')
+    host, _, port = bind.rpartition(':')
+    try:
+        app.run(host=host or '0.0.0.0', port=int(port), threaded=threads > 1, debug=False)
+    finally:
+        _call_hook(module, 'shutdown')
+
+
+def main(argv=None) -> int:
+    """Ana fonksiyon"""
+    parser = argparse.ArgumentParser(description='OCR sunucusunu üretim modunda çalıştır')
+    parser.add_argument('target', nargs='?',
+                        default=os.environ.get('OCR_APP', 'vision_codes.server:create_app()'),
+                        help="WSGI uygulaması, 'modül:değişken' veya 'modül:fabrika()' "
+                             "(varsayılan: vision_codes.server:create_app())")
+    parser.add_argument('--bind', '-b', default=os.environ.get('OCR_BIND', '0.0.0.0:8080'),
+                        help='Dinlenecek adres')
+    parser.add_argument('--workers', '-w', type=int,
+                        default=int(os.environ.get('OCR_WORKERS', os.cpu_count() or 1)),
+                        help='Worker süreç sayısı')
+    parser.add_argument('--threads', type=int, default=int(os.environ.get('OCR_THREADS', 1)),
+                        help='Worker başına iş parçacığı sayısı')
+    parser.add_argument('--timeout', type=int, default=int(os.environ.get('OCR_TIMEOUT', 120)),
+                        help='İstek zaman aşımı (sn, ısındırma süresini de kapsar)')
+    parser.add_argument('--graceful-timeout', type=int,
+                        default=int(os.environ.get('OCR_GRACEFUL_TIMEOUT', 30)),
+                        help='Kapanırken süren isteklerin bitmesi için beklenecek süre (sn)')
+    parser.add_argument('--keepalive', type=int, default=5, help='Keep-alive süresi (sn)')
+    parser.add_argument('--max-requests', type=int, default=0,
+                        help='Worker bu kadar istekten sonra yeniden başlatılır (0: kapalı)')
+    parser.add_argument('--backlog', type=int, default=2048, help='Bekleyen bağlantı kuyruğu')
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    # Proje kökündeki sunucu modülleri içe aktarılabilsin
+    sys.path.insert(0, os.getcwd())
+
+    # CSV/JSON sözlük worker'lar çatallanmadan önce ana süreçte bir kez derlenir;
+    # worker'lar derlenmiş dosyayı doğrudan açar
+    lexicon_path = os.environ.get('OCR_LEXICON_PATH')
+    if lexicon_path:
+        os.environ['OCR_LEXICON_PATH'] = ensure_compiled(lexicon_path)
+
+    try:
+        import gunicorn  # noqa: F401
+    except ImportError:
+        run_fallback(args.target, args.bind, args.threads)
+        return 0
+
+    run_gunicorn(args.target, build_options(args))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,326 @@
+"""
+OCR HTTP servisi - /ocr, /ocr/vin, /health ve /metrics tek bir paylaşılan VisionPipeline üzerinde
+
+Kullanım:
+    python -m vision_codes.serve "vision_codes.server:create_app()" --workers 4
+
+OCR motoru ve pipeline ayarları ortam değişkenleriyle seçilir (ServiceConfig.from_env).
+OCR_MICRO_BATCH=1 ile eşzamanlı istekler biriktirilip tek toplu OCR çağrısıyla işlenir;
+bunun için worker başına birden fazla iş parçacığı gerekir (--threads).
+"""
+import os
+import threading
+from dataclasses import dataclass, asdict, replace
+from typing import Any, Dict, List, Optional
+
+from flask import Flask, request, jsonify
+from flask_cors import CORS
+
+from .pipeline import VisionPipeline
+from .cache import ResultCache
+from .batcher import MicroBatcher
+from .ingest import read_request_image, decode_image
+from .serve import make_warmup_image
+from .cli import result_to_dict
+from .vin import clean_vin, is_valid_vin_format
+
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+@dataclass
+class ServiceConfig:
+    """Servis ayarları"""
+    ocr_type: str = 'tesseract'
+    tesseract_path: Optional[str] = None
+    roi_workers: int = 0
+    ocr_batch: bool = False
+    min_confidence: float = 0.7
+    fuzzy_threshold: float = 0.8
+    max_results: int = 0  # 0: erken çıkış kapalı
+    micro_batch: bool = False
+    batch_size: int = 8
+    batch_wait_ms: float = 10.0
+    lexicon_path: Optional[str] = None
+    fuzzy_index: str = 'matrix'
+    ocr_profiles: bool = False
+    preprocess_mode: str = 'full'
+    deskew_mode: str = 'roi'
+    service_name: str = 'VIN OCR'
+
+    @classmethod
+    def from_env(cls, **defaults) -> 'ServiceConfig':
+        """Ortam değişkenlerinden ayarları oku
+
+        OCR_ENGINE (tesseract, tesseract_api, paddle), OCR_TESSERACT_PATH,
+        OCR_ROI_WORKERS, OCR_BATCH, OCR_MIN_CONFIDENCE, OCR_FUZZY_THRESHOLD,
+        OCR_MICRO_BATCH, OCR_BATCH_SIZE, OCR_BATCH_WAIT_MS, OCR_LEXICON_PATH,
+        OCR_FUZZY_INDEX (matrix, bktree), OCR_PROFILES, OCR_MAX_RESULTS, OCR_PREPROCESS (full, fast, adaptive, variants),
+        OCR_DESKEW (roi, fast, frame)
+        """
+        config = replace(cls(), **defaults)
+        env = os.environ
+        return replace(
+            config,
+            ocr_type=env.get('OCR_ENGINE', config.ocr_type),
+            tesseract_path=env.get('OCR_TESSERACT_PATH', config.tesseract_path),
+            roi_workers=int(env.get('OCR_ROI_WORKERS', config.roi_workers)),
+            ocr_batch=_env_bool('OCR_BATCH', config.ocr_batch),
+            min_confidence=float(env.get('OCR_MIN_CONFIDENCE', config.min_confidence)),
+            fuzzy_threshold=float(env.get('OCR_FUZZY_THRESHOLD', config.fuzzy_threshold)),
+            max_results=int(env.get('OCR_MAX_RESULTS', config.max_results)),
+            micro_batch=_env_bool('OCR_MICRO_BATCH', config.micro_batch),
+            batch_size=int(env.get('OCR_BATCH_SIZE', config.batch_size)),
+            batch_wait_ms=float(env.get('OCR_BATCH_WAIT_MS', config.batch_wait_ms)),
+            lexicon_path=env.get('OCR_LEXICON_PATH', config.lexicon_path),
+            fuzzy_index=env.get('OCR_FUZZY_INDEX', config.fuzzy_index),
+            ocr_profiles=_env_bool('OCR_PROFILES', config.ocr_profiles),
+            preprocess_mode=env.get('OCR_PREPROCESS', config.preprocess_mode),
+            deskew_mode=env.get('OCR_DESKEW', config.deskew_mode),
+        )
+
+    def pipeline_settings(self) -> Dict[str, Any]:
+        """Sonucu etkileyen ayarlar (önbellek anahtarı için)"""
+        settings = asdict(self)
+        settings.pop('service_name')
+        settings.pop('roi_workers')
+        settings.pop('batch_size')
+        settings.pop('batch_wait_ms')
+        return settings
+
+
+class OCRService:
+    """Paylaşılan, önceden kurulmuş pipeline üzerinde VIN tanıma servisi"""
+
+    def __init__(self, config: Optional[ServiceConfig] = None,
+                 pipeline: Optional[VisionPipeline] = None,
+                 cache: Optional[ResultCache] = None):
+        self.config = config or ServiceConfig.from_env()
+
+        if pipeline is None:
+            pipeline = VisionPipeline(
+                ocr_type=self.config.ocr_type,
+                tesseract_path=self.config.tesseract_path,
+                roi_workers=self.config.roi_workers,
+                ocr_batch=self.config.ocr_batch,
+                lexicon_path=self.config.lexicon_path,
+                fuzzy_index=self.config.fuzzy_index,
+                ocr_profiles=self.config.ocr_profiles,
+                preprocess_mode=self.config.preprocess_mode,
+                deskew_mode=self.config.deskew_mode,
+            )
+            pipeline.min_confidence = self.config.min_confidence
+            pipeline.fuzzy_threshold = self.config.fuzzy_threshold
+            pipeline.max_results = self.config.max_results or None
+        self.pipeline = pipeline
+        self.lexicon = pipeline.lexicon
+
+        self.cache = cache if cache is not None else ResultCache.from_env()
+        self.ready = threading.Event()
+
+        # Mikro-toplu işleme: istekler kısa süre biriktirilip birlikte tanınır
+        self.batcher: Optional[MicroBatcher] = None
+        if self.config.micro_batch:
+            self.batcher = MicroBatcher(
+                self._process_batch,
+                max_batch_size=self.config.batch_size,
+                max_wait_ms=self.config.batch_wait_ms,
+                name='ocr-micro-batcher',
+            ).start()
+
+    def recognize(self, image_bytes: bytes):
+        """Görüntüyü tanı, (sonuç sözlükleri, önbellekten mi) döndür
+
+        Görüntü çözülemezse ValueError fırlatır.
+        """
+        cache_key = self.cache.make_key(image_bytes, self.config.pipeline_settings())
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached, True
+
+        image = decode_image(image_bytes)
+        if image is None:
+            raise ValueError('Görüntü decode edilemedi')
+
+        if self.batcher is not None:
+            results = self.batcher.submit(image).result()
+        else:
+            results = [result_to_dict(r) for r in self.pipeline.process_image(image)]
+        self.cache.put(cache_key, results)
+        return results, False
+
+    def _process_batch(self, images) -> List[List[Dict[str, Any]]]:
+        """Biriken görüntüleri tek toplu pipeline çağrısıyla tanı"""
+        return [[result_to_dict(r) for r in results]
+                for results in self.pipeline.process_images(images)]
+
+    def metrics(self) -> Dict[str, Any]:
+        """Önbellek ve kuyruk metrikleri"""
+        metrics = {'cache': self.cache.stats()}
+        if self.batcher is not None:
+            metrics['batcher'] = self.batcher.stats()
+        return metrics
+
+    def extract_vins(self, results: List[Dict[str, Any]]) -> List[str]:
+        """Sonuçlardan geçerli biçimdeki VIN'leri çıkar (en uzun ve en güvenilir önce)"""
+        vins = []
+        for result in sorted(results, key=lambda r: (len(r['code']), r['confidence']), reverse=True):
+            if result['category'] != 'VIN':
+                continue
+            vin = clean_vin(result['code'])
+            if is_valid_vin_format(vin) and vin not in vins:
+                vins.append(vin)
+        return vins
+
+    def vin_response(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """/ocr/vin yanıtı"""
+        vins = self.extract_vins(results)
+        return {
+            'success': True,
+            'vins': vins,
+            'count': len(vins)
+        }
+
+    def ocr_response(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """/ocr yanıtı (VIN, üretici ve model analizi)"""
+        vins = self.extract_vins(results)
+        if not vins:
+            return {
+                'success': False,
+                'vins': [],
+                'message': 'No VINs found'
+            }
+
+        best_vin = vins[0]
+        best = next(r for r in results if clean_vin(r['code']) == best_vin)
+
+        # WMI kontrolü
+        manufacturer = self.lexicon.wmi_codes.get(best_vin[:3])
+
+        # Model kodu kontrolü (VIN'deki konum sırasıyla, tek geçişte)
+        models = list(dict.fromkeys(
+            occurrence.value for occurrence in self.lexicon.find_code_occurrences(best_vin, 'Model')
+        ))
+
+        # Fuzzy matching
+        if not manufacturer or not models:
+            fuzzy = self.lexicon.find_fuzzy_match(best_vin, 0.7)
+            if not manufacturer:
+                manufacturer = next((m.manufacturer for m in fuzzy if m.category == 'WMI'), None)
+            if not models:
+                models = [m.model for m in fuzzy if m.category == 'Model']
+
+        return {
+            'success': True,
+            'vins': vins,
+            'best_vin': best_vin,
+            'manufacturer': manufacturer,
+            'models': models,
+            'confidence': best['confidence']
+        }
+
+    def warm_up(self):
+        """Sözlük indekslerini kur ve pipeline'ı örnek bir görüntüyle ısındır"""
+        self.lexicon.build_indexes()
+        if self.batcher is not None:
+            self.pipeline.process_images([make_warmup_image()])
+        else:
+            self.pipeline.process_image(make_warmup_image())
+        self.ready.set()
+
+    def shutdown(self):
+        """Kaynakları bırak"""
+        self.ready.clear()
+        if self.batcher is not None:
+            self.batcher.stop()
+        self.pipeline.close()
+
+
+def create_app(config: Optional[ServiceConfig] = None,
+               service: Optional[OCRService] = None) -> Flask:
+    """Flask uygulamasını oluştur"""
+    global _service
+
+    service = service or OCRService(config)
+    _service = service
+
+    app = Flask(__name__)
+    CORS(app)
+    app.extensions['ocr_service'] = service
+
+    def handle(build_response):
+        # image/jpeg, image/png, multipart veya JSON/base64 gövde
+        try:
+            image_bytes = read_request_image(request)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        if not image_bytes:
+            return jsonify({'error': 'No image provided'}), 400
+
+        try:
+            results, cached = service.recognize(image_bytes)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+
+        return jsonify({**build_response(results), 'cached': cached})
+
+    @app.route('/ocr', methods=['POST'])
+    def ocr_endpoint():
+        """VIN, üretici ve model analizi"""
+        return handle(service.ocr_response)
+
+    @app.route('/ocr/vin', methods=['POST'])
+    def ocr_vin():
+        """VIN listesi"""
+        return handle(service.vin_response)
+
+    @app.route('/health', methods=['GET'])
+    def health_check():
+        """Sağlık kontrolü"""
+        status = {
+            'service': service.config.service_name,
+            'engine': service.config.ocr_type,
+        }
+        if not service.ready.is_set():
+            return jsonify({**status, 'status': 'warming'}), 503
+        return jsonify({**status, 'status': 'healthy', **service.metrics()})
+
+    @app.route('/metrics', methods=['GET'])
+    def metrics():
+        """Önbellek ve mikro-toplu kuyruk metrikleri"""
+        return jsonify(service.metrics())
+
+    return app
+
+
+# Son oluşturulan servis (vision_codes.serve kancaları için)
+_service: Optional[OCRService] = None
+
+
+def warm_up():
+    """Worker başlangıcında servisi ısındır"""
+    if _service is not None:
+        _service.warm_up()
+
+
+def shutdown():
+    """Worker kapanırken servisi kapat"""
+    if _service is not None:
+        _service.shutdown()
+
+
+def run(config: Optional[ServiceConfig] = None, host: str = '0.0.0.0', port: int = 8080):
+    """Geliştirme sunucusuyla çalıştır"""
+    app = create_app(config)
+    warm_up()
+    app.run(host=host, port=port, debug=False, threaded=True)
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,326 @@
+"""
+Video/akış modülü - kamera, RTSP veya video dosyasından sürekli kod tanıma
+"""
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+from .pipeline import VisionPipeline, DetectionResult
+
+
+@dataclass
+class StreamDetection:
+    """Ardışık karelerde oylanarak kararlı hale gelmiş tespit"""
+    code: str
+    manufacturer: str
+    model: str
+    category: str
+    confidence: float  # oy veren karelerdeki ortalama güven
+    votes: int
+    frames: int  # iz boyunca işlenen kare sayısı
+    first_frame: int
+    last_frame: int
+    bbox: Tuple[int, int, int, int]
+
+
+def parse_source(source: Union[str, int]) -> Union[str, int]:
+    """'0' gibi kamera indekslerini tamsayıya çevir"""
+    if isinstance(source, str) and source.isdigit():
+        return int(source)
+    return source
+
+
+def is_live_source(source: Union[str, int]) -> bool:
+    """Kamera veya ağ akışı mı (dosya değil)"""
+    return isinstance(source, int) or '://' in source
+
+
+class FrameReader:
+    """cv2.VideoCapture üzerinden kare okuyucu
+
+    Canlı kaynaklarda arka planda sürekli okur ve yalnızca en son kareyi tutar;
+    işleme geride kalırsa eski kareler atılır. Dosyalarda kareler sırayla
+    okunur ve frame_skip kadar kare atlanır.
+    """
+
+    def __init__(self, source: Union[str, int], frame_skip: int = 0,
+                 live: Optional[bool] = None):
+        self.source = parse_source(source)
+        self.frame_skip = max(0, frame_skip)
+        self.live = is_live_source(self.source) if live is None else live
+
+        self.capture = cv2.VideoCapture(self.source)
+        if not self.capture.isOpened():
+            raise IOError(f"Video kaynağı açılamadı: {source}")
+
+        # İstatistikler
+        self.frames_read = 0
+        self.frames_dropped = 0
+
+        self._latest: Optional[Tuple[int, np.ndarray]] = None
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+        if self.live:
+            self._thread = threading.Thread(target=self._grab_loop, name='frame-reader', daemon=True)
+            self._thread.start()
+
+    def __iter__(self) -> Iterator[Tuple[int, np.ndarray]]:
+        """(kare indeksi, kare) üret"""
+        return self._iter_live() if self.live else self._iter_file()
+
+    def _iter_file(self) -> Iterator[Tuple[int, np.ndarray]]:
+        index = -1
+        while not self._stopped:
+            # Atlanacak kareleri çözmeden geç
+            for _ in range(self.frame_skip if index >= 0 else 0):
+                if not self.capture.grab():
+                    return
+                index += 1
+                self.frames_read += 1
+                self.frames_dropped += 1
+
+            ok, frame = self.capture.read()
+            if not ok:
+                return
+            index += 1
+            self.frames_read += 1
+            yield index, frame
+
+    def _iter_live(self) -> Iterator[Tuple[int, np.ndarray]]:
+        last_index = -1
+        while True:
+            with self._condition:
+                while not self._stopped and (self._latest is None or self._latest[0] == last_index):
+                    self._condition.wait()
+                if self._latest is None or self._latest[0] == last_index:
+                    return
+                index, frame = self._latest
+
+            # Arada kaçırılan kareler atılmış sayılır
+            self.frames_dropped += index - last_index - 1
+            last_index = index
+            yield index, frame
+
+    def _grab_loop(self):
+        index = -1
+        while not self._stopped:
+            ok, frame = self.capture.read()
+            if not ok:
+                break
+            index += 1
+            self.frames_read += 1
+            with self._condition:
+                self._latest = (index, frame)
+                self._condition.notify()
+
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+    def close(self):
+        """Okumayı durdur ve kaynağı bırak"""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        self.capture.release()
+
+    def __enter__(self) -> 'FrameReader':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TemporalVoter:
+    """Ardışık karelerdeki tanımaları oylayarak araç başına tek tespit üretir
+
+    Her karenin en güvenilir sonucu bir oydur. Önde giden kod min_votes oya
+    ulaştığında bir kez yayınlanır. max_gap kare boyunca sonuç gelmezse araç
+    gitmiş sayılır ve yeni iz başlar. Yayından sonra yayınlanan kodun son
+    okunduğu kareden bu yana gelen oylar ayrıca sayılır; orada başka bir kod
+    min_votes oya ulaşırsa (araçlar arasında boşluk kalmadan) yeni iz bu
+    oylarla başlar.
+    """
+
+    def __init__(self, min_votes: int = 3, max_gap: int = 15):
+        self.min_votes = max(1, min_votes)
+        self.max_gap = max_gap
+        self._reset()
+
+    def _reset(self):
+        self.votes: Counter = Counter()
+        self._confidence: Dict[str, float] = {}
+        self._best: Dict[str, DetectionResult] = {}
+        self.first_frame: Optional[int] = None
+        self.last_frame: Optional[int] = None
+        self.frames = 0
+        self.emitted = False
+        self.emitted_code: Optional[str] = None
+        self._successor: Optional['TemporalVoter'] = None  # yayından sonraki oylar
+
+    @property
+    def active(self) -> bool:
+        """Şu an bir araç izleniyor mu"""
+        return self.first_frame is not None
+
+    def update(self, frame_index: int, results: List[DetectionResult]) -> Optional[StreamDetection]:
+        """Kare sonucunu ekle, kararlı hale gelen tespit varsa döndür"""
+        if not self._add(frame_index, results):
+            if self.emitted:
+                self._successor._add(frame_index, results)
+            return None
+
+        if self.emitted:
+            return self._update_successor(frame_index, results)
+
+        code, votes = self.votes.most_common(1)[0]
+        if votes < self.min_votes:
+            return None
+
+        self.emitted = True
+        self.emitted_code = code
+        self._successor = TemporalVoter(self.min_votes, self.max_gap)
+        return self._detection(code)
+
+    def hold(self, frame_index: int):
+        """Sahne değişmeyen kareyi oy saymadan izi canlı tutmak için ekle
+
+        Kare değişim kontrolünün yeniden kullandığı sonuç yeni bir okuma değildir;
+        oy sayılırsa tek bir hatalı okuma durağan karelerde min_votes oya ulaşır.
+        """
+        if self.active and frame_index - self.last_frame <= self.max_gap:
+            self.last_frame = frame_index
+            self.frames += 1
+
+    def _add(self, frame_index: int, results: List[DetectionResult]) -> bool:
+        """Karenin oyunu ekle (sonuç yoksa False)"""
+        if self.active and frame_index - self.last_frame > self.max_gap:
+            self._reset()
+
+        if not results:
+            if self.active:
+                self.frames += 1
+            return False
+
+        best = max(results, key=lambda r: r.confidence)
+        if not self.active:
+            self.first_frame = frame_index
+        self.last_frame = frame_index
+        self.frames += 1
+
+        self.votes[best.code] += 1
+        self._confidence[best.code] = self._confidence.get(best.code, 0.0) + best.confidence
+        if best.code not in self._best or best.confidence > self._best[best.code].confidence:
+            self._best[best.code] = best
+        return True
+
+    def _update_successor(self, frame_index: int, results: List[DetectionResult]) -> Optional[StreamDetection]:
+        """Yayınlanan koddan sonra başka bir kod min_votes oya ulaştıysa izi ona devret"""
+        if max(results, key=lambda r: r.confidence).code == self.emitted_code:
+            # Yayınlanan araç hâlâ görünüyor, araya giren okumalar gürültüdür
+            self._successor = TemporalVoter(self.min_votes, self.max_gap)
+            return None
+
+        successor = self._successor
+        successor._add(frame_index, results)
+
+        code, votes = successor.votes.most_common(1)[0]
+        if votes < self.min_votes:
+            return None
+
+        self._reset()
+        self.votes = successor.votes
+        self._confidence = successor._confidence
+        self._best = successor._best
+        self.first_frame = successor.first_frame
+        self.last_frame = successor.last_frame
+        self.frames = successor.frames
+        self.emitted = True
+        self.emitted_code = code
+        self._successor = TemporalVoter(self.min_votes, self.max_gap)
+        return self._detection(code)
+
+    def _detection(self, code: str) -> StreamDetection:
+        best = self._best[code]
+        votes = self.votes[code]
+        return StreamDetection(
+            code=code,
+            manufacturer=best.manufacturer,
+            model=best.model,
+            category=best.category,
+            confidence=self._confidence[code] / votes,
+            votes=votes,
+            frames=self.frames,
+            first_frame=self.first_frame,
+            last_frame=self.last_frame,
+            bbox=best.bbox,
+        )
+
+    @property
+    def locked(self) -> bool:
+        """Geçerli araç için tespit zaten yayınlandı mı"""
+        return self.emitted
+
+
+def process_stream(pipeline: VisionPipeline, source: Union[str, int], frame_skip: int = 0,
+                   min_votes: int = 3, max_gap: int = 15, locked_skip: int = 5,
+                   max_frames: Optional[int] = None, live: Optional[bool] = None,
+                   reader: Optional[FrameReader] = None) -> Iterator[StreamDetection]:
+    """Akıştaki kareleri işle ve araç başına kararlı tespitleri üret
+
+    locked_skip: tespit yayınlandıktan sonra araç gidene kadar yalnızca her
+        locked_skip işlenebilir karede bir tam OCR çalıştırılır.
+    """
+    voter = TemporalVoter(min_votes=min_votes, max_gap=max_gap)
+    reader = reader or FrameReader(source, frame_skip=frame_skip, live=live)
+    since_locked = 0
+
+    try:
+        for index, frame in reader:
+            if max_frames is not None and index >= max_frames:
+                break
+
+            if voter.locked and voter.active and index - voter.last_frame <= max_gap:
+                since_locked += 1
+                if since_locked % max(1, locked_skip):
+                    continue
+            else:
+                since_locked = 0
+
+            results = pipeline.process_image(frame)
+            if pipeline.last_reused:
+                voter.hold(index)
+                continue
+
+            detection = voter.update(index, results)
+            if detection is not None:
+                yield detection
+    finally:
+        reader.close()
+
+
+def stream_detection_to_dict(detection: StreamDetection) -> dict:
+    """StreamDetection'ı dict'e çevir"""
+    return {
+        'code': detection.code,
+        'manufacturer': detection.manufacturer,
+        'model': detection.model,
+        'category': detection.category,
+        'confidence': detection.confidence,
+        'votes': detection.votes,
+        'frames': detection.frames,
+        'first_frame': detection.first_frame,
+        'last_frame': detection.last_frame,
+        'bbox': detection.bbox,
+        'timestamp': time.time(),
+    }
@@ -0,0 +1,83 @@
+"""
+Testlerde ortak sahte OCR ve pipeline fabrikası
+"""
+import random
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..detector import BoundingBox
+from ..ocr import OCRResult
+from ..pipeline import VisionPipeline
+
+
+# (görüntü, Tesseract ayarı) -> (metin, güven)
+Reader = Callable[..., Tuple[str, float]]
+
+
+def read_by_width(texts: Dict[int, str], confidence: float = 0.95) -> Reader:
+    """Görüntü genişliğine göre metin okuyan okuyucu (bilinmeyen genişlikte boş)"""
+    def read(image, config):
+        text = texts.get(image.shape[1], '')
+        return text, confidence if text else 0.0
+    return read
+
+
+def read_constant(text: str, confidence: float = 0.95) -> Reader:
+    """Her görüntüde aynı metni okuyan okuyucu"""
+    return lambda image, config: (text, confidence)
+
+
+def read_scripted(readings: Iterable[Tuple[str, float]]) -> Reader:
+    """Okumaları çağrı sırasıyla döndüren okuyucu"""
+    readings = list(readings)
+    return lambda image, config: readings.pop(0)
+
+
+class FakeOCR:
+    """Okuyucu fonksiyonla yapılandırılan, çağrıları kaydeden sahte OCR
+    
+    delay verilirse her okuma 0-delay saniye arası rastgele bekler (paralel
+    işlerin farklı sırada bitmesi için).
+    """
+    
+    def __init__(self, read: Optional[Reader] = None, delay: float = 0.0):
+        self.read = read or read_constant('', 0.0)
+        self.delay = delay
+        self.calls: List[Tuple[object, str]] = []  # (görüntü, ayar)
+        self.batches: List[Tuple[str, int]] = []  # (ayar, görüntü sayısı)
+        self.lock = threading.Lock()
+    
+    @property
+    def images(self) -> list:
+        return [image for image, _ in self.calls]
+    
+    @property
+    def configs(self) -> List[str]:
+        return [config for _, config in self.calls]
+    
+    def extract_text_with_confidence(self, image, config='--psm 6'):
+        with self.lock:
+            self.calls.append((image, config))
+        if self.delay:
+            time.sleep(random.uniform(0, self.delay))
+        text, confidence = self.read(image, config)
+        return OCRResult(text, confidence, (0, 0, image.shape[1], image.shape[0]))
+    
+    def extract_text_with_confidence_batch(self, images, config='--psm 6'):
+        with self.lock:
+            self.batches.append((config, len(images)))
+        return [self.extract_text_with_confidence(image, config) for image in images]
+    
+    def close(self):
+        pass
+
+
+def make_pipeline(boxes: Optional[List[BoundingBox]] = None, read: Optional[Reader] = None,
+                  delay: float = 0.0, **kwargs) -> VisionPipeline:
+    """Sahte OCR'lı, ROI'leri sabit (boxes boşsa tüm görüntü) pipeline"""
+    pipeline = VisionPipeline(**kwargs)
+    pipeline.ocr = FakeOCR(read, delay)
+    boxes = list(boxes or [])
+    pipeline.detector.detect_by_contours = lambda image: list(boxes)
+    return pipeline
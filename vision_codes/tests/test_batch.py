@@ -0,0 +1,54 @@
+"""
+Toplu işleme modülü testleri
+"""
+import os
+import tempfile
+import unittest
+
+from ..batch import collect_image_paths
+
+
+class TestCollectImagePaths(unittest.TestCase):
+    """collect_image_paths test sınıfı"""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        os.makedirs(os.path.join(self.root, 'sub'))
+        for name in ['a.jpg', 'b.PNG', 'notes.txt', os.path.join('sub', 'c.jpg')]:
+            with open(os.path.join(self.root, name), 'wb') as f:
+                f.write(b'')
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_directory(self):
+        """Dizin taraması testi"""
+        paths = collect_image_paths([self.root])
+        names = [os.path.relpath(p, self.root) for p in paths]
+        self.assertEqual(names, ['a.jpg', 'b.PNG'])
+        
+        # Alt dizinlerle birlikte
+        paths = collect_image_paths([self.root], recursive=True)
+        names = sorted(os.path.relpath(p, self.root) for p in paths)
+        self.assertEqual(names, ['a.jpg', 'b.PNG', os.path.join('sub', 'c.jpg')])
+    
+    def test_glob_and_file_list(self):
+        """Glob ve dosya listesi testi"""
+        list_path = os.path.join(self.root, 'list.txt')
+        with open(list_path, 'w') as f:
+            f.write(f"# yorum\n{os.path.join(self.root, 'sub', 'c.jpg')}\n\n")
+        
+        paths = collect_image_paths([os.path.join(self.root, '*.jpg')], file_list=list_path)
+        names = [os.path.relpath(p, self.root) for p in paths]
+        self.assertEqual(names, ['a.jpg', os.path.join('sub', 'c.jpg')])
+    
+    def test_deduplicates(self):
+        """Aynı dosyanın tekrar eklenmemesi testi"""
+        path = os.path.join(self.root, 'a.jpg')
+        paths = collect_image_paths([path, self.root, path])
+        self.assertEqual(paths.count(path), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
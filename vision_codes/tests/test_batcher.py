@@ -0,0 +1,73 @@
+"""
+Mikro-toplu işleme testleri
+"""
+import threading
+import time
+import unittest
+
+from ..batcher import MicroBatcher
+
+
+class TestMicroBatcher(unittest.TestCase):
+    """MicroBatcher test sınıfı"""
+    
+    def test_groups_concurrent_requests(self):
+        """Eşzamanlı istekler tek toplu çağrıda işlenmeli, sonuçlar sırayla dağıtılmalı"""
+        gate = threading.Event()
+        batches = []
+        
+        def process(items):
+            gate.wait(1)
+            batches.append(list(items))
+            return [item * 2 for item in items]
+        
+        batcher = MicroBatcher(process, max_batch_size=4, max_wait_ms=200).start()
+        try:
+            futures = [batcher.submit(i) for i in range(4)]
+            gate.set()
+            self.assertEqual([f.result(timeout=2) for f in futures], [0, 2, 4, 6])
+        finally:
+            batcher.stop(timeout=2)
+        
+        self.assertEqual(batches, [[0, 1, 2, 3]])
+        stats = batcher.stats()
+        self.assertEqual(stats['batches'], 1)
+        self.assertEqual(stats['items'], 4)
+        self.assertEqual(stats['batch_size_histogram'], {4: 1})
+        self.assertEqual(stats['queue_depth'], 0)
+    
+    def test_max_batch_size_and_errors(self):
+        """Toplu boyut sınırı aşılmamalı, hata tüm bekleyenlere iletilmeli"""
+        def process(items):
+            if 'bad' in items:
+                raise ValueError('bozuk')
+            return items
+        
+        batcher = MicroBatcher(process, max_batch_size=2, max_wait_ms=50).start()
+        try:
+            futures = [batcher.submit(item) for item in ('a', 'b', 'c')]
+            self.assertEqual([f.result(timeout=2) for f in futures], ['a', 'b', 'c'])
+            self.assertLessEqual(max(batcher.stats()['batch_size_histogram']), 2)
+            
+            with self.assertRaises(ValueError):
+                batcher.submit('bad').result(timeout=2)
+        finally:
+            batcher.stop(timeout=2)
+        
+        with self.assertRaises(RuntimeError):
+            batcher.submit('a')
+    
+    def test_stop_while_collecting(self):
+        """Toplama sırasında durdurulunca bekleyen iş bitmeli ve stop dönmeli"""
+        batcher = MicroBatcher(lambda items: items, max_batch_size=4, max_wait_ms=500).start()
+        thread = batcher._thread
+        future = batcher.submit('a')
+        time.sleep(0.01)
+        batcher.stop(timeout=3)
+        
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(future.result(timeout=0), 'a')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Sonuç önbelleği testleri
+"""
+import tempfile
+import time
+import unittest
+
+from ..cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+    """ResultCache test sınıfı"""
+    
+    def test_key(self):
+        """Anahtar görüntüye ve ayarlara bağlı olmalı"""
+        key = ResultCache.make_key(b'image', {'a': 1, 'b': 2})
+        self.assertEqual(key, ResultCache.make_key(b'image', {'b': 2, 'a': 1}))
+        self.assertNotEqual(key, ResultCache.make_key(b'image2', {'a': 1, 'b': 2}))
+        self.assertNotEqual(key, ResultCache.make_key(b'image', {'a': 1}))
+    
+    def test_lru_eviction(self):
+        """Kapasite aşıldığında en eski kullanılan atılmalı"""
+        cache = ResultCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)  # 'a' en son kullanılan olur
+        cache.put('c', 3)
+        
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.stats()['hits'], 3)
+        self.assertEqual(cache.stats()['misses'], 1)
+    
+    def test_ttl(self):
+        """Süresi dolan kayıt dönmemeli"""
+        cache = ResultCache(max_entries=4, ttl=0.05)
+        cache.put('a', {'vins': []})
+        self.assertEqual(cache.get('a'), {'vins': []})
+        time.sleep(0.1)
+        self.assertIsNone(cache.get('a'))
+    
+    def test_disk_tier(self):
+        """Disk katmanı yeni bir önbellek örneğinden okunabilmeli"""
+        with tempfile.TemporaryDirectory() as tmp:
+            ResultCache(max_entries=4, disk_dir=tmp).put('abcd', {'vins': ['VF1']})
+            
+            cache = ResultCache(max_entries=4, disk_dir=tmp)
+            self.assertEqual(cache.get('abcd'), {'vins': ['VF1']})
+            self.assertEqual(cache.stats()['disk_hits'], 1)
+            
+            # Disk katmanı tek başına da çalışmalı
+            disk_only = ResultCache(max_entries=0, disk_dir=tmp)
+            self.assertTrue(disk_only.enabled)
+            self.assertEqual(disk_only.get('abcd'), {'vins': ['VF1']})
+    
+    def test_disabled(self):
+        """Kapasite 0 ve disk yoksa önbellek kapalı"""
+        cache = ResultCache(max_entries=0)
+        self.assertFalse(cache.enabled)
+        cache.put('a', 1)
+        self.assertIsNone(cache.get('a'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Kare değişim tespiti testleri
+"""
+import unittest
+
+import numpy as np
+
+from ..change import FrameChangeGate
+from ..detector import BoundingBox
+from .helpers import make_pipeline, read_constant
+
+
+def make_frame(level=200, noise=0):
+    rng = np.random.default_rng(level + noise)
+    frame = np.full((360, 640, 3), level, np.int16)
+    if noise:
+        frame += rng.integers(-noise, noise + 1, frame.shape, dtype=np.int16)
+    return np.clip(frame, 0, 255).astype(np.uint8)
+
+
+class TestFrameChangeGate(unittest.TestCase):
+    """FrameChangeGate test sınıfı"""
+    
+    def test_static_and_changed_frames(self):
+        """Gürültülü ama aynı kare atlanmalı, sahne değişince işlenmeli"""
+        gate = FrameChangeGate(threshold=0.02)
+        self.assertTrue(gate.changed(make_frame(200)))
+        self.assertFalse(gate.changed(make_frame(200, noise=6)))
+        self.assertTrue(gate.changed(make_frame(120)))
+        self.assertEqual(gate.stats()['skipped'], 1)
+        
+        gate.reset()
+        self.assertTrue(gate.changed(make_frame(120)))
+    
+    def test_pipeline_reuses_results(self):
+        """Değişmeyen karelerde OCR yeniden çalışmamalı"""
+        pipeline = make_pipeline([BoundingBox(0, 0, 100, 40)], read_constant('VF1'), change_threshold=0.02)
+        
+        first = pipeline.process_image(make_frame(200))
+        calls = len(pipeline.ocr.calls)
+        second = pipeline.process_image(make_frame(200, noise=4))
+        self.assertEqual(second, first)
+        self.assertEqual(len(pipeline.ocr.calls), calls)
+        
+        pipeline.process_image(make_frame(40))
+        self.assertGreater(len(pipeline.ocr.calls), calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
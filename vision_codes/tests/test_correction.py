@@ -0,0 +1,83 @@
+"""
+VIN düzeltme testleri
+"""
+import unittest
+
+from ..correction import correct_vin, vin_corrections, correct_vin_in_text
+from ..vin import validate_vin_check_digit
+
+
+VIN = '1M8GDM9AXKP042788'
+
+
+class TestVinCorrection(unittest.TestCase):
+    """VIN düzeltme test sınıfı"""
+    
+    def test_single_confusion(self):
+        """Tek karışık karakter kontrol hanesiyle düzeltilmeli"""
+        for observed in ['1M8GDM9AXKP04Z788', 'IM8GDM9AXKP042788', '1MBGDM9AXKP042788']:
+            with self.subTest(observed=observed):
+                correction = correct_vin(observed)
+                self.assertEqual(correction.vin, VIN)
+                self.assertEqual(len(correction.changes), 1)
+    
+    def test_confidence_guides_choice(self):
+        """Düşük güvenli karakter değiştirilmeye aday olmalı"""
+        observed = '1HGCM8264AA004S52'
+        confidences = [0.95] * 17
+        confidences[14] = 0.3
+        correction = correct_vin(observed, confidences)
+        self.assertEqual(correction.vin, '1HGCM8264AA004552')
+        self.assertEqual(correction.changes, [(14, 'S', '5')])
+        self.assertTrue(validate_vin_check_digit(correction.vin))
+    
+    def test_position_rules(self):
+        """9. konum rakam/X, 10. konum U/Z/0 olamaz; sonuçlar kuralları sağlamalı"""
+        for correction in vin_corrections('1M8GDM9ASZP042788', top_k=5):
+            self.assertIn(correction.vin[8], '0123456789X')
+            self.assertNotIn(correction.vin[9], 'UZ0')
+            self.assertTrue(validate_vin_check_digit(correction.vin))
+        self.assertIsNone(correct_vin('1M8GDM9AXKP042788'[:16]))
+    
+    def test_european_vin_without_check_digit(self):
+        """Avrupa VIN'lerinde yalnızca I, O, Q düzeltilmeli"""
+        self.assertEqual(correct_vin_in_text('VF1RJA00012345678').changes, [])
+        correction = correct_vin_in_text('VIN: VF1RJAOOO12345678')
+        self.assertEqual(correction.vin, 'VF1RJA00012345678')
+        self.assertEqual(correction.start, 5)
+        self.assertEqual(len(correction.changes), 3)
+        
+        # Düşük güvenli geçerli karakterler de körlemesine değiştirilmemeli
+        confidences = [0.9] * 17
+        confidences[5] = 0.3
+        correction = correct_vin_in_text('VF1RJS00012345678', confidences,
+                                         alternatives=[[('5', 0.6)] if i == 5 else [] for i in range(17)])
+        self.assertEqual(correction.vin, 'VF1RJS00012345678')
+        self.assertEqual(correction.changes, [])
+    
+    def test_ocr_alternatives(self):
+        """OCR alternatifleri karışıklık tablosunda olmayan düzeltmeleri mümkün kılmalı"""
+        observed = '1HGCM8264AA004R52'
+        confidences = [0.95] * 17
+        confidences[14] = 0.5
+        alternatives = [[] for _ in range(17)]
+        alternatives[14] = [('5', 0.4)]
+        
+        self.assertNotEqual(correct_vin(observed, confidences).vin, '1HGCM8264AA004552')
+        correction = correct_vin(observed, confidences, alternatives=alternatives)
+        self.assertEqual(correction.changes, [(14, 'R', '5')])
+    
+    def test_lock_confidence(self):
+        """Güveni eşiğin üstündeki karakterler değiştirilmemeli"""
+        observed = '1HGCM8264AA004S52'
+        self.assertIsNotNone(correct_vin(observed, [0.99] * 17))
+        self.assertIsNone(correct_vin(observed, [0.99] * 17, lock_confidence=0.95))
+        
+        confidences = [0.99] * 17
+        confidences[14] = 0.5
+        correction = correct_vin(observed, confidences, lock_confidence=0.95)
+        self.assertEqual(correction.changes, [(14, 'S', '5')])
+
+
+if __name__ == '__main__':
+    unittest.main()
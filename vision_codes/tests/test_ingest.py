@@ -0,0 +1,70 @@
+"""
+HTTP görüntü alma testleri
+"""
+import base64
+import io
+import unittest
+
+import cv2
+import numpy as np
+
+from ..ingest import read_request_image, decode_image
+
+try:
+    from flask import Flask, request, jsonify
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+@unittest.skipUnless(FLASK_AVAILABLE, "flask yüklü değil")
+class TestReadRequestImage(unittest.TestCase):
+    """read_request_image test sınıfı"""
+    
+    def setUp(self):
+        image = np.zeros((20, 30, 3), dtype=np.uint8)
+        image[5:15, 10:20] = (0, 0, 255)
+        self.png = cv2.imencode('.png', image)[1].tobytes()
+        
+        app = Flask(__name__)
+        
+        @app.route('/echo', methods=['POST'])
+        def echo():
+            data = read_request_image(request)
+            if data is None:
+                return jsonify({'error': 'yok'}), 400
+            decoded = decode_image(data)
+            return jsonify({'size': len(data), 'shape': list(decoded.shape)})
+        
+        self.client = app.test_client()
+    
+    def check(self, response):
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json, {'size': len(self.png), 'shape': [20, 30, 3]})
+    
+    def test_raw_body(self):
+        """image/png gövde"""
+        self.check(self.client.post('/echo', data=self.png, content_type='image/png'))
+    
+    def test_multipart(self):
+        """multipart/form-data gövde"""
+        self.check(self.client.post(
+            '/echo', data={'image': (io.BytesIO(self.png), 'frame.png')},
+            content_type='multipart/form-data'
+        ))
+    
+    def test_json_base64(self):
+        """JSON/base64 gövde (geriye uyumluluk)"""
+        self.check(self.client.post('/echo', json={'image': base64.b64encode(self.png).decode()}))
+        self.check(self.client.post(
+            '/echo', json={'image': 'data:image/png;base64,' + base64.b64encode(self.png).decode()}
+        ))
+    
+    def test_missing(self):
+        """Görüntü yoksa None"""
+        self.assertEqual(self.client.post('/echo', json={}).status_code, 400)
+        self.assertEqual(self.client.post('/echo', data=b'', content_type='image/jpeg').status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,6 +27,20 @@ class TestRenaultDaciaLexicon(unittest.TestCase):
                 result = self.lexicon.normalize_text(input_text)
                 self.assertEqual(result, expected)
     
+    def test_normalize_keeps_letters(self):
+        """Normalizasyon geçerli harfleri karışık rakamlara çevirmemeli"""
+        self.assertEqual(self.lexicon.normalize_text('djf'), 'DJF')
+        self.assertEqual(self.lexicon.find_exact_match('JLO').model, self.lexicon.model_codes['JLO'])
+    
+    def test_wmi_lookalikes(self):
+        """WMI'de rakam yerine okunan I/O düzeltilmeli, diğer harfler değişmemeli"""
+        for text, code in [('VFI', 'VF1'), ('uui', 'UU1'), ('VF1', 'VF1')]:
+            with self.subTest(text=text):
+                match = self.lexicon.find_exact_match(text)
+                self.assertEqual((match.code, match.category), (code, 'WMI'))
+        self.assertLess(self.lexicon.find_exact_match('VFI').confidence, 1.0)
+        self.assertIsNone(self.lexicon.find_exact_match('VOI'))
+    
     def test_find_exact_match(self):
         """Tam eşleşme testi"""
         # WMI testleri
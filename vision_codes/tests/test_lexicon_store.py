@@ -0,0 +1,110 @@
+"""
+Sözlük deposu testleri
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from ..lexicon import RenaultDaciaLexicon
+from ..lexicon_store import compile_lexicon, ensure_compiled, load_entries, open_lexicon, LexiconStore
+
+
+CSV_SOURCE = """code,category,value
+VF1,WMI,Renault (Fransa)
+UU1,WMI,Dacia (Fransa)
+WVW,WMI,Volkswagen
+RJA,Model,Clio
+RHN,Model,Austral
+AU2,Model,Golf Çok Amaçlı
+"""
+
+
+class TestLexiconStore(unittest.TestCase):
+    """LexiconStore test sınıfı"""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.tmpdir, 'codes.csv')
+        with open(self.csv_path, 'w', encoding='utf-8') as f:
+            f.write(CSV_SOURCE)
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+    
+    def test_compile_and_lookup(self):
+        """Derlenmiş dosyada arama, üyelik ve sıralı gezinme"""
+        path = os.path.join(self.tmpdir, 'codes.vclx')
+        compile_lexicon(load_entries(self.csv_path), path)
+        store = LexiconStore(path)
+        
+        wmi = store.table('wmi')
+        self.assertEqual(wmi['WVW'], 'Volkswagen')
+        self.assertIn('VF1', wmi)
+        self.assertNotIn('VF', wmi)
+        self.assertNotIn('ZZZ', wmi)
+        self.assertEqual(list(wmi), ['UU1', 'VF1', 'WVW'])
+        self.assertEqual(store.table('model')['AU2'], 'Golf Çok Amaçlı')
+        self.assertEqual(len(store.table('model')), 3)
+        with self.assertRaises(KeyError):
+            wmi['XXX']
+    
+    def test_json_source_and_auto_compile(self):
+        """JSON kaynak açıldığında yanına derlenmeli"""
+        json_path = os.path.join(self.tmpdir, 'codes.json')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump({'wmi_codes': {'VF1': 'Renault'}, 'model_codes': {'RJA': 'Clio'}}, f)
+        
+        store = open_lexicon(json_path)
+        self.assertTrue(os.path.exists(os.path.join(self.tmpdir, 'codes.vclx')))
+        self.assertEqual(store.table('model')['RJA'], 'Clio')
+    
+    def test_lexicon_from_path(self):
+        """Sözlük dosyadan yüklendiğinde tam ve fuzzy eşleşme çalışmalı"""
+        lexicon = RenaultDaciaLexicon(path=self.csv_path)
+        
+        match = lexicon.find_exact_match('wvw')
+        self.assertEqual(match.category, 'WMI')
+        self.assertEqual(match.manufacturer, 'Volkswagen')
+        self.assertEqual(lexicon.find_exact_match('RHN').model, 'Austral')
+        self.assertEqual(lexicon.find_fuzzy_match('RJAK', 0.85)[0].model, 'Clio')
+        self.assertEqual(len(lexicon.all_codes), 6)
+    
+    def test_build_indexes(self):
+        """İndeksler ilk aramadan önce kurulabilmeli"""
+        lexicon = RenaultDaciaLexicon(path=self.csv_path)
+        self.assertIsNone(lexicon.matcher)
+        lexicon.build_indexes()
+        self.assertIsNotNone(lexicon.matcher)
+        self.assertIsNotNone(lexicon.automaton)
+    
+    def test_concurrent_compile(self):
+        """Aynı dosyayı eşzamanlı derleyenler birbirini bozmamalı"""
+        json_path = os.path.join(self.tmpdir, 'big.json')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump({'wmi_codes': {f'W{i:05d}': 'Üretici' for i in range(20000)},
+                       'model_codes': {'RJA': 'Clio'}}, f)
+        
+        def compile_and_open(_):
+            os.utime(json_path)  # her çağrıda yeniden derlensin
+            return len(open_lexicon(json_path).table('wmi'))
+        
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            self.assertEqual(list(executor.map(compile_and_open, range(12))), [20000] * 12)
+        self.assertEqual(sorted(os.listdir(self.tmpdir)), ['big.json', 'big.vclx', 'codes.csv'])
+    
+    def test_failed_compile_cleans_up(self):
+        """Yazma hatasında geçici dosya kalmamalı, eski dosya korunmalı"""
+        path = ensure_compiled(self.csv_path)
+        with mock.patch('os.replace', side_effect=OSError('disk dolu')):
+            with self.assertRaises(OSError):
+                compile_lexicon(load_entries(self.csv_path), path)
+        self.assertEqual(sorted(os.listdir(self.tmpdir)), ['codes.csv', 'codes.vclx'])
+        self.assertEqual(LexiconStore(path).table('wmi')['VF1'], 'Renault (Fransa)')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Eşleştirme motoru testleri
+"""
+import argparse
+import difflib
+import random
+import unittest
+
+from .. import matching
+from ..matching import (CodeMatcher, BKTreeIndex, AhoCorasick, similarity_ratio,
+                        indel_distance, length_bounds)
+from ..lexicon import RenaultDaciaLexicon
+from ..pipeline import VisionPipeline
+from ..cli import add_pipeline_arguments, pipeline_options
+
+
+ALPHABET = 'ABCDEFGHJKLMNPRSTUVWXYZ0123456789'
+
+
+def random_code(rng, low, high):
+    return ''.join(rng.choice(ALPHABET) for _ in range(rng.randint(low, high)))
+
+
+class TestCodeMatcher(unittest.TestCase):
+    """CodeMatcher test sınıfı"""
+    
+    def test_matches_scalar_ratio(self):
+        """Vektörel skorlar tekil LCS oranıyla aynı, SequenceMatcher'dan düşük olmamalı"""
+        rng = random.Random(7)
+        codes = [random_code(rng, 1, 20) for _ in range(200)]
+        matcher = CodeMatcher(codes)
+        
+        for _ in range(50):
+            text = random_code(rng, 1, 25)
+            for code, ratio in zip(matcher.codes, matcher.ratios(text)):
+                self.assertAlmostEqual(ratio, similarity_ratio(text, code))
+                self.assertGreaterEqual(ratio + 1e-9, difflib.SequenceMatcher(None, text, code).ratio())
+    
+    def test_pure_python_fallback(self):
+        """python-Levenshtein olmadan da aynı skor"""
+        available = matching.LEVENSHTEIN_AVAILABLE
+        matching.LEVENSHTEIN_AVAILABLE = False
+        try:
+            self.assertAlmostEqual(similarity_ratio('VF1RJA', 'VF1R7A'), 10 / 12)
+            self.assertAlmostEqual(similarity_ratio('ABC', 'XYZ'), 0.0)
+        finally:
+            matching.LEVENSHTEIN_AVAILABLE = available
+    
+    def test_match_threshold_and_order(self):
+        """Eşik altı elenmeli, sonuçlar skora göre sıralı olmalı"""
+        matcher = CodeMatcher(['RJA', 'RJK', 'RFK', 'VF1'])
+        matches = matcher.match('RJAK', 0.8)
+        self.assertEqual([code for code, _ in matches], ['RJA', 'RJK'])
+        self.assertAlmostEqual(matches[0][1], 6 / 7)
+        self.assertEqual(matcher.match('', 0.5), [])
+    
+    def test_lexicon_uses_matcher(self):
+        """Sözlük eklenen kodlardan sonra eşleştiriciyi yeniden derlemeli"""
+        lexicon = RenaultDaciaLexicon()
+        self.assertEqual(lexicon.find_fuzzy_match('RJAK', 0.85)[0].code, 'RJA')
+        
+        lexicon.model_codes['XYW'] = 'Test'
+        lexicon.all_codes['XYW'] = 'Test'
+        self.assertEqual(lexicon.find_fuzzy_match('XYWK', 0.85)[0].model, 'Test')
+
+
+class TestBKTreeIndex(unittest.TestCase):
+    """BKTreeIndex test sınıfı"""
+    
+    def test_same_results_as_matrix(self):
+        """BK-ağacı tam taramayla aynı sonuçları vermeli ve dalları budamalı"""
+        rng = random.Random(11)
+        codes = [random_code(rng, 3, 10) for _ in range(2000)]
+        index = BKTreeIndex(codes)
+        matcher = CodeMatcher(codes)
+        
+        queries = [code[:-1] + 'X' for code in rng.sample(codes, 30)]
+        queries += [random_code(rng, 1, 14) for _ in range(30)]
+        for threshold in (0.7, 0.8, 0.9):
+            for text in queries:
+                self.assertEqual(index.match(text, threshold), matcher.match(text, threshold))
+        
+        stats = index.stats()
+        self.assertEqual(stats['lookups'], 180)
+        self.assertGreater(stats['pruned_ratio'], 0.5)
+    
+    def test_distance_helpers(self):
+        """Mesafe ve uzunluk sınırları oranla tutarlı olmalı"""
+        self.assertEqual(indel_distance('VF1', 'VF2'), 2)
+        self.assertEqual(indel_distance('RJA', 'RJAK'), 1)
+        self.assertEqual(length_bounds(3, 0.8), (2, 4))
+    
+    def test_lexicon_bktree(self):
+        """Sözlük BK-ağacı indeksiyle de aynı eşleşmeleri bulmalı"""
+        lexicon = RenaultDaciaLexicon(fuzzy_index='bktree')
+        self.assertEqual(lexicon.find_fuzzy_match('RJAK', 0.85)[0].code, 'RJA')
+        self.assertEqual(lexicon.index_stats()['lookups'], 1)
+        
+        with self.assertRaises(ValueError):
+            RenaultDaciaLexicon(fuzzy_index='trigram')
+    
+    def test_pipeline_bktree(self):
+        """fuzzy_index pipeline, CLI ve servis ayarlarından sözlüğe geçmeli"""
+        self.assertEqual(VisionPipeline(fuzzy_index='bktree').lexicon.fuzzy_index, 'bktree')
+        self.assertEqual(VisionPipeline().lexicon.fuzzy_index, 'matrix')
+        
+        parser = argparse.ArgumentParser()
+        add_pipeline_arguments(parser)
+        kwargs, _ = pipeline_options(parser.parse_args(['--fuzzy-index', 'bktree']))
+        self.assertEqual(kwargs['fuzzy_index'], 'bktree')
+
+
+class TestAhoCorasick(unittest.TestCase):
+    """AhoCorasick test sınıfı"""
+    
+    def test_matches_brute_force(self):
+        """Örtüşen eşleşmeler dahil tüm konumlar bulunmalı"""
+        rng = random.Random(5)
+        for _ in range(200):
+            patterns = [random_code(rng, 1, 4).replace('D', 'A') for _ in range(rng.randint(1, 10))]
+            text = ''.join(rng.choice('ABC0') for _ in range(rng.randint(0, 30)))
+            expected = sorted(((i, p) for p in set(patterns) for i in range(len(text))
+                               if text.startswith(p, i)), key=lambda m: (m[0], -len(m[1])))
+            self.assertEqual(AhoCorasick(patterns).find_all(text), expected)
+    
+    def test_lexicon_occurrences(self):
+        """Sözlük kodları VIN içindeki konumlarıyla bulunmalı"""
+        lexicon = RenaultDaciaLexicon()
+        occurrences = lexicon.find_code_occurrences('vf1rja00012345678')
+        self.assertEqual([(o.code, o.category, o.start, o.end) for o in occurrences],
+                         [('VF1', 'WMI', 0, 3), ('RJA', 'Model', 3, 6)])
+        self.assertEqual([o.value for o in lexicon.find_code_occurrences('XXRHNXX', 'Model')],
+                         ['Austral'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,253 @@
+"""
+OCR modülü testleri
+"""
+import threading
+import unittest
+from unittest import mock
+
+import cv2
+import numpy as np
+
+from .. import ocr
+from ..ocr import (OCRManager, TesseractOCR, TesseractAPIOCR, TESSEROCR_AVAILABLE, pack_mosaics,
+                   parse_tesseract_config, parse_hocr_words, _result_from_data,
+                   _regions_from_data, _result_from_words)
+
+
+HOCR = """<div class='ocr_page'><span class='ocr_line' title='bbox 0 0 100 20'>
+<span class='ocrx_word' title='bbox 10 2 40 18; x_wconf 91'>
+<span class='ocrx_cinfo' title='x_bboxes 10 2 20 18; x_conf 99.1'>V</span>
+<span class='ocrx_cinfo' title='x_bboxes 20 2 30 18; x_conf 62.5'>F</span>
+<span class='ocrx_cinfo' title='x_bboxes 30 2 40 18; x_conf 95'>1</span>
+<span class='ocrx_cinfo' id='lstm_choices_1_1_1'><span class='ocr_glyph' title='x_confs 99'>V</span></span>
+<span class='ocrx_cinfo' id='lstm_choices_1_1_2'><span class='ocr_glyph' title='x_confs 62'>F</span><span class='ocr_glyph' title='x_confs 30'>E</span><span class='ocr_glyph' title='x_confs 5'>P</span></span>
+<span class='ocrx_cinfo' id='lstm_choices_1_1_3'><span class='ocr_glyph' title='x_confs 95'>1</span><span class='ocr_glyph' title='x_confs 4'>I</span></span>
+</span>
+<span class='ocrx_word' title='bbox 50 2 70 18; x_wconf 80'>AB</span>
+</span></div>"""
+
+
+class BlobTesseract(TesseractOCR):
+    """Her siyah bloğu genişliğiyle adlandırılmış bir kelime olarak okuyan sahte motor"""
+    
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+    
+    def _image_to_data(self, image, config='--psm 6'):
+        self.calls += 1
+        gray = image if len(image.shape) == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        contours, _ = cv2.findContours(255 - gray, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        
+        data = {'text': [], 'conf': [], 'left': [], 'top': [], 'width': [], 'height': []}
+        for contour in sorted(contours, key=lambda c: cv2.boundingRect(c)[1]):
+            x, y, w, h = cv2.boundingRect(contour)
+            data['text'].append(f"W{w}")
+            data['conf'].append('90')
+            data['left'].append(x)
+            data['top'].append(y)
+            data['width'].append(w)
+            data['height'].append(h)
+        return data
+
+
+class TestTesseractConfig(unittest.TestCase):
+    """Tesseract ayar ayrıştırma test sınıfı"""
+    
+    def test_parse_config(self):
+        """psm, oem ve değişkenlerin ayrıştırılması"""
+        psm, oem, variables = parse_tesseract_config(
+            '--psm 7 --oem 1 -c tessedit_char_whitelist=ABC123 -c load_system_dawg=0'
+        )
+        self.assertEqual(psm, 7)
+        self.assertEqual(oem, 1)
+        self.assertEqual(variables, {'tessedit_char_whitelist': 'ABC123', 'load_system_dawg': '0'})
+    
+    def test_parse_empty(self):
+        """Boş ayar"""
+        self.assertEqual(parse_tesseract_config(''), (None, None, {}))
+
+
+class TestOCRManager(unittest.TestCase):
+    """OCRManager test sınıfı"""
+    
+    @unittest.skipIf(TESSEROCR_AVAILABLE, "tesserocr yüklü")
+    def test_tesseract_api_fallback(self):
+        """tesserocr yoksa pytesseract kullanılmalı"""
+        manager = OCRManager('tesseract_api')
+        self.assertIs(type(manager.ocr), TesseractOCR)
+    
+    def test_invalid_type(self):
+        """Desteklenmeyen OCR türü"""
+        with self.assertRaises(ValueError):
+            OCRManager('unknown')
+
+
+class FakeTessAPI:
+    """Açılan ve kapatılan motorları kaydeden sahte PyTessBaseAPI"""
+    
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.ended = False
+        self.images = []
+    
+    def SetImageBytes(self, data, width, height, bytes_per_pixel, bytes_per_line):
+        self.images.append((data, width, height, bytes_per_pixel, bytes_per_line))
+    
+    def End(self):
+        self.ended = True
+
+
+class TestTesseractAPI(unittest.TestCase):
+    """Kalıcı Tesseract motoru önbelleği test sınıfı (motor sahtedir)"""
+    
+    def setUp(self):
+        patches = [mock.patch.object(ocr, 'TESSEROCR_AVAILABLE', True),
+                   mock.patch.object(ocr, 'tesserocr', mock.Mock(PyTessBaseAPI=FakeTessAPI), create=True)]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.engine = TesseractAPIOCR(max_apis=2)
+    
+    def test_cache_bounded(self):
+        """İş parçacığı başına en fazla max_apis motor açık kalmalı"""
+        first = self.engine._get_api('--psm 6')
+        self.assertIs(self.engine._get_api('--psm 6'), first)
+        second = self.engine._get_api('--psm 7')
+        self.engine._get_api('--psm 6')
+        self.engine._get_api('--psm 3')
+        self.assertTrue(second.ended)
+        self.assertFalse(first.ended)
+        self.assertEqual(len(self.engine._open_apis), 2)
+    
+    def test_close_ends_all_threads(self):
+        """close tüm iş parçacıklarının motorlarını kapatmalı, sonra yenileri açılmalı"""
+        apis = [self.engine._get_api('--psm 6')]
+        thread = threading.Thread(target=lambda: apis.append(self.engine._get_api('--psm 6')))
+        thread.start()
+        thread.join()
+        self.assertIsNot(apis[0], apis[1])
+        
+        self.engine.close()
+        self.assertTrue(all(api.ended for api in apis))
+        self.assertEqual(self.engine._open_apis, {})
+        self.assertIsNot(self.engine._get_api('--psm 6'), apis[0])
+    
+    def test_set_image_without_copy(self):
+        """Görüntü baytlara kopyalanmadan arabellek olarak verilmeli"""
+        api = self.engine._get_api('--psm 6')
+        image = np.zeros((10, 20), np.uint8)
+        self.engine._set_image(api, image)
+        data, width, height, bytes_per_pixel, bytes_per_line = api.images[0]
+        self.assertIsInstance(data, memoryview)
+        self.assertEqual((width, height, bytes_per_pixel, bytes_per_line), (20, 10, 1, 20))
+
+
+class TestDataConversion(unittest.TestCase):
+    """Kelime verisinden sonuç oluşturma test sınıfı"""
+    
+    def setUp(self):
+        self.data = {
+            'text': ['VF1', '', 'RJA', 'CLIO'],
+            'conf': ['90', '-1', '80.5', '70'],
+            'left': [10, 0, 60, 10],
+            'top': [5, 0, 6, 40],
+            'width': [40, 0, 40, 50],
+            'height': [20, 0, 20, 20],
+        }
+    
+    def test_result_from_data(self):
+        """Tek sonuç birleştirme"""
+        result = _result_from_data(self.data)
+        self.assertEqual(result.text, 'VF1 RJA CLIO')
+        self.assertAlmostEqual(result.confidence, (0.9 + 0.805 + 0.7) / 3)
+        self.assertEqual(result.bbox, (10, 5, 90, 55))
+    
+    def test_regions_from_data(self):
+        """Satırlara gruplama"""
+        regions = _regions_from_data(self.data)
+        self.assertEqual([r.text for r in regions], ['VF1 RJA', 'CLIO'])
+
+
+class TestCharData(unittest.TestCase):
+    """Karakter düzeyinde OCR verisi test sınıfı"""
+    
+    def test_parse_hocr(self):
+        """hOCR karakter kutuları ve LSTM alternatifleri"""
+        words = parse_hocr_words(HOCR)
+        self.assertEqual([(text, conf) for text, conf, _, _ in words], [('VF1', 91.0), ('AB', 80.0)])
+        
+        symbols = words[0][3]
+        self.assertEqual([char for char, _, _, _ in symbols], ['V', 'F', '1'])
+        self.assertEqual(symbols[1][2], (20, 2, 10, 16))
+        self.assertEqual(symbols[1][3], [('F', 62.0), ('E', 30.0), ('P', 5.0)])
+        self.assertEqual(words[1][3], [])
+    
+    def test_chars_aligned_with_text(self):
+        """Karakter dizileri birleştirilmiş metinle hizalı olmalı"""
+        result = _result_from_words(parse_hocr_words(HOCR))
+        chars = result.chars
+        self.assertEqual(result.text, 'VF1 AB')
+        self.assertEqual(len(chars), len(result.text))
+        
+        np.testing.assert_allclose(chars.confidences, [0.991, 0.625, 0.95, 1.0, 0.8, 0.8], rtol=1e-6)
+        self.assertEqual([(c, round(p, 2)) for c, p in chars.alternatives_at(1)], [('E', 0.3), ('P', 0.05)])
+        self.assertEqual(chars.alternatives_at(0), [])
+        self.assertEqual(chars.uncertain_positions(0.9).tolist(), [1, 4, 5])
+        
+        # Karakter verisi olmayan kelime eşit parçalara bölünür
+        self.assertEqual(chars.boxes[4].tolist(), [50, 2, 10, 16])
+        self.assertEqual(chars.boxes[3].tolist(), [0, 0, 0, 0])
+
+
+class TestBatchOCR(unittest.TestCase):
+    """Toplu (mozaik) OCR test sınıfı"""
+    
+    def make_image(self, width, height, block):
+        image = np.full((height, width), 255, dtype=np.uint8)
+        x, y, w, h = block
+        image[y:y + h, x:x + w] = 0
+        return image
+    
+    def test_pack_mosaics(self):
+        """Mozaik yerleşimi ve bölme"""
+        images = [np.zeros((30, 50), np.uint8), np.zeros((40, 80, 3), np.uint8),
+                  np.zeros((20, 10), np.uint8)]
+        mosaics = pack_mosaics(images, padding=10)
+        self.assertEqual(len(mosaics), 1)
+        
+        mosaic, placements = mosaics[0]
+        self.assertEqual(mosaic.shape, (10 + 30 + 10 + 40 + 10 + 20 + 10, 100, 3))
+        self.assertEqual(placements, [(0, 10), (1, 50), (2, 100)])
+        
+        # Yükseklik sınırı aşıldığında yeni mozaik açılır
+        self.assertEqual(len(pack_mosaics(images, padding=10, max_height=70)), 3)
+    
+    def test_batch_maps_results_back(self):
+        """Toplu sonuçlar kaynak görüntülere ve koordinatlarına geri eşlenmeli"""
+        blocks = [(5, 4, 30, 10), (12, 8, 41, 20), (0, 0, 7, 5)]
+        images = [self.make_image(60, 30, blocks[0]), self.make_image(80, 40, blocks[1]),
+                  self.make_image(20, 12, blocks[2])]
+        
+        ocr = BlobTesseract()
+        results = ocr.extract_text_with_confidence_batch(images)
+        
+        self.assertEqual(ocr.calls, 1)
+        self.assertEqual([r.text for r in results], ['W30', 'W41', 'W7'])
+        self.assertEqual([r.bbox for r in results], blocks)
+        
+        # Tek tek çağrılarla aynı sonuç
+        single = [ocr.extract_text_with_confidence(image) for image in images]
+        self.assertEqual([(r.text, r.bbox) for r in single],
+                         [(r.text, r.bbox) for r in results])
+    
+    def test_batch_empty_image(self):
+        """Boş görüntü sonucu boş dönmeli"""
+        images = [self.make_image(20, 12, (2, 2, 5, 5)), np.zeros((0, 0), np.uint8)]
+        results = BlobTesseract().extract_text_with_confidence_batch(images)
+        self.assertEqual(results[0].text, 'W5')
+        self.assertEqual(results[1].text, '')
+
+
+if __name__ == '__main__':
+    unittest.main()
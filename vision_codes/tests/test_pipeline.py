@@ -0,0 +1,161 @@
+"""
+Pipeline modülü testleri
+"""
+import unittest
+
+import cv2
+import numpy as np
+
+from ..pipeline import VisionPipeline
+from ..detector import BoundingBox
+from ..ocr import CharData
+from . import helpers
+from .helpers import read_by_width
+
+
+# ROI genişliği -> OCR metni
+WIDTH_TO_TEXT = {
+    60: 'VF1',
+    70: 'RJA',
+    80: 'UU1',
+    90: 'RFK',
+    100: 'RHN',
+}
+
+
+def make_pipeline(**kwargs) -> VisionPipeline:
+    boxes = []
+    x = 0
+    for width in WIDTH_TO_TEXT:
+        boxes.append(BoundingBox(x, 10, width, 30))
+        x += width + 5
+    return helpers.make_pipeline(boxes, read_by_width(WIDTH_TO_TEXT), delay=0.01, **kwargs)
+
+
+def make_image() -> np.ndarray:
+    return np.full((60, 500, 3), 255, dtype=np.uint8)
+
+
+class TestParallelROI(unittest.TestCase):
+    """Paralel ROI işleme test sınıfı"""
+    
+    def test_parallel_matches_sequential(self):
+        """Paralel ve sıralı sonuçlar aynı olmalı"""
+        image = make_image()
+        sequential = make_pipeline(roi_workers=0).process_image(image)
+        
+        pipeline = make_pipeline(roi_workers=4)
+        try:
+            for _ in range(3):
+                self.assertEqual(pipeline.process_image(image), sequential)
+        finally:
+            pipeline.close()
+        
+        self.assertEqual(sorted(r.code for r in sequential), sorted(WIDTH_TO_TEXT.values()))
+    
+    def test_map_rois_keeps_order(self):
+        """ROI sonuçları giriş sırasıyla dönmeli"""
+        pipeline = make_pipeline(roi_workers=4)
+        crops = [(np.full((30, w, 3), 255, dtype=np.uint8), BoundingBox(0, 0, w, 30))
+                 for w in WIDTH_TO_TEXT]
+        try:
+            roi_results = pipeline._map_rois(crops)
+        finally:
+            pipeline.close()
+        
+        self.assertEqual([r[0].code for r in roi_results], list(WIDTH_TO_TEXT.values()))
+
+
+class TestBatchedOCR(unittest.TestCase):
+    """Toplu OCR modu test sınıfı"""
+    
+    def test_batched_matches_sequential(self):
+        """Toplu OCR tek çağrı yapmalı ve aynı sonuçları vermeli"""
+        image = make_image()
+        sequential = make_pipeline().process_image(image)
+        
+        for workers in (0, 4):
+            pipeline = make_pipeline(ocr_batch=True, roi_workers=workers)
+            try:
+                self.assertEqual(pipeline.process_image(image), sequential)
+            finally:
+                pipeline.close()
+            self.assertEqual(len(pipeline.ocr.batches), 1)
+
+
+class TestCharConfidence(unittest.TestCase):
+    """Karakter düzeyinde güvenle VIN düzeltme test sınıfı"""
+    
+    def test_correction_uses_char_data(self):
+        """OCR alternatifi yalnızca belirsiz konumda kullanılmalı"""
+        text = '1HGCM8264AA004R52'
+        confidences = np.full(17, 0.97, dtype=np.float32)
+        confidences[14] = 0.5
+        alternatives = np.full((17, 3), '', dtype='<U1')
+        alternatives[14, 0] = '5'
+        alternative_confidences = np.zeros((17, 3), dtype=np.float32)
+        alternative_confidences[14, 0] = 0.4
+        chars = CharData(np.zeros((17, 4), np.int32), confidences, alternatives, alternative_confidences)
+        
+        pipeline = VisionPipeline()
+        codes = [info.code for info in pipeline._analyze_text(text, chars)]
+        self.assertIn('1HGCM8264AA004552', codes)
+        self.assertNotIn('1HGCM8264AA004552', [info.code for info in pipeline._analyze_text(text)])
+
+
+class TestEarlyExit(unittest.TestCase):
+    """Erken çıkış test sınıfı"""
+    
+    def setUp(self):
+        # Boş ROI'ler alanca büyük, VIN yazılı ROI en küçük
+        self.boxes = [BoundingBox(0, 0, 300, 60), BoundingBox(0, 70, 280, 60), BoundingBox(0, 140, 260, 40)]
+        self.image = np.full((200, 320, 3), 255, dtype=np.uint8)
+        cv2.putText(self.image, 'VF1RJA00012345678', (5, 170), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 2)
+        self.texts = {300: 'RJA', 280: 'RFK', 260: 'VF1RJA00012345678'}
+    
+    def make_pipeline(self, **kwargs):
+        return helpers.make_pipeline(self.boxes, read_by_width(self.texts), delay=0.02, **kwargs)
+    
+    def test_text_likelihood(self):
+        """Yazılı ROI boş ROI'lerden yüksek skor almalı"""
+        detector = self.make_pipeline().detector
+        scores = [detector.text_likelihood(detector.crop_roi(self.image, box)) for box in self.boxes]
+        self.assertEqual(int(np.argmax(scores)), 2)
+        self.assertEqual(scores[0], 0.0)
+    
+    def test_stops_after_validated_vin(self):
+        """Doğrulanmış VIN bulununca kalan ROI'ler işlenmemeli"""
+        pipeline = self.make_pipeline()
+        full = pipeline.process_image(self.image)
+        self.assertEqual(len(pipeline.ocr.calls), 3)
+        
+        pipeline = self.make_pipeline()
+        pipeline.max_results = 1
+        results = pipeline.process_image(self.image)
+        self.assertEqual(len(pipeline.ocr.calls), 1)
+        self.assertEqual([r.code for r in results], ['VF1RJA00012345678'])
+        self.assertIn('VF1RJA00012345678', [r.code for r in full])
+    
+    def test_confidence_threshold(self):
+        """Eşiğin altındaki VIN erken çıkışı tetiklememeli"""
+        pipeline = self.make_pipeline()
+        pipeline.max_results = 1
+        pipeline.stop_on_confidence = 0.99
+        pipeline.process_image(self.image)
+        self.assertEqual(len(pipeline.ocr.calls), 3)
+    
+    def test_parallel_cancels_pending(self):
+        """Paralel modda bekleyen ROI'ler iptal edilmeli"""
+        self.boxes = self.boxes * 4
+        pipeline = self.make_pipeline(roi_workers=2)
+        pipeline.max_results = 1
+        try:
+            results = pipeline.process_image(self.image)
+        finally:
+            pipeline.close()
+        self.assertEqual(results[0].code, 'VF1RJA00012345678')
+        self.assertLess(len(pipeline.ocr.calls), len(self.boxes))
+
+
+if __name__ == '__main__':
+    unittest.main()
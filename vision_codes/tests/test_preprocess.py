@@ -0,0 +1,411 @@
+"""
+Ön işleme modülü testleri
+"""
+import threading
+import unittest
+
+import cv2
+import numpy as np
+
+from ..preprocess import ImagePreprocessor, ScratchBuffers, PREPROCESS_VARIANTS
+from ..pipeline import VisionPipeline
+from ..detector import BoundingBox
+from ..benchmarks import benchmark_adaptive, benchmark_deskew, benchmark_threshold, format_rows
+from .helpers import FakeOCR, make_pipeline, read_constant, read_scripted
+
+
+VIN = 'VF1RJA00012345678'
+
+
+def make_text_image(shape, angle: float = 0.0, seed: int = 0) -> np.ndarray:
+    """Gürültülü, isteğe bağlı döndürülmüş metin görüntüsü"""
+    height, width = shape[:2]
+    image = np.full((height, width), 190, dtype=np.uint8)
+    cv2.putText(image, 'VF1RJA00012345678', (5, height // 2 + 8), cv2.FONT_HERSHEY_SIMPLEX, 0.7, 30, 2)
+    if angle:
+        # Eğimin Hough ile bulunabilmesi için uzun yatay çizgiler
+        for y in (height // 5, height * 4 // 5):
+            cv2.line(image, (0, y), (width, y), 30, 2)
+    if angle:
+        matrix = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1.0)
+        image = cv2.warpAffine(image, matrix, (width, height), borderValue=190)
+    noise = np.random.default_rng(seed).integers(0, 12, image.shape, dtype=np.uint8)
+    image = cv2.add(image, noise)
+    if len(shape) == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        image[:, :, 0] = cv2.add(image[:, :, 0], 20)
+    return image
+
+
+class TestFastPreprocess(unittest.TestCase):
+    """Birleşik ön işleme test sınıfı"""
+    
+    def setUp(self):
+        self.preprocessor = ImagePreprocessor()
+    
+    def test_gray_identical(self):
+        """Gri girişte çıktı tam ön işlemeyle bit düzeyinde aynı olmalı"""
+        for shape, angle in [((60, 300), 0.0), ((200, 500), 10.0), ((37, 211), 0.0)]:
+            with self.subTest(shape=shape, angle=angle):
+                image = make_text_image(shape, angle)
+                np.testing.assert_array_equal(self.preprocessor.preprocess_for_ocr_fast(image),
+                                              self.preprocessor.preprocess_for_ocr(image))
+    
+    def test_skew_estimate(self):
+        """Eğim açısı Hough çizgilerinden bulunmalı"""
+        angle = self.preprocessor._estimate_skew_hough(make_text_image((200, 500), 10.0))
+        self.assertAlmostEqual(angle, -np.pi / 18, places=2)
+        self.assertEqual(self.preprocessor._estimate_skew_hough(np.full((50, 50), 255, np.uint8)), 0.0)
+    
+    def test_color_near_identical(self):
+        """Renkli girişte farklı piksel oranı çok küçük olmalı"""
+        image = make_text_image((120, 500, 3))
+        full = self.preprocessor.preprocess_for_ocr(image)
+        fast = self.preprocessor.preprocess_for_ocr_fast(image)
+        self.assertEqual(fast.shape, full.shape)
+        self.assertLess(np.mean(fast != full), 0.03)
+    
+    def test_sauvola_into(self):
+        """Tampon bellekli Sauvola aynı sonucu vermeli"""
+        image = make_text_image((80, 320))
+        out = np.empty(image.shape, dtype=np.uint8)
+        result = self.preprocessor._sauvola_threshold_into(image, out)
+        self.assertTrue(np.shares_memory(result, out))
+        np.testing.assert_array_equal(out, self.preprocessor._sauvola_threshold(image))
+    
+    def test_buffers_reused(self):
+        """Aynı ya da küçük şekillerde tampon yeniden ayrılmamalı"""
+        self.preprocessor.preprocess_for_ocr_fast(make_text_image((120, 500, 3)))
+        allocations = self.preprocessor._scratch.allocations
+        
+        first = self.preprocessor.preprocess_for_ocr_fast(make_text_image((120, 500, 3), seed=1))
+        expected = first.copy()
+        self.preprocessor.preprocess_for_ocr_fast(make_text_image((60, 300, 3), seed=2))
+        self.assertEqual(self.preprocessor._scratch.allocations, allocations)
+        
+        # Çıktı tampon bellekle paylaşılmaz
+        np.testing.assert_array_equal(first, expected)
+    
+    def test_scratch_buffers(self):
+        """Tampon görünümleri istenen şekil ve türde olmalı"""
+        scratch = ScratchBuffers()
+        a = scratch.get('a', (10, 20), np.float32)
+        b = scratch.get('a', (5, 7), np.float32)
+        self.assertEqual((a.shape, a.dtype), ((10, 20), np.float32))
+        self.assertTrue(b.flags['C_CONTIGUOUS'])
+        self.assertTrue(np.shares_memory(a, b))
+        self.assertEqual(scratch.allocations, 1)
+        
+        scratch.get('a', (5, 7), np.uint8)
+        self.assertEqual(scratch.allocations, 2)
+    
+    def test_pipeline_mode(self):
+        """Pipeline ön işleme modunu seçebilmeli"""
+        image = make_text_image((60, 300, 3))
+        pipeline = VisionPipeline(preprocess_mode='fast')
+        np.testing.assert_array_equal(pipeline._preprocess_roi(image),
+                                      ImagePreprocessor().preprocess_for_ocr_fast(image))
+        with self.assertRaises(ValueError):
+            VisionPipeline(preprocess_mode='unknown')
+
+
+class TestDeskew(unittest.TestCase):
+    """Eğim tahmini ve düzeltme test sınıfı"""
+    
+    def setUp(self):
+        self.preprocessor = ImagePreprocessor()
+    
+    def test_projection_estimate(self):
+        """İzdüşüm profili Hough ile aynı açıyı bulmalı"""
+        for angle in (-12.0, -7.0, 10.0):
+            with self.subTest(angle=angle):
+                image = make_text_image((200, 500), angle)
+                estimate = self.preprocessor.estimate_skew(image, 'projection')
+                self.assertAlmostEqual(np.rad2deg(estimate), -angle, delta=0.5)
+                self.assertAlmostEqual(estimate, self.preprocessor.estimate_skew(image, 'hough'), delta=0.01)
+    
+    def test_flat_image(self):
+        """Metin yoksa eğim sıfır olmalı"""
+        self.assertEqual(self.preprocessor.estimate_skew(np.full((50, 50), 200, np.uint8)), 0.0)
+        with self.assertRaises(ValueError):
+            self.preprocessor.estimate_skew(np.zeros((50, 50), np.uint8), 'unknown')
+    
+    def test_deskew_removes_skew(self):
+        """Düzeltilen görüntüde eğim kalmamalı (dönüş yönü doğru olmalı)"""
+        for method in ('hough', 'projection'):
+            with self.subTest(method=method):
+                deskewed = self.preprocessor.deskew_image(make_text_image((200, 500), 10.0), method)
+                residual = self.preprocessor.estimate_skew(deskewed, 'projection')
+                self.assertLess(abs(np.rad2deg(residual)), 1.0)
+    
+    def test_given_angle(self):
+        """Verilen açı yeniden hesaplanmadan kullanılmalı"""
+        image = make_text_image((200, 500), 10.0)
+        angle = self.preprocessor.estimate_skew(image, 'hough')
+        np.testing.assert_array_equal(self.preprocessor.preprocess_for_ocr(image, skew_angle=angle),
+                                      self.preprocessor.preprocess_for_ocr(image))
+        np.testing.assert_array_equal(self.preprocessor.preprocess_for_ocr_fast(image, skew_angle=0.0),
+                                      self.preprocessor.preprocess_for_ocr(image, skew_angle=0.0))
+    
+    def test_frame_mode(self):
+        """'frame' modunda eğim karede bir kez hesaplanıp ROI'lere aktarılmalı"""
+        pipeline = VisionPipeline(deskew_mode='frame')
+        boxes = [BoundingBox(0, 0, 300, 60), BoundingBox(0, 100, 300, 60)]
+        pipeline.detector.detect_by_contours = lambda image: list(boxes)
+        
+        calls = []
+        estimate_skew = pipeline.preprocessor.estimate_skew
+        pipeline.preprocessor.estimate_skew = lambda image, *args, **kwargs: (
+            calls.append(image.shape), estimate_skew(image, *args, **kwargs))[1]
+        
+        image = make_text_image((400, 640, 3), 8.0)
+        crops = pipeline._crop_rois(image)
+        self.assertEqual(calls, [image.shape])
+        self.assertEqual({roi.skew for _, roi in crops}, {estimate_skew(image, 'projection', max_size=512)})
+        self.assertIsNone(boxes[0].skew)
+        
+        pipeline._preprocess_roi(crops[0][0], crops[0][1].skew)
+        self.assertEqual(len(calls), 1)
+    
+    def test_invalid_mode(self):
+        """Bilinmeyen eğim düzeltme modu reddedilmeli"""
+        with self.assertRaises(ValueError):
+            VisionPipeline(deskew_mode='unknown')
+    
+    def test_benchmark(self):
+        """Ölçüm satırları üretilmeli"""
+        rows = benchmark_deskew(sizes={'tiny': (120, 160)}, repeat=1)
+        self.assertEqual([row['variant'] for row in rows], ['max_size=256', 'max_size=512'])
+
+
+class TestBoxThreshold(unittest.TestCase):
+    """Kutu pencereli Sauvola/Niblack test sınıfı"""
+    
+    def reference(self, image, window_size, k, method):
+        """Kayan pencereyle doğrudan hesaplanan eşik"""
+        pad = window_size // 2
+        padded = np.pad(image.astype(np.float64), pad, mode='reflect')
+        windows = np.lib.stride_tricks.sliding_window_view(padded, (window_size, window_size))
+        mean = windows.mean(axis=(-1, -2))
+        std_dev = windows.std(axis=(-1, -2))
+        if method == 'sauvola':
+            threshold = mean * (1 + k * (std_dev / 128 - 1))
+        else:
+            threshold = mean + k * std_dev
+        return np.where(image > threshold, 255, 0).astype(np.uint8)
+    
+    def test_matches_reference(self):
+        """Kutu filtreli sonuç kayan pencere hesabıyla aynı olmalı"""
+        image = np.random.default_rng(1).integers(0, 256, (50, 70), dtype=np.uint8)
+        preprocessor = ImagePreprocessor()
+        for method, k in [('sauvola', 0.2), ('niblack', -0.2)]:
+            for window_size in (7, 15):
+                with self.subTest(method=method, window_size=window_size):
+                    out = np.empty(image.shape, dtype=np.uint8)
+                    result = preprocessor._sauvola_threshold_box(image, out, window_size, k, method)
+                    self.assertTrue(np.shares_memory(result, out))
+                    expected = self.reference(image, window_size, k, method)
+                    self.assertLessEqual(np.count_nonzero(out != expected), 1)
+    
+    def test_close_to_gaussian(self):
+        """Metin görüntüsünde Gauss pencereli Sauvola'ya yakın olmalı"""
+        image = make_text_image((120, 500))
+        preprocessor = ImagePreprocessor()
+        self.assertLess(np.mean(preprocessor.adaptive_threshold(image, 'sauvola_box')
+                                != preprocessor.adaptive_threshold(image, 'sauvola')), 0.02)
+    
+    def test_benchmark(self):
+        """Ölçüm satırları üretilmeli"""
+        rows = benchmark_threshold(sizes={'tiny': (60, 80)}, window_sizes=(15,), repeat=1)
+        self.assertEqual([(row['size'], row['variant']) for row in rows], [('tiny', 'window=15')])
+        self.assertIn('threshold', format_rows(rows))
+
+
+class TestAdaptivePreprocess(unittest.TestCase):
+    """Uyarlanır ön işleme test sınıfı"""
+    
+    def setUp(self):
+        self.preprocessor = ImagePreprocessor()
+        self.clean = np.full((60, 300), 190, dtype=np.uint8)
+        cv2.putText(self.clean, 'VF1RJA00012345678', (5, 38), cv2.FONT_HERSHEY_SIMPLEX, 0.7, 30, 2)
+    
+    def test_stages(self):
+        """İstatistikler yalnızca gereken aşamaları seçmeli"""
+        noise = np.random.default_rng(0).normal(0, 10, self.clean.shape)
+        cases = {
+            'clean': (self.clean, []),
+            'noisy': (np.clip(self.clean + noise, 0, 255).astype(np.uint8), ['denoise']),
+            'dim': ((self.clean * 0.2 + 120).astype(np.uint8), ['contrast']),
+            'blurred': (cv2.GaussianBlur(self.clean, (0, 0), 2.0), ['sharpen']),
+            'skewed': (make_text_image((200, 500), 10.0), ['deskew']),
+        }
+        for name, (image, stages) in cases.items():
+            with self.subTest(name=name):
+                self.assertEqual(self.preprocessor.image_stats(image).stages(), stages)
+    
+    def test_noise_estimate(self):
+        """Gürültü tahmini metin kenarlarından etkilenmemeli"""
+        self.assertLess(self.preprocessor.image_stats(self.clean).noise, 1.0)
+        noise = np.random.default_rng(0).normal(0, 10, self.clean.shape)
+        noisy = np.clip(self.clean + noise, 0, 255).astype(np.uint8)
+        self.assertAlmostEqual(self.preprocessor.image_stats(noisy).noise, 10.0, delta=1.5)
+    
+    def test_clean_close_to_full(self):
+        """Temiz görüntüde atlanan aşamalar sonucu belirgin değiştirmemeli"""
+        for image in (self.clean, make_text_image((120, 500, 3))):
+            adaptive = self.preprocessor.preprocess_for_ocr_adaptive(image)
+            self.assertEqual(adaptive.shape, image.shape[:2])
+            self.assertLess(np.mean(adaptive != self.preprocessor.preprocess_for_ocr(image)), 0.02)
+    
+    def test_all_stages(self):
+        """Tüm aşamalar seçildiğinde tampon bellekler karışmamalı"""
+        image = cv2.GaussianBlur(make_text_image((200, 500), 10.0), (0, 0), 2.0)
+        stats = self.preprocessor.image_stats(image)
+        stats.contrast, stats.noise = 0.0, 100.0
+        self.assertEqual(stats.stages(), ['deskew', 'contrast', 'denoise', 'sharpen'])
+        out = np.empty(image.shape, dtype=np.uint8)
+        result = self.preprocessor.preprocess_for_ocr_adaptive(image, out, stats=stats)
+        self.assertIs(result, out)
+        self.assertTrue(set(np.unique(out)) <= {0, 255})
+    
+    def test_retry_on_low_confidence(self):
+        """Güven düşükse ROI tam zincirle yeniden okunmalı ve iyi sonuç tutulmalı"""
+        image = cv2.cvtColor(self.clean, cv2.COLOR_GRAY2BGR)
+        for ocr_batch in (False, True):
+            with self.subTest(ocr_batch=ocr_batch):
+                pipeline = make_pipeline(read=read_scripted([(VIN, 0.3), (VIN, 0.9)]),
+                                         preprocess_mode='adaptive', ocr_batch=ocr_batch)
+                pipeline.min_confidence = 0.0
+                results = pipeline.process_image(image)
+                self.assertEqual(len(pipeline.ocr.images), 2)
+                np.testing.assert_array_equal(pipeline.ocr.images[1], ImagePreprocessor().preprocess_for_ocr(image))
+                self.assertGreater(max(r.confidence for r in results), 0.3)
+                
+                pipeline.ocr = FakeOCR(read_constant(VIN, 0.8))
+                pipeline.process_image(image)
+                self.assertEqual(len(pipeline.ocr.images), 1)
+    
+    def test_blank_not_retried(self):
+        """Metin okunmayan ROI yeniden okunmamalı"""
+        image = cv2.cvtColor(self.clean, cv2.COLOR_GRAY2BGR)
+        for ocr_batch in (False, True):
+            with self.subTest(ocr_batch=ocr_batch):
+                pipeline = make_pipeline(read=read_constant('', 0.0), preprocess_mode='adaptive',
+                                         ocr_batch=ocr_batch)
+                self.assertEqual(pipeline.process_image(image), [])
+                self.assertEqual(len(pipeline.ocr.images), 1)
+    
+    def test_benchmark(self):
+        """Ölçüm satırları üretilmeli"""
+        rows = benchmark_adaptive(sizes={'tiny': (120, 160)}, repeat=1)
+        self.assertEqual([row['variant'] for row in rows], ['clean', 'noisy'])
+
+
+def variant_of(image) -> str:
+    """Varyant işareti (görüntünün ilk pikseli)"""
+    return PREPROCESS_VARIANTS[int(image[0, 0])]
+
+
+def read_variant(readings, wait=None):
+    """Varyanta göre okuyan okuyucu; wait'teki varyantlar olayı bekler"""
+    wait = wait or {}
+    
+    def read(image, config):
+        name = variant_of(image)
+        if name in wait:
+            wait[name].wait(5)
+        return readings[name]
+    return read
+
+
+class TestVariants(unittest.TestCase):
+    """Çoklu ön işleme varyantı test sınıfı"""
+    
+    def test_variants(self):
+        """Varyantlar üretilmeli, 'sauvola' tam ön işlemeyle aynı olmalı"""
+        preprocessor = ImagePreprocessor()
+        image = make_text_image((60, 300))
+        variants = preprocessor.preprocess_variants(image)
+        self.assertEqual(list(variants), list(PREPROCESS_VARIANTS))
+        np.testing.assert_array_equal(variants['sauvola'], preprocessor.preprocess_for_ocr(image))
+        for binary in variants.values():
+            self.assertEqual(binary.shape, image.shape)
+            self.assertTrue(set(np.unique(binary)) <= {0, 255})
+        with self.assertRaises(ValueError):
+            preprocessor.preprocess_variants(image, ('unknown',))
+    
+    def test_shared_base(self):
+        """CLAHE tüm varyantlar için bir kez çalışmalı"""
+        preprocessor = ImagePreprocessor()
+        clahe = preprocessor.clahe
+        calls = []
+        preprocessor.clahe = type('CountingCLAHE', (), {
+            'apply': lambda self, image, *args, **kwargs: (calls.append(1), clahe.apply(image))[1]
+        })()
+        preprocessor.preprocess_variants(make_text_image((60, 300, 3)))
+        self.assertEqual(len(calls), 1)
+    
+    def make_pipeline(self, read):
+        pipeline = make_pipeline(read=read, preprocess_mode='variants')
+        pipeline.preprocessor.apply_variant = lambda name, enhanced: np.full(
+            (4, 4), PREPROCESS_VARIANTS.index(name), dtype=np.uint8)
+        pipeline.min_confidence = 0.0
+        self.addCleanup(pipeline.close)
+        return pipeline
+    
+    def test_best_validated_reading(self):
+        """Doğrulanmış okumalardan en yüksek güvenli olan tutulmalı"""
+        pipeline = self.make_pipeline(read_variant({
+            'sauvola': (VIN, 0.6),
+            'gaussian': (VIN, 0.9),
+            'denoised': ('HELLO', 0.99),
+        }))
+        results = pipeline.process_image(make_text_image((60, 300, 3)))
+        self.assertEqual(sorted(map(variant_of, pipeline.ocr.images)), sorted(PREPROCESS_VARIANTS))
+        self.assertEqual([r.code for r in results], ['VF1RJA00012345678'])
+        self.assertAlmostEqual(results[0].confidence, 0.9 * 0.9)
+    
+    def test_stop_on_check_digit(self):
+        """Kontrol hanesi doğru VIN okununca diğer varyantlar beklenmemeli"""
+        release = threading.Event()
+        pipeline = self.make_pipeline(read_variant({
+            'sauvola': ('VF1RJA00X12345678', 0.8),
+            'gaussian': (VIN, 0.95),
+            'denoised': (VIN, 0.95),
+        }, wait={'gaussian': release, 'denoised': release}))
+        self.addCleanup(release.set)  # havuz kapatılmadan önce
+        results = pipeline.process_image(make_text_image((60, 300, 3)))
+        self.assertFalse(release.is_set())
+        self.assertEqual([r.code for r in results], ['VF1RJA00X12345678'])
+    
+    def test_parallel_rois_real_variants(self):
+        """Gerçek varyantlar paralel ROI'lerle sıralı çalışmayla aynı sonucu vermeli"""
+        texts = {300: 'RJA', 280: 'RFK', 260: 'UU1', 240: 'RHN'}
+        boxes = [BoundingBox(0, 40 * i, width, 36) for i, width in enumerate(texts)]
+        image = make_text_image((170, 320, 3))
+        
+        def read(image, config):
+            # Güven varyanta göre değişir, en iyi varyant seçimi sonucu etkiler
+            return texts.get(image.shape[1], ''), 0.75 + 0.2 * float(np.mean(image == 0))
+        
+        sequential = make_pipeline(boxes, read, preprocess_mode='variants')
+        self.addCleanup(sequential.close)
+        expected = sequential.process_image(image)
+        self.assertEqual(sorted(r.code for r in expected), sorted(texts.values()))
+        
+        pipeline = make_pipeline(boxes, read, delay=0.01, preprocess_mode='variants', roi_workers=4)
+        self.addCleanup(pipeline.close)
+        for _ in range(3):
+            self.assertEqual(pipeline.process_image(image), expected)
+        self.assertEqual(len(pipeline.ocr.calls), 3 * len(boxes) * len(PREPROCESS_VARIANTS))
+        self.assertEqual(pipeline._get_variant_executor()._max_workers, 4 * len(PREPROCESS_VARIANTS))
+    
+    def test_batch_uses_first_variant(self):
+        """Toplu OCR modunda ilk varyant kullanılmalı"""
+        image = make_text_image((60, 300))
+        np.testing.assert_array_equal(VisionPipeline(preprocess_mode='variants')._preprocess_roi(image),
+                                      ImagePreprocessor().preprocess_for_ocr(image))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+OCR profili testleri
+"""
+import os
+import unittest
+
+import numpy as np
+
+from ..profiles import PROFILES, LINE_WHITELIST, select_profile
+from ..ocr import is_single_line_config, parse_tesseract_config
+from ..pipeline import VisionPipeline, DEFAULT_OCR_CONFIG
+from ..detector import BoundingBox
+from . import helpers
+
+
+class TestProfiles(unittest.TestCase):
+    """OCR profili test sınıfı"""
+    
+    def test_select_profile(self):
+        """Geometriye göre profil seçimi"""
+        self.assertEqual(select_profile(400, 40).name, 'vin_line')
+        self.assertEqual(select_profile(200, 80).name, 'code_block')
+        self.assertEqual(select_profile(600, 400, image_size=(640, 480)).name, 'full_page')
+        self.assertEqual(select_profile(200, 80, image_size=(640, 480)).name, 'code_block')
+    
+    def test_config(self):
+        """Profil ayarları Tesseract ayarı olarak ayrıştırılabilmeli"""
+        psm, _, variables = parse_tesseract_config(PROFILES['vin_line'].config())
+        self.assertEqual(psm, 7)
+        self.assertEqual(variables['tessedit_char_whitelist'], LINE_WHITELIST)
+        self.assertEqual(variables['load_system_dawg'], '0')
+        # Satırdaki JLO, FLO gibi kodlar okunabilmeli
+        self.assertTrue(set('JLOFQI') <= set(LINE_WHITELIST))
+        
+        with open(variables['user_patterns_file'], encoding='utf-8') as f:
+            self.assertEqual(f.read().split(), ['\\n' * 17])
+        
+        psm, _, variables = parse_tesseract_config(PROFILES['full_page'].config())
+        self.assertEqual(psm, 3)
+        self.assertEqual(variables, {})
+        
+        self.assertTrue(is_single_line_config(PROFILES['vin_line'].config()))
+        self.assertFalse(is_single_line_config(PROFILES['code_block'].config()))
+    
+    def test_patterns_file_cached(self):
+        """Desen dosyası bir kez yazılmalı"""
+        config = PROFILES['vin_line'].config()
+        self.assertEqual(PROFILES['vin_line'].config(), config)
+        path = parse_tesseract_config(config)[2]['user_patterns_file']
+        self.assertTrue(os.path.exists(path))
+
+
+class TestPipelineProfiles(unittest.TestCase):
+    """Pipeline profil seçimi test sınıfı"""
+    
+    def make_pipeline(self, **kwargs):
+        boxes = [BoundingBox(0, 0, 300, 30), BoundingBox(0, 40, 100, 60), BoundingBox(0, 110, 320, 30)]
+        return helpers.make_pipeline(boxes, **{'ocr_profiles': True, **kwargs})
+    
+    def test_roi_profiles(self):
+        """Her ROI geometrisine uygun profille okunmalı"""
+        pipeline = self.make_pipeline()
+        pipeline.process_image(np.full((400, 640, 3), 255, dtype=np.uint8))
+        
+        configs = pipeline.ocr.configs
+        self.assertEqual(configs[0], PROFILES['vin_line'].config())
+        self.assertEqual(configs[1], PROFILES['code_block'].config())
+        self.assertEqual(configs[2], configs[0])
+    
+    def test_batches_grouped_by_profile(self):
+        """Toplu modda her profil ayrı okunmalı, tek satırlık psm'ler mozaiğe konmamalı"""
+        image = np.full((400, 640, 3), 255, dtype=np.uint8)
+        for process in ('process_image', 'process_images'):
+            with self.subTest(process=process):
+                pipeline = self.make_pipeline(ocr_batch=True)
+                getattr(pipeline, process)(image if process == 'process_image' else [image])
+                self.assertEqual(pipeline.ocr.batches, [(PROFILES['code_block'].config(), 1)])
+                self.assertEqual(sorted(pipeline.ocr.configs), sorted(
+                    [PROFILES['vin_line'].config()] * 2 + [PROFILES['code_block'].config()]))
+                for config, count in pipeline.ocr.batches:
+                    self.assertFalse(count > 1 and is_single_line_config(config))
+    
+    def test_profiles_disabled(self):
+        """Profiller varsayılan olarak kapalı olmalı, her ROI varsayılan ayarla okunmalı"""
+        self.assertFalse(VisionPipeline().ocr_profiles)
+        pipeline = self.make_pipeline(ocr_profiles=False)
+        pipeline.process_image(np.full((400, 640, 3), 255, dtype=np.uint8))
+        self.assertEqual(set(pipeline.ocr.configs), {DEFAULT_OCR_CONFIG})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+OCR HTTP servisi testleri
+"""
+import os
+import unittest
+from unittest import mock
+
+import cv2
+import numpy as np
+
+from ..cache import ResultCache
+from ..detector import BoundingBox
+from ..ocr import OCRResult
+from ..pipeline import VisionPipeline
+
+try:
+    from ..server import OCRService, ServiceConfig, create_app
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+class FakeOCR:
+    """Sabit metin döndüren sahte OCR"""
+    
+    def __init__(self, text):
+        self.text = text
+        self.calls = 0
+    
+    def extract_text_with_confidence(self, image, config='--psm 6'):
+        self.calls += 1
+        return OCRResult(self.text, 0.95, (0, 0, image.shape[1], image.shape[0]))
+    
+    def extract_text_with_confidence_batch(self, images, config='--psm 6'):
+        self.calls += 1
+        return [OCRResult(self.text, 0.95, (0, 0, image.shape[1], image.shape[0]))
+                for image in images]
+    
+    def close(self):
+        pass
+
+
+def make_service(text, config=None):
+    pipeline = VisionPipeline()
+    pipeline.ocr = FakeOCR(text)
+    pipeline.detector.detect_by_contours = lambda image: [BoundingBox(0, 0, 100, 40)]
+    return OCRService(config or ServiceConfig(), pipeline=pipeline, cache=ResultCache(max_entries=8))
+
+
+def png_bytes():
+    return cv2.imencode('.png', np.full((40, 100, 3), 255, np.uint8))[1].tobytes()
+
+
+@unittest.skipUnless(FLASK_AVAILABLE, "flask yüklü değil")
+class TestOCRServer(unittest.TestCase):
+    """Flask uygulaması test sınıfı"""
+    
+    def test_vin_endpoint(self):
+        """/ocr/vin VIN listesini döndürmeli, tekrar istek önbellekten gelmeli"""
+        service = make_service('VF1RJA00012345678')
+        client = create_app(service=service).test_client()
+        
+        response = client.post('/ocr/vin', data=png_bytes(), content_type='image/png')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['vins'], ['VF1RJA00012345678'])
+        self.assertEqual(response.json['count'], 1)
+        self.assertFalse(response.json['cached'])
+        
+        response = client.post('/ocr/vin', data=png_bytes(), content_type='image/png')
+        self.assertTrue(response.json['cached'])
+        self.assertEqual(service.pipeline.ocr.calls, 1)
+    
+    def test_ocr_endpoint(self):
+        """/ocr üretici ve model bilgisini döndürmeli"""
+        client = create_app(service=make_service('VF1RJA00012345678')).test_client()
+        
+        response = client.post('/ocr', data=png_bytes(), content_type='image/png')
+        self.assertTrue(response.json['success'])
+        self.assertEqual(response.json['best_vin'], 'VF1RJA00012345678')
+        self.assertEqual(response.json['manufacturer'], 'Renault (Fransa)')
+        self.assertEqual(response.json['models'], ['Clio'])
+    
+    def test_no_vin(self):
+        """VIN yoksa success=False"""
+        client = create_app(service=make_service('HELLO')).test_client()
+        response = client.post('/ocr', data=png_bytes(), content_type='image/png')
+        self.assertFalse(response.json['success'])
+        self.assertEqual(response.json['vins'], [])
+    
+    def test_bad_requests(self):
+        """Eksik veya bozuk görüntü 400 dönmeli"""
+        client = create_app(service=make_service('VF1')).test_client()
+        self.assertEqual(client.post('/ocr/vin', json={}).status_code, 400)
+        self.assertEqual(client.post('/ocr/vin', data=b'xx', content_type='image/png').status_code, 400)
+    
+    def test_invalid_base64(self):
+        """Bozuk base64 500 değil 400 dönmeli"""
+        client = create_app(service=make_service('VF1')).test_client()
+        for image in ('not base64!', 'data:image/png;base64,@@@', 12):
+            with self.subTest(image=image):
+                response = client.post('/ocr/vin', json={'image': image})
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json, {'error': 'Invalid base64 image'})
+    
+    def test_fuzzy_index_config(self):
+        """OCR_FUZZY_INDEX servis pipeline'ının sözlüğüne geçmeli"""
+        with mock.patch.dict(os.environ, {'OCR_FUZZY_INDEX': 'bktree'}):
+            config = ServiceConfig.from_env()
+        self.assertEqual(config.fuzzy_index, 'bktree')
+        self.assertEqual(OCRService(config, cache=ResultCache(max_entries=8)).lexicon.fuzzy_index, 'bktree')
+    
+    def test_health_after_warm_up(self):
+        """Isındırma öncesi 503, sonrası 200"""
+        service = make_service('VF1')
+        client = create_app(service=service).test_client()
+        self.assertEqual(client.get('/health').status_code, 503)
+        service.warm_up()
+        self.assertEqual(client.get('/health').status_code, 200)
+    
+    def test_micro_batch(self):
+        """Mikro-toplu modda istekler kuyruk üzerinden işlenmeli ve metrikler görünmeli"""
+        service = make_service('VF1RJA00012345678', ServiceConfig(micro_batch=True, batch_wait_ms=1))
+        client = create_app(service=service).test_client()
+        try:
+            response = client.post('/ocr/vin', data=png_bytes(), content_type='image/png')
+            self.assertEqual(response.json['vins'], ['VF1RJA00012345678'])
+            
+            metrics = client.get('/metrics').json
+            self.assertEqual(metrics['batcher']['items'], 1)
+            self.assertEqual(metrics['batcher']['queue_depth'], 0)
+            self.assertIn('cache', metrics)
+        finally:
+            service.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
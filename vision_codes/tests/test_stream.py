@@ -0,0 +1,127 @@
+"""
+Video/akış modülü testleri
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import cv2
+import numpy as np
+
+from ..detector import BoundingBox
+from ..pipeline import DetectionResult
+from ..stream import FrameReader, TemporalVoter, process_stream
+from .helpers import make_pipeline, read_constant
+
+
+def make_result(code, confidence=0.9):
+    return DetectionResult(code, 'Renault (Fransa)', '', 'VIN', confidence, (0, 0, 10, 10), 'ocr')
+
+
+class FakePipeline:
+    """Kare parlaklığına göre kod döndüren sahte pipeline"""
+    
+    def __init__(self):
+        self.calls = 0
+        self.last_reused = False
+    
+    def process_image(self, frame):
+        self.calls += 1
+        level = frame.mean()
+        if level > 200:
+            return [make_result('VF1RJA00012345678')]
+        if level > 80:
+            return [make_result('UU1RFK00012345678')]
+        return []
+
+
+def write_video(path, levels):
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 10, (64, 48))
+    for level in levels:
+        writer.write(np.full((48, 64, 3), level, np.uint8))
+    writer.release()
+
+
+class TestTemporalVoter(unittest.TestCase):
+    """TemporalVoter test sınıfı"""
+    
+    def test_emits_once_per_vehicle(self):
+        """Kod min_votes oya ulaşınca bir kez yayınlanmalı"""
+        voter = TemporalVoter(min_votes=2, max_gap=3)
+        self.assertIsNone(voter.update(0, [make_result('VF1RJA00012345678')]))
+        self.assertIsNone(voter.update(1, [make_result('VF1RJA0001234567B', 0.5)]))
+        detection = voter.update(2, [make_result('VF1RJA00012345678')])
+        self.assertEqual(detection.code, 'VF1RJA00012345678')
+        self.assertEqual(detection.votes, 2)
+        self.assertEqual(detection.frames, 3)
+        self.assertIsNone(voter.update(3, [make_result('VF1RJA00012345678')]))
+        
+        # Uzun boşluktan sonra yeni araç
+        voter.update(10, [make_result('UU1RFK00012345678')])
+        detection = voter.update(11, [make_result('UU1RFK00012345678')])
+        self.assertEqual(detection.code, 'UU1RFK00012345678')
+        self.assertEqual(detection.first_frame, 10)
+    
+    def test_back_to_back_vehicles(self):
+        """Boşluksuz gelen ikinci araç da yayınlanmalı, tek seferlik hatalı okuma yayınlanmamalı"""
+        voter = TemporalVoter(min_votes=2, max_gap=3)
+        voter.update(0, [make_result('VF1RJA00012345678')])
+        self.assertEqual(voter.update(1, [make_result('VF1RJA00012345678')]).code, 'VF1RJA00012345678')
+        
+        self.assertIsNone(voter.update(2, [make_result('VF1RJA0001234567B', 0.5)]))
+        self.assertIsNone(voter.update(3, [make_result('VF1RJA00012345678')]))
+        self.assertIsNone(voter.update(4, [make_result('VF1RJA00012345678')]))
+        
+        self.assertIsNone(voter.update(5, [make_result('UU1RFK00012345678')]))
+        detection = voter.update(6, [make_result('UU1RFK00012345678')])
+        self.assertEqual(detection.code, 'UU1RFK00012345678')
+        self.assertEqual(detection.votes, 2)
+        self.assertEqual(detection.first_frame, 5)
+        self.assertTrue(voter.locked)
+        self.assertIsNone(voter.update(7, [make_result('UU1RFK00012345678')]))
+        self.assertIsNone(voter.update(8, [make_result('VF1RJA00012345678')]))
+
+
+class TestStream(unittest.TestCase):
+    """Video dosyası üzerinden akış testi"""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.video = os.path.join(self.tmpdir, 'gate.avi')
+        # İki araç, aralarında boş kareler
+        write_video(self.video, [255] * 10 + [0] * 6 + [128] * 10)
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+    
+    def test_frame_skip(self):
+        """frame_skip kareleri atlamalı"""
+        with FrameReader(self.video, frame_skip=2) as reader:
+            indices = [index for index, _ in reader]
+        self.assertEqual(indices, list(range(0, 26, 3)))
+        self.assertEqual(reader.frames_read, 26)
+    
+    def test_one_detection_per_vehicle(self):
+        """Her araç için tek kararlı tespit üretilmeli, kilitliyken OCR seyrekleşmeli"""
+        pipeline = FakePipeline()
+        detections = list(process_stream(pipeline, self.video, min_votes=3, max_gap=4, locked_skip=3))
+        
+        self.assertEqual([d.code for d in detections], ['VF1RJA00012345678', 'UU1RFK00012345678'])
+        self.assertEqual(detections[0].first_frame, 0)
+        self.assertEqual(detections[1].first_frame, 16)
+        self.assertLess(pipeline.calls, 26)
+    
+    def test_reused_results_not_voted(self):
+        """Kare değişim kontrolünün yeniden kullandığı tek okuma oy sayılmamalı"""
+        pipeline = make_pipeline([BoundingBox(0, 0, 64, 48)], read_constant('VF1RJA0001234567B'),
+                                 change_threshold=0.02)
+        pipeline.min_confidence = 0.0
+        detections = list(process_stream(pipeline, self.video, min_votes=3, max_gap=4, max_frames=10))
+        
+        self.assertEqual(len(pipeline.ocr.calls), 1)
+        self.assertEqual(detections, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
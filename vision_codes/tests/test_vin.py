@@ -0,0 +1,57 @@
+"""
+VIN yardımcıları testleri
+"""
+import unittest
+
+from ..vin import (clean_vin, is_valid_vin_format, compute_check_digit, validate_vin_check_digit,
+                   iter_vin_candidates, extract_vin_candidates)
+
+
+class TestVinHelpers(unittest.TestCase):
+    """VIN yardımcıları test sınıfı"""
+    
+    def test_clean_vin(self):
+        """I, O, Q ve boşluk temizliği"""
+        self.assertEqual(clean_vin('vf1 ioq 123'), 'VF1100123')
+    
+    def test_format(self):
+        """VIN biçim kontrolü"""
+        self.assertTrue(is_valid_vin_format('VF1RJA00012345678'))
+        self.assertFalse(is_valid_vin_format('VF1RJA0001234567O'))
+        self.assertFalse(is_valid_vin_format('VF1RJA'))
+    
+    def test_check_digit(self):
+        """ISO 3779 kontrol hanesi"""
+        for vin in ['1HGBH41JXMN109186', '1M8GDM9AXKP042788', '11111111111111111']:
+            with self.subTest(vin=vin):
+                self.assertTrue(validate_vin_check_digit(vin))
+        
+        self.assertEqual(compute_check_digit('1M8GDM9AXKP042788'), 'X')
+        self.assertFalse(validate_vin_check_digit('1M8GDM9A1KP042788'))
+        self.assertFalse(validate_vin_check_digit('1M8GDM9AXKP04278'))
+        self.assertFalse(validate_vin_check_digit('1M8GDM9AXKP04278O'))
+
+    
+    def test_candidates_ranked(self):
+        """Kontrol hanesi doğru pencere önce, eski desen adayları da korunmalı"""
+        candidates = list(iter_vin_candidates('vin: XX1M8GDM9AXKP042788 / VF1ABC123DEF456GHI'))
+        
+        self.assertEqual(candidates[0].vin, '1M8GDM9AXKP042788')
+        self.assertTrue(candidates[0].check_digit_valid)
+        self.assertEqual(candidates[0].start, 7)
+        
+        vins = [c.vin for c in candidates]
+        self.assertIn('VF1ABC123DEF456GHI', vins)  # marka deseni
+        self.assertIn('VF1ABC123DEF456GH', vins)  # bilinen WMI ile 17 karakter
+        self.assertIn('XX1M8GDM9AXKP0427', vins)  # genel 17'lik parça
+        self.assertEqual(len(vins), len(set(vins)))
+        self.assertEqual([c.score for c in candidates], sorted((c.score for c in candidates), reverse=True))
+    
+    def test_candidates_short_text(self):
+        """Kısa metinden aday çıkmamalı"""
+        self.assertEqual(extract_vin_candidates('VF1 RJA'), [])
+        self.assertEqual(extract_vin_candidates('ABCD1234'), ['ABCD1234'])
+
+
+if __name__ == '__main__':
+    unittest.main()
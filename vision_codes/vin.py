@@ -0,0 +1,128 @@
+"""
+VIN yardımcıları - temizleme, biçim ve ISO 3779 kontrol hanesi doğrulama
+"""
+import re
+from dataclasses import dataclass
+from typing import Container, Iterator, List
+
+
+# Geçerli VIN biçimi (I, O, Q kullanılmaz)
+VIN_FORMAT = re.compile(r'^[A-HJ-NPR-Z0-9]{11,17}$')
+
+# ISO 3779 harf/rakam değerleri
+VIN_CHAR_VALUES = {
+    **{str(i): i for i in range(10)},
+    **dict(zip("ABCDEFGHJKLMNPRSTUVWXYZ",
+               [1, 2, 3, 4, 5, 6, 7, 8, 1, 2, 3, 4, 5, 7, 9, 2, 3, 4, 5, 6, 7, 8, 9]))
+}
+
+# Konum ağırlıkları (9. konum kontrol hanesidir)
+VIN_WEIGHTS = [8, 7, 6, 5, 4, 3, 2, 10, 0, 9, 8, 7, 6, 5, 4, 3, 2]
+
+# VIN'de kullanılmayan harflerin karşılıkları
+_CLEAN_TABLE = str.maketrans('IOQ', '100')
+
+
+def clean_vin(vin: str) -> str:
+    """VIN temizleme (I→1, O→0, Q→0)"""
+    return vin.upper().translate(_CLEAN_TABLE).replace(' ', '')
+
+
+def is_valid_vin_format(vin: str) -> bool:
+    """VIN format kontrolü"""
+    return bool(VIN_FORMAT.match(vin))
+
+
+def compute_check_digit(vin: str) -> str:
+    """17 karakterlik VIN için beklenen kontrol hanesini hesapla"""
+    total = sum(VIN_CHAR_VALUES[ch] * VIN_WEIGHTS[i] for i, ch in enumerate(vin))
+    remainder = total % 11
+    return 'X' if remainder == 10 else str(remainder)
+
+
+def validate_vin_check_digit(vin: str) -> bool:
+    """VIN check digit doğrulama"""
+    if len(vin) != 17 or not all(ch in VIN_CHAR_VALUES for ch in vin):
+        return False
+    return vin[8] == compute_check_digit(vin)
+
+
+# Aday taraması: harf/rakam dizileri ve VIN alfabesi (I, O, Q hariç)
+_ALNUM_RUN = re.compile(r'[A-Z0-9]{8,}')
+_VIN_RUN = re.compile(r'[A-HJ-NPR-Z0-9]{8,}')
+
+# Varsayılan bilinen WMI'ler (marka desenleri için)
+DEFAULT_WMIS = ('VF1', 'UU1')
+
+# Aday skorları
+SCORE_CHECK_DIGIT = 1.0  # 17 karakter, kontrol hanesi doğru
+SCORE_KNOWN_WMI = 0.8  # 17 karakter, bilinen WMI ile başlıyor
+SCORE_BRAND = 0.5  # bilinen WMI + 10-16 karakter (I/O/Q içerebilir)
+SCORE_GENERIC = 0.3  # VIN alfabesinde 8-17 karakter
+
+
+@dataclass
+class VinCandidate:
+    """Sıralanmış VIN adayı"""
+    vin: str
+    start: int  # metindeki konum
+    score: float
+    check_digit_valid: bool = False
+
+
+def iter_vin_candidates(text: str, known_wmis: Container[str] = DEFAULT_WMIS) -> Iterator[VinCandidate]:
+    """Metinden VIN adaylarını skora göre azalan sırada tembel olarak üret
+
+    Metin tek geçişte harf/rakam dizilerine ayrılır; her dizide kontrol hanesi
+    doğru veya bilinen WMI ile başlayan 17 karakterlik pencereler, marka
+    desenleri (WMI + 10-16 karakter) ve genel 8-17 karakterlik parçalar
+    skorlanır. Aynı aday en yüksek skoruyla bir kez üretilir; eşit skorlarda
+    metindeki sıra korunur.
+    """
+    best = {}
+
+    def add(vin: str, start: int, score: float, check_digit_valid: bool = False):
+        current = best.get(vin)
+        if current is None or score > current.score:
+            best[vin] = VinCandidate(vin, start, score, check_digit_valid)
+
+    upper = text.upper()
+    for run_match in _ALNUM_RUN.finditer(upper):
+        run = run_match.group()
+        offset = run_match.start()
+
+        # Marka desenleri: bilinen WMI + 10-16 karakter, çakışmasız, açgözlü
+        i = 0
+        while i <= len(run) - 13:
+            if run[i:i + 3] in known_wmis:
+                end = min(i + 19, len(run))
+                add(run[i:end], offset + i, SCORE_BRAND)
+                i = end
+            else:
+                i += 1
+
+        for vin_match in _VIN_RUN.finditer(run):
+            segment = vin_match.group()
+            base = offset + vin_match.start()
+
+            # Genel desen: 17'lik açgözlü parçalar, 8'den kısa kalan atılır
+            for i in range(0, len(segment), 17):
+                chunk = segment[i:i + 17]
+                if len(chunk) >= 8:
+                    add(chunk, base + i, SCORE_GENERIC)
+
+            # 17 karakterlik kayan pencereler
+            for i in range(len(segment) - 16):
+                window = segment[i:i + 17]
+                if validate_vin_check_digit(window):
+                    add(window, base + i, SCORE_CHECK_DIGIT + (0.05 if window[:3] in known_wmis else 0.0), True)
+                elif window[:3] in known_wmis:
+                    add(window, base + i, SCORE_KNOWN_WMI)
+
+    # Sıralama tek seferde; aşağı akış ilk güvenilir adayda durabilir
+    yield from sorted(best.values(), key=lambda c: (-c.score, c.start))
+
+
+def extract_vin_candidates(text: str, known_wmis: Container[str] = DEFAULT_WMIS) -> List[str]:
+    """VIN adaylarını sıralı liste olarak döndür"""
+    return [candidate.vin for candidate in iter_vin_candidates(text, known_wmis)]